@@ -0,0 +1,71 @@
+"""
+Benchmark: Bankkonto je Kontoauszugszeile aufloesen
+
+Ein Transaktions-Import sucht fuer jede Zeile das Bankkonto per IBAN.
+Verglichen wird die bisherige Suche (getCheckAccounts() pro Zeile, dann
+lineare Suche) mit dem Konto-Index des BankHelper. Gezaehlt werden
+HTTP-Requests und Dauer.
+
+Aufruf:
+    python benchmarks/account_lookup.py [zeilen] [konten]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk import Client
+from mockserver import MockServer
+
+
+def _iban(i):
+    return f'DE{i:02d} 3704 0044 0532 0130 {i:02d}'
+
+
+def _fixtures(count):
+    return {'CheckAccount': [
+        {'id': str(i), 'objectName': 'CheckAccount', 'name': f'Konto {i}', 'iban': _iban(i),
+         'status': '100', 'defaultAccount': '1' if i == 1 else '0'}
+        for i in range(1, count + 1)
+    ]}
+
+
+def _scan(client, iban):
+    """Bisheriges Verfahren: ein Request pro Suche"""
+    iban_clean = iban.replace(' ', '').upper()
+    for account in client.checkaccount.getCheckAccounts():
+        if account['iban'] and account['iban'].replace(' ', '').upper() == iban_clean:
+            return account
+    return None
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    random.seed(1)
+    statement = [_iban(random.randint(1, count)).lower() for _ in range(lines)]
+
+    with MockServer(latency=0.002, fixtures=_fixtures(count)) as server:
+        print(f"{lines} Zeilen, {count} Konten, 2 ms Latenz\n")
+        for label in ('getCheckAccounts', 'Konto-Index'):
+            client = Client('token', api_base=server.url, response_mode='raw')
+            before = server.counters['requests']
+            start = time.perf_counter()
+            for iban in statement:
+                if label == 'Konto-Index':
+                    account = client.bankHelper.get_account_by_iban(iban)
+                else:
+                    account = _scan(client, iban)
+                assert account is not None
+            elapsed = time.perf_counter() - start
+            requests = server.counters['requests'] - before
+            print(f"  {label:<18} {requests:5d} Requests  {elapsed:7.3f} s  "
+                  f"{elapsed / lines * 1e6:8.1f} us/Zeile")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark: Massen-Download von Rechnungs-PDFs
+
+Vergleicht InvoiceHelper.get_pdf() in einer Schleife mit
+DocumentHelper.download_pdfs() (parallel, mit Manifest). Der zweite Lauf
+von download_pdfs() ueberspringt alle bereits vorhandenen Dokumente.
+
+Aufruf:
+    python benchmarks/bulk_documents.py [rechnungen]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk import Client
+from mockserver import MockServer
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print(f"{count} Rechnungen, 20 ms Latenz\n")
+    with tempfile.TemporaryDirectory() as tmp, MockServer(latency=0.02, total=count) as server:
+        client = Client('token', api_base=server.url)
+        invoices = list(client.invoice.paginate('getInvoices', response_mode='raw'))
+
+        start = time.perf_counter()
+        for invoice in invoices:
+            pdf = client.invoiceHelper.get_pdf(invoice['id'])
+            with open(os.path.join(tmp, f"serial_{invoice['id']}.pdf"), 'wb') as f:
+                f.write(pdf)
+        print(f"  {'seriell':<22} {time.perf_counter() - start:6.2f} s")
+
+        target = os.path.join(tmp, 'archiv')
+        for label in ('download_pdfs (8)', 'download_pdfs erneut'):
+            start = time.perf_counter()
+            result = client.documentHelper.download_pdfs('invoice', invoices, target, concurrency=8)
+            print(f"  {label:<22} {time.perf_counter() - start:6.2f} s  {result}")
+
+
+if __name__ == '__main__':
+    main()
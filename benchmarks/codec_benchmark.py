@@ -0,0 +1,55 @@
+"""
+Benchmark: JSON-Dekodierung grosser Listen-Responses
+
+Vergleicht die verfuegbaren Codecs aus sevdesk.base.codec mit dem
+bisherigen Weg ueber requests (response.json()).
+
+Aufruf:
+    python benchmarks/codec_benchmark.py [anzahl_objekte]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk.base.codec import JsonCodec, OrjsonCodec, MsgspecCodec
+from parse_benchmark import _invoice
+
+
+def _bench(label, fn, repeat=5):
+    fn()  # Warmup
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<30} {elapsed * 1000:8.1f} ms")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    payload = json.dumps({'objects': [_invoice(i) for i in range(n)]}).encode('utf-8')
+
+    response = requests.Response()
+    response._content = payload
+    response.encoding = None
+    response.headers['content-type'] = 'application/json'
+
+    print(f"Dekodierung: {len(payload) / 1024 / 1024:.1f} MB ({n} Rechnungen)\n")
+    _bench("requests response.json()", response.json)
+    for codec_class in (JsonCodec, OrjsonCodec, MsgspecCodec):
+        try:
+            codec = codec_class()
+        except ImportError:
+            print(f"  {codec_class.name:<30} nicht installiert")
+            continue
+        _bench(codec.name, lambda codec=codec: codec.loads(payload))
+
+
+if __name__ == '__main__':
+    main()
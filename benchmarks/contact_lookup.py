@@ -0,0 +1,82 @@
+"""
+Benchmark: Kontakt-Suche per E-Mail
+
+Vergleicht die bisherige Suche (alle Kontakte laden, dann pro Kontakt die
+Kommunikationswege abrufen) mit dem E-Mail-Index des ContactHelper.
+Gezaehlt werden HTTP-Requests und Dauer.
+
+Aufruf:
+    python benchmarks/contact_lookup.py [kontakte] [suchen]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk import Client
+from mockserver import MockServer
+
+
+def _fixtures(count):
+    contacts = [{'id': str(i), 'objectName': 'Contact', 'name': f'Firma {i}'} for i in range(1, count + 1)]
+    ways = [{'id': str(i), 'objectName': 'CommunicationWay', 'type': 'EMAIL',
+             'value': f'Kunde{i}@Example.com', 'contact': {'id': str(i), 'objectName': 'Contact'}}
+            for i in range(1, count + 1)]
+    return {'Contact': contacts, 'CommunicationWay': ways}
+
+
+def _scan(client, email):
+    """Bisheriges Verfahren: N+1 Requests"""
+    for contact in client.contact.getContacts(response_mode='raw'):
+        ways = client.communicationway.getCommunicationWays(
+            contact_id=contact['id'], contact_objectName='Contact', response_mode='raw'
+        )
+        # Der Mock filtert nicht nach Kontakt, daher hier lokal
+        for way in ways:
+            if way['contact']['id'] == contact['id'] and way['value'].lower() == email:
+                return contact
+    return None
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    emails = [f'kunde{random.randint(1, count)}@example.com' for _ in range(lookups)]
+
+    print(f"{count} Kontakte, {lookups} Suchen, 1 ms Latenz\n")
+    with MockServer(latency=0.001, fixtures=_fixtures(count)) as server:
+        client = Client('token', api_base=server.url, response_mode='raw')
+
+        start = time.perf_counter()
+        _scan(client, emails[0])
+        print(f"  {'Scan (1 Suche)':<24} {server.counters['requests']:6d} Requests  {time.perf_counter() - start:6.2f} s")
+
+        before = server.counters['requests']
+        start = time.perf_counter()
+        for email in emails:
+            client.contactHelper.find_by_mail(email)
+        print(f"  {'Index (find_by_mail)':<24} {server.counters['requests'] - before:6d} Requests  "
+              f"{time.perf_counter() - start:6.2f} s")
+
+        before = server.counters['requests']
+        start = time.perf_counter()
+        for email in emails:
+            client.contactHelper.find_by_mail(email)
+        print(f"  {'Index (wiederholt)':<24} {server.counters['requests'] - before:6d} Requests  "
+              f"{time.perf_counter() - start:6.2f} s")
+
+        # Neuer Client: find_by_mails ohne zuvor abgerufene Kontakte
+        client = Client('token', api_base=server.url, response_mode='raw')
+        before = server.counters['requests']
+        start = time.perf_counter()
+        found = client.contactHelper.find_by_mails(emails)
+        print(f"  {'Index (find_by_mails)':<24} {server.counters['requests'] - before:6d} Requests  "
+              f"{time.perf_counter() - start:6.2f} s  ({sum(1 for c in found.values() if c)} gefunden)")
+
+
+if __name__ == '__main__':
+    main()
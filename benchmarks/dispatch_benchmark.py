@@ -0,0 +1,59 @@
+"""
+Micro-Benchmark: Overhead des Controller-Dispatchings
+
+Misst die Zeit pro Aufruf durch BaseController.request und Client.request,
+ohne echte HTTP-Requests (die Session wird durch einen Stub ersetzt).
+
+Aufruf:
+    python benchmarks/dispatch_benchmark.py [anzahl]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sevdesk import Client
+
+
+class _StubResponse:
+    headers = {'content-type': 'application/json'}
+    status_code = 200
+    content = b'{"objects": []}'
+
+    def json(self):
+        return {'objects': []}
+
+
+class _StubSession:
+    def request(self, *args, **kwargs):
+        return _StubResponse()
+
+
+def _bench(label, fn, n):
+    fn()  # Warmup
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<45} {elapsed / n * 1e6:8.2f} us/Aufruf")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    client = Client('token', session=_StubSession())
+
+    print(f"Dispatch-Overhead ({n} Aufrufe)\n")
+    _bench("invoice.getInvoices(status=100)",
+           lambda: client.invoice.getInvoices(status=100), n)
+    _bench("invoice.getInvoicePositionsById(1, limit=10)",
+           lambda: client.invoice.getInvoicePositionsById(1, limit=10), n)
+    _bench("invoice.invoiceResetToDraft(1)",
+           lambda: client.invoice.invoiceResetToDraft(1), n)
+    _bench("Client.request (direkt)",
+           lambda: client.request('get', '/Invoice/{invoiceId}', {'invoiceId': 1}), n)
+
+
+if __name__ == '__main__':
+    main()
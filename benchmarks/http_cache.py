@@ -0,0 +1,62 @@
+"""
+Benchmark: persistenter HTTPCache mit bedingten Requests
+
+Simuliert einen naechtlichen Job, der Kontakte, Artikel und Zahlungskonten
+seitenweise laedt. Der erste Lauf (kalt) fuellt die Datenbank, der zweite
+Lauf (warm, neuer Client wie in einem neuen Prozess) revalidiert nur noch
+per If-None-Match. Verglichen werden uebertragene Bytes und Dauer.
+
+Der warme Lauf spart die Uebertragung, nicht die Round-Trips und nicht die
+JSON-Dekodierung (gespeicherte Bodies werden bei jedem Treffer neu
+dekodiert); bei lokalem Mock-Server mit 2 ms Latenz sind beide Laeufe
+daher etwa gleich schnell.
+
+Aufruf:
+    python benchmarks/http_cache.py [objekte]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk import Client
+from sevdesk.base.httpcache import HTTPCache
+from mockserver import MockServer
+
+
+def _job(client):
+    list(client.contact.pages('getContacts', page_size=100))
+    list(client.part.pages('getParts', page_size=100))
+    client.checkaccount.getCheckAccounts()
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    with tempfile.TemporaryDirectory() as tmp, MockServer(latency=0.002, total=total, etags=True) as server:
+        path = os.path.join(tmp, 'http-cache.db')
+        print(f"{total} Objekte pro Liste, Seiten zu 100, 2 ms Latenz\n")
+        for label in ('ohne Cache', 'kalt', 'warm'):
+            http_cache = HTTPCache(path) if label != 'ohne Cache' else None
+            client = Client('token', api_base=server.url, response_mode='raw', http_cache=http_cache)
+            before = dict(server.counters)
+            start = time.perf_counter()
+            _job(client)
+            elapsed = time.perf_counter() - start
+            requests = server.counters['requests'] - before['requests']
+            transferred = server.counters['bytes'] - before['bytes']
+            not_modified = server.counters['not_modified'] - before['not_modified']
+            print(f"  {label:<12} {requests:4d} Requests  {not_modified:4d} x 304  "
+                  f"{transferred / 1024:8.0f} KiB  {elapsed:6.2f} s")
+            if http_cache is not None:
+                print(f"  {'':<12} {http_cache.stats}")
+                http_cache.close()
+
+
+if __name__ == '__main__':
+    main()
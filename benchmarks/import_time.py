@@ -0,0 +1,112 @@
+"""
+Benchmark: Startzeit (Import und Client-Erzeugung)
+
+Jedes Szenario laeuft in einem frischen Interpreter, gemessen wird nur der
+Code des Szenarios (ohne Start des Interpreters), Ergebnis ist der Median.
+Danach folgt eine Auswertung von "python -X importtime" fuer den Client
+inkl. erstem Controller-Zugriff.
+
+Fuer den Kaltstart (Import, Client-Erzeugung und erster Controller-Zugriff
+in einem frischen Interpreter) gilt ein Zeitbudget, bei Ueberschreitung
+endet das Script mit Exit-Code 1 (z.B. fuer CI).
+
+Aufruf:
+    python benchmarks/import_time.py [wiederholungen]
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# (Bezeichnung, Vorbereitung (nicht gemessen), gemessener Code)
+SCENARIOS = [
+    ("Kaltstart: Client('token')", "", "from sevdesk import Client; Client('token')"),
+    ("Kaltstart: Client('token').invoice", "", "from sevdesk import Client; Client('token').invoice"),
+    ("import sevdesk", "", "import sevdesk"),
+    ("from sevdesk import Client", "", "from sevdesk import Client"),
+    ("Client()", "from sevdesk import Client", "Client('token')"),
+    ("client.invoice (erster Zugriff)",
+     "from sevdesk import Client; client = Client('token')", "client.invoice"),
+    ("client.invoiceHelper (erster Zugriff)",
+     "from sevdesk import Client; client = Client('token')", "client.invoiceHelper"),
+    ("import requests (Referenz)", "", "import requests"),
+    ("import pydantic (Referenz)", "", "import pydantic"),
+]
+
+# Budget in ms je Szenario; requests allein braucht hier rund 80 ms
+BUDGETS = {
+    "Kaltstart: Client('token')": 150.0,
+    "Kaltstart: Client('token').invoice": 300.0,
+}
+
+_TIMER = """
+import time
+{setup}
+_start = time.perf_counter()
+{code}
+print(time.perf_counter() - _start)
+"""
+
+
+def _run(code, *args):
+    return subprocess.run(
+        [sys.executable, *args, '-c', code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def _measure(setup, code, repeat):
+    timings = [
+        float(_run(_TIMER.format(setup=setup, code=code)).stdout)
+        for _ in range(repeat)
+    ]
+    return statistics.median(timings) * 1000
+
+
+def _importtime(code):
+    """Parst die Ausgabe von -X importtime: [(eigen_us, kumuliert_us, modul)]"""
+    result = []
+    for line in _run(code, '-X', 'importtime').stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        result.append((int(own), int(cumulative), name.strip()))
+    return result
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+
+    print(f"Startzeit (Median aus {repeat} Interpretern)\n")
+    over_budget = []
+    for label, setup, code in SCENARIOS:
+        elapsed = _measure(setup, code, repeat)
+        budget = BUDGETS.get(label)
+        note = ""
+        if budget is not None:
+            note = f"(Budget {budget:.0f} ms)"
+            if elapsed > budget:
+                note += " UEBERSCHRITTEN"
+                over_budget.append(label)
+        print(f"  {label:<40} {elapsed:8.1f} ms  {note}")
+
+    modules = _importtime("from sevdesk import Client; Client('token').invoice")
+    print("\n-X importtime: sevdesk-Module (kumuliert)\n")
+    for own, cumulative, name in sorted(modules, key=lambda m: -m[1]):
+        if name.startswith('sevdesk'):
+            print(f"  {name:<55} {cumulative / 1000:8.1f} ms  (eigen {own / 1000:.1f} ms)")
+
+    print("\n-X importtime: teuerste Module (eigene Zeit)\n")
+    for own, cumulative, name in sorted(modules, key=lambda m: -m[0])[:15]:
+        print(f"  {name:<55} {own / 1000:8.1f} ms")
+
+    if over_budget:
+        print(f"\nBudget ueberschritten: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+"""
+Lokaler Mock-Server fuer Benchmarks und Lasttests
+
+Beantwortet beliebige Pfade im Stil der sevDesk API:
+    GET  /Resource           Liste, beachtet limit/offset (und countAll -> total)
+    GET  /Resource/{id}      Liste mit genau einem Objekt mit dieser ID
+                             (fixtures: feste Objekte pro Ressource, Listen
+                             gefiltert nach Feldern wie type=..., contact[id]=...,
+                             sortierbar mit orderBy[0][field]/[arrangement])
+    GET  .../getPdf          PDF-Bytes
+    GET  .../*Zip            ZIP-Export mit export_size Bytes (blockweise gesendet)
+    POST/PUT/DELETE          Request-Body wird als 'objects' zurueckgegeben
+
+HTTP/1.1 mit Keep-Alive; gezaehlt werden Requests und TCP-Verbindungen,
+ausserdem wird der Zeitpunkt jedes Requests festgehalten. Mit outage()
+antwortet der Server fuer eine Zeitspanne mit einem Fehlerstatus.
+
+Mit etags=True erhalten GET-Responses einen ETag; passt If-None-Match,
+antwortet der Server mit 304 ohne Body. Uebertragene Body-Bytes werden
+in counters['bytes'] gezaehlt.
+
+Beispiel:
+    with MockServer(latency=0.01) as server:
+        client = Client('token', api_base=server.url)
+"""
+
+import hashlib
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+
+def _object(object_id, object_name):
+    return {
+        'id': str(object_id),
+        'objectName': object_name,
+        'status': '200',
+        'sumGross': '119.0',
+        'update': '2025-01-01T00:00:00+01:00',
+        'contact': {'id': '7', 'objectName': 'Contact'},
+    }
+
+
+# Query-Parameter, die keine Filter sind
+_CONTROL_PARAMS = ('limit', 'offset', 'countAll', 'depth', 'embed')
+
+
+def _matches(item, query):
+    """Filtert Fixtures nach Query-Parametern im Stil der API (type=EMAIL, contact[id]=7)"""
+    for key, values in query.items():
+        if key in _CONTROL_PARAMS or key.startswith('orderBy'):
+            continue
+        value = item
+        for part in key.replace(']', '').split('['):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value is not None and str(value) != values[0]:
+            return False
+    return True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Header und Body werden getrennt geschrieben, ohne TCP_NODELAY
+    # verzoegert Nagle + Delayed ACK jede Response um ~40 ms
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.mock.count('connections')
+
+    def _send(self, body: bytes, content_type='application/json', status=200):
+        mock = self.server.mock
+        etag = None
+        if mock.etags and self.command == 'GET':
+            etag = '"%s"' % hashlib.sha1(body).hexdigest()
+            if self.headers.get('If-None-Match') == etag:
+                mock.count('not_modified')
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        mock.count('bytes', len(body))
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_export(self, size: int):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/zip')
+        self.send_header('Content-Length', str(size))
+        self.end_headers()
+        block = b'PK' + bytes(64 * 1024 - 2)
+        remaining = size
+        while remaining > 0:
+            self.wfile.write(block[:remaining])
+            remaining -= len(block)
+        self.server.mock.count('bytes', size)
+
+    def _failure(self):
+        """Sendet waehrend eines simulierten Ausfalls die Fehler-Response"""
+        failure = self.server.mock.current_failure()
+        if failure is None:
+            return False
+        status, retry_after = failure
+        body = b'<html>Service Unavailable</html>'
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        if retry_after is not None:
+            self.send_header('Retry-After', str(retry_after))
+        self.end_headers()
+        self.wfile.write(body)
+        return True
+
+    def do_GET(self):
+        mock = self.server.mock
+        mock.count('requests')
+        if mock.latency:
+            time.sleep(mock.latency)
+        if self._failure():
+            return
+
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path.endswith('getPdf'):
+            return self._send(b'%PDF-1.4 mock', 'application/pdf')
+        if url.path.endswith('Zip'):
+            return self._send_export(mock.export_size)
+
+        parts = url.path.rstrip('/').split('/')
+        fixture = mock.fixtures.get(parts[-2] if parts[-1].isdigit() else parts[-1])
+        if parts[-1].isdigit():
+            if fixture is not None:
+                objects = [item for item in fixture if str(item.get('id')) == parts[-1]]
+            else:
+                objects = [_object(parts[-1], parts[-2])]
+            total = len(objects)
+        else:
+            offset = int(query.get('offset', ['0'])[0])
+            limit = int(query.get('limit', ['1000'])[0])
+            if fixture is not None:
+                fixture = [item for item in fixture if _matches(item, query)]
+                total = len(fixture)
+                field = query.get('orderBy[0][field]', [None])[0]
+                if field is not None:
+                    descending = query.get('orderBy[0][arrangement]', ['asc'])[0] == 'desc'
+                    fixture = sorted(fixture, key=lambda item: item.get(field) or '', reverse=descending)
+                objects = fixture[offset:offset + limit]
+            else:
+                total = mock.total
+                objects = [_object(i, parts[-1]) for i in range(offset, min(offset + limit, total))]
+
+        data = {'objects': objects}
+        if 'countAll' in query:
+            data['total'] = total
+        self._send(json.dumps(data).encode('utf-8'))
+
+    def do_POST(self):
+        mock = self.server.mock
+        mock.count('requests')
+        if mock.latency:
+            time.sleep(mock.latency)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        if self._failure():
+            return
+        self._send(json.dumps({'objects': body}).encode('utf-8'))
+
+    do_PUT = do_POST
+    do_DELETE = do_POST
+
+
+class MockServer:
+    """
+    Args:
+        latency: Kuenstliche Antwortzeit pro Request in Sekunden
+        total: Anzahl der Objekte in Listen-Responses
+        etags: ETag senden und If-None-Match mit 304 beantworten
+        export_size: Groesse der ZIP-Exporte in Bytes
+        fixtures: Ressource (z.B. 'CommunicationWay') -> Liste fester Objekte
+                  statt generierter Objekte
+    """
+
+    def __init__(self, latency: float = 0.0, total: int = 250, etags: bool = False,
+                 export_size: int = 1024 * 1024, fixtures: dict = None):
+        self.latency = latency
+        self.fixtures = fixtures or {}
+        self.total = total
+        self.etags = etags
+        self.export_size = export_size
+        self.counters = {'requests': 0, 'connections': 0, 'not_modified': 0, 'bytes': 0}
+        self.timestamps = []
+        self._outage = None
+        self._lock = threading.Lock()
+        self._server = None
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+            if name == 'requests':
+                self.timestamps.append(time.monotonic())
+
+    def outage(self, seconds: float, status: int = 503, retry_after=None):
+        """Beantwortet alle Requests der naechsten 'seconds' Sekunden mit 'status'"""
+        self._outage = (time.monotonic() + seconds, status, retry_after)
+
+    def current_failure(self):
+        outage = self._outage
+        if outage is None or time.monotonic() >= outage[0]:
+            return None
+        return outage[1], outage[2]
+
+    def max_in_window(self, window: float = 1.0) -> int:
+        """Hoechste Anzahl Requests innerhalb eines beliebigen Zeitfensters"""
+        timestamps = sorted(self.timestamps)
+        best = start = 0
+        for end, timestamp in enumerate(timestamps):
+            while timestamp - timestamps[start] >= window:
+                start += 1
+            best = max(best, end - start + 1)
+        return best
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def start(self):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.mock = self
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,71 @@
+"""
+Benchmark: Erzeugung von Response-Models aus grossen Listen-Responses
+
+Vergleicht model_class(**item) pro Objekt mit den response_modes von
+BaseController.parse_response.
+
+Aufruf:
+    python benchmarks/parse_benchmark.py [anzahl_objekte]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sevdesk.base.baseclient import BaseClient
+from sevdesk.base.basecontroller import BaseController
+from sevdesk.models.invoiceresponse import InvoiceResponse
+
+
+def _invoice(i):
+    return {
+        'id': str(i), 'objectName': 'Invoice', 'invoiceNumber': f'RE-{i}',
+        'contact': {'id': '12', 'objectName': 'Contact'},
+        'create': '2025-01-01T10:00:00+01:00', 'update': '2025-01-02T10:00:00+01:00',
+        'sevClient': {'id': '1', 'objectName': 'SevClient'},
+        'invoiceDate': '2025-01-01T00:00:00+01:00', 'header': f'Rechnung RE-{i}',
+        'status': '200', 'sumNet': '100.00', 'sumTax': '19.00', 'sumGross': '119.00',
+        'addressCountry': {'id': '1', 'objectName': 'StaticCountry'},
+        'contactPerson': {'id': '3', 'objectName': 'SevUser'},
+        'taxRule': {'id': '1', 'objectName': 'TaxRule'},
+        'currency': 'EUR', 'showNet': '1', 'sendType': 'VPR',
+    }
+
+
+def _bench(label, fn):
+    fn()  # Warmup
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    # Speicher separat messen, tracemalloc verfaelscht die Laufzeit
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<35} {elapsed * 1000:8.1f} ms  Peak {peak / 1024 / 1024:6.1f} MB")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    response = {'objects': [_invoice(i) for i in range(n)]}
+    return_type = list[InvoiceResponse]
+
+    print(f"parse_response: {n} InvoiceResponse-Objekte\n")
+    _bench("InvoiceResponse(**item)",
+           lambda: [InvoiceResponse(**item) for item in response['objects']])
+    for mode in BaseClient.RESPONSE_MODES:
+        _bench(f"mode='{mode}'",
+               lambda mode=mode: BaseController.parse_response(response, return_type, mode))
+
+    def lazy_read():
+        for invoice in BaseController.parse_response(response, return_type, 'lazy'):
+            invoice.id_, invoice.status, invoice.sumGross, invoice.update
+
+    _bench("mode='lazy' + 4 Felder lesen", lazy_read)
+
+
+if __name__ == '__main__':
+    main()
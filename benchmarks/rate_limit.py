@@ -0,0 +1,95 @@
+"""
+Benchmark: Rate-Limiter unter Last
+
+Mehrere Threads (und fuer File-/SQLite-Backend mehrere Prozesse) senden so
+schnell wie moeglich Requests an einen lokalen Mock-Server. Erwartet wird,
+dass die erreichte Rate dem Limit entspricht und in keinem 1-Sekunden-
+Fenster mehr als rate + burst Requests ankommen. Gemessen wird beim Server:
+kommt ein Request wegen Scheduling-Verzoegerung nach seinem Slot an, kann er
+in das naechste Fenster rutschen. Toleriert werden daher bis zu 20 ms
+Verzoegerung (rate * 0.02 + 1 Requests).
+
+Aufruf:
+    python benchmarks/rate_limit.py [rate] [sekunden]
+"""
+
+import math
+import multiprocessing
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk import Client
+from sevdesk.base.ratelimit import RateLimiter, MemoryBackend, FileBackend, SQLiteBackend
+from mockserver import MockServer
+
+THREADS = 8
+PROCESSES = 4
+BURST = 5
+
+
+def _run_threads(url, limiter, duration):
+    client = Client('token', api_base=url, rate_limit=limiter)
+    deadline = time.monotonic() + duration
+
+    def work(_):
+        while time.monotonic() < deadline:
+            client.invoice.getInvoiceById(invoiceId=1, response_mode='raw')
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        list(pool.map(work, range(THREADS)))
+
+
+def _process(url, backend_factory, rate, duration):
+    _run_threads(url, RateLimiter(rate, BURST, backend_factory()), duration)
+
+
+def _scenario(label, rate, duration, backend_factory, processes=1):
+    with MockServer() as server:
+        start = time.monotonic()
+        if processes == 1:
+            _run_threads(server.url, RateLimiter(rate, BURST, backend_factory()), duration)
+        else:
+            workers = [
+                multiprocessing.Process(target=_process, args=(server.url, backend_factory, rate, duration))
+                for _ in range(processes)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        elapsed = time.monotonic() - start
+        achieved = server.counters['requests'] / elapsed
+        peak = server.max_in_window(1.0)
+
+    allowed = rate + BURST
+    ok = peak <= allowed + math.ceil(rate * 0.02) + 1
+    print(f"  {label:<32} {achieved:7.1f} req/s   max/1s {peak:4d} (erlaubt {allowed:.0f})"
+          f"  {'ok' if ok else 'UEBERSCHRITTEN'}")
+    return ok
+
+
+def main():
+    rate = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    tmp = Path(tempfile.mkdtemp())
+    print(f"Rate {rate:.0f}/s, Burst {BURST}, {duration:.0f} s\n")
+    results = [
+        _scenario(f"Memory, {THREADS} Threads", rate, duration, MemoryBackend),
+        _scenario(f"File, {PROCESSES}x{THREADS} Threads", rate, duration,
+                  lambda: FileBackend(str(tmp / 'rate.bucket')), PROCESSES),
+        _scenario(f"SQLite, {PROCESSES}x{THREADS} Threads", rate, duration,
+                  lambda: SQLiteBackend(str(tmp / 'rate.db')), PROCESSES),
+    ]
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark: ResponseCache fuer Referenzdaten
+
+Simuliert einen Job, der pro Datensatz Referenzdaten nachschlaegt
+(Zahlungskonten, Tags, SevUser) und dazwischen normale Requests sendet.
+Verglichen werden Dauer und HTTP-Requests mit und ohne Cache.
+
+Aufruf:
+    python benchmarks/response_cache.py [datensaetze]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk import Client
+from sevdesk.base.cache import ResponseCache
+from mockserver import MockServer
+
+
+def _job(client, records):
+    for i in range(records):
+        client.checkaccount.getCheckAccounts()
+        client.tag.getTags()
+        client.undocumented.sevuser.getSevUsers(limit=1)
+        client.invoice.getInvoiceById(invoiceId=i)
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print(f"{records} Datensaetze, 4 Requests pro Datensatz, 5 ms Latenz\n")
+    for cache in (None, ResponseCache()):
+        with MockServer(latency=0.005, total=50) as server:
+            client = Client('token', api_base=server.url, cache=cache)
+            start = time.perf_counter()
+            _job(client, records)
+            elapsed = time.perf_counter() - start
+        label = 'mit Cache' if cache else 'ohne Cache'
+        print(f"  {label:<12} {server.counters['requests']:5d} HTTP-Requests  {elapsed:6.2f} s")
+        if cache:
+            print(f"  {cache.stats}")
+
+
+if __name__ == '__main__':
+    main()
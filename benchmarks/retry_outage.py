@@ -0,0 +1,73 @@
+"""
+Lasttest: Batch-Job waehrend eines kurzen API-Ausfalls
+
+Der Mock-Server antwortet fuer einige Sekunden mit 503 (HTML-Seite, wie ein
+Load-Balancer). Mehrere Threads arbeiten waehrenddessen eine feste Anzahl
+Requests ab. Mit RetryPolicy muessen alle Requests erfolgreich sein; die
+Hooks zaehlen Wiederholungen und Abbrueche.
+
+Aufruf:
+    python benchmarks/retry_outage.py [ausfall_sekunden] [requests]
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk import Client
+from sevdesk.base.exceptions import HTTPError
+from sevdesk.base.retry import RetryPolicy, RetryBudget
+from mockserver import MockServer
+
+
+def main():
+    outage = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+
+    events = Counter()
+    lock = threading.Lock()
+
+    def record(name):
+        def hook(event):
+            with lock:
+                events[f'{name}:{event.reason}'] += 1
+        return hook
+
+    policy = RetryPolicy(max_retries=8, backoff=0.2, max_backoff=2.0,
+                         budget=RetryBudget(ratio=0.5, min_retries=500),
+                         on_retry=record('retry'), on_giveup=record('giveup'))
+
+    with MockServer(latency=0.005) as server:
+        client = Client('token', api_base=server.url, retry=policy)
+        server.outage(outage, status=503, retry_after=None)
+
+        def work(i):
+            try:
+                return len(client.invoice.getInvoiceById(invoiceId=i)) == 1
+            except HTTPError:
+                return False
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(work, range(count)))
+        elapsed = time.perf_counter() - start
+
+    print(f"{count} Requests, Ausfall {outage:.1f} s, Dauer {elapsed:.2f} s\n")
+    print(f"  Erfolgreich       {sum(results)}")
+    print(f"  Fehlgeschlagen    {results.count(False)}")
+    print(f"  HTTP-Requests     {server.counters['requests']}")
+    for name, value in sorted(events.items()):
+        print(f"  {name:<17} {value}")
+
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: Zusammenfassen gleichzeitiger identischer GET-Requests
+
+Viele Threads rufen gleichzeitig dieselben Referenzdaten ab (wie z.B.
+getCheckAccounts() oder getSevUsers(limit=1) in den Helpern). Verglichen
+werden HTTP-Requests und Dauer mit und ohne Single-Flight.
+
+Aufruf:
+    python benchmarks/single_flight.py [threads] [runden]
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk import Client
+from sevdesk.base.transport import Transport
+from mockserver import MockServer
+
+
+def _run(coalesce, threads, rounds):
+    with MockServer(latency=0.05) as server:
+        client = Client('token', api_base=server.url, coalesce=coalesce,
+                        transport=Transport(pool_maxsize=threads))
+        barrier = threading.Barrier(threads)
+
+        def work(_):
+            for _ in range(rounds):
+                barrier.wait()
+                accounts = client.checkaccount.getCheckAccounts()
+                contact = client.contact.getContactById(contactId=7)
+                assert accounts and str(contact[0].id_) == '7'
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(work, range(threads)))
+        elapsed = time.perf_counter() - start
+    return server.counters['requests'], elapsed
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print(f"{threads} Threads x {rounds} Runden x 2 Aufrufe\n")
+    for coalesce in (False, True):
+        requests_sent, elapsed = _run(coalesce, threads, rounds)
+        print(f"  coalesce={coalesce!s:<6} {requests_sent:5d} HTTP-Requests  {elapsed:6.2f} s")
+
+
+if __name__ == '__main__':
+    main()
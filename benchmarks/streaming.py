@@ -0,0 +1,56 @@
+"""
+Benchmark: Speicherbedarf von ZIP-Exporten mit und ohne Streaming
+
+Laedt einen Export (exportInvoiceZip) einmal komplett in den Speicher und
+einmal mit stream_to= blockweise in eine Datei. Gemessen wird der
+Spitzenwert des Python-Speichers (tracemalloc).
+
+Aufruf:
+    python benchmarks/streaming.py [megabytes]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk import Client
+from mockserver import MockServer
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    size = megabytes * 1024 * 1024
+    query = {'filter': 'month'}
+
+    print(f"ZIP-Export mit {megabytes} MB\n")
+    with tempfile.TemporaryDirectory() as tmp, MockServer(export_size=size) as server:
+        client = Client('token', api_base=server.url)
+        target = os.path.join(tmp, 'export.zip')
+
+        content, peak, elapsed = _measure(lambda: client.export.exportInvoiceZip(query))
+        print(f"  {'gepuffert':<12} {len(content) / 2**20:6.0f} MB  Spitze {peak / 2**20:7.1f} MB  {elapsed:5.2f} s")
+        del content
+
+        written, peak, elapsed = _measure(lambda: client.export.exportInvoiceZip(query, stream_to=target))
+        print(f"  {'stream_to':<12} {written / 2**20:6.0f} MB  Spitze {peak / 2**20:7.1f} MB  {elapsed:5.2f} s")
+        assert os.path.getsize(target) == size
+
+
+if __name__ == '__main__':
+    main()
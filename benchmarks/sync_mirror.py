@@ -0,0 +1,100 @@
+"""
+Benchmark: lokale Kopie (sevdesk.sync.Mirror) statt wiederholter API-Abrufe
+
+Ein Reporting-Job braucht Rechnungen, Belege, Kontakte, Artikel und
+Transaktionen. Verglichen werden:
+  - API: alle Listen bei jedem Lauf neu laden
+  - Mirror, erster Lauf: alles laden und speichern
+  - Mirror, Folgelauf: nur die seit dem letzten Lauf geaenderten Objekte
+  - Abfrage auf der lokalen Kopie (offene Rechnungen eines Kunden)
+
+Aufruf:
+    python benchmarks/sync_mirror.py [objekte pro entitaet] [geaenderte]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk import Client
+from sevdesk.sync import Mirror, ENTITIES
+from mockserver import MockServer
+
+RESOURCES = {
+    'invoice': 'Invoice', 'voucher': 'Voucher', 'contact': 'Contact',
+    'part': 'Part', 'transaction': 'CheckAccountTransaction',
+}
+
+
+def _update(i):
+    return time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime(1735689600 + i * 60))
+
+
+def _fixtures(count):
+    fixtures = {}
+    for name, resource in RESOURCES.items():
+        fixtures[resource] = [
+            {'id': str(i), 'objectName': resource, 'update': _update(i), 'status': str(random.choice((200, 1000))),
+             'sumGross': f'{i % 500}.00', 'amount': f'{i % 300 - 150}.00', 'name': f'{resource} {i}',
+             'invoiceDate': '2025-03-01T00:00:00+01:00', 'contact': {'id': str(i % 50), 'objectName': 'Contact'}}
+            for i in range(1, count + 1)
+        ]
+    return fixtures
+
+
+def _measure(server, label, job):
+    before = server.counters['requests']
+    start = time.perf_counter()
+    result = job()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {server.counters['requests'] - before:5d} Requests  {elapsed * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    changed = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    random.seed(1)
+    fixtures = _fixtures(count)
+
+    with tempfile.TemporaryDirectory() as tmp, MockServer(latency=0.005, fixtures=fixtures) as server:
+        print(f"{len(RESOURCES)} Entitaeten zu {count} Objekten, Seiten zu 500, 5 ms Latenz\n")
+        client = Client('token', api_base=server.url, response_mode='raw')
+
+        def api_job():
+            for entity in ENTITIES.values():
+                list(getattr(client, entity.controller).paginate(
+                    entity.operation, page_size=500, **entity.params))
+
+        _measure(server, 'API, alles laden', api_job)
+
+        mirror = Mirror(client, os.path.join(tmp, 'mirror.db'))
+        stats = _measure(server, 'Mirror, erster Lauf', mirror.sync)
+        assert all(s.changed == count for s in stats.values()), stats
+
+        # Einige Objekte in sevDesk aendern
+        for objects in fixtures.values():
+            for item in random.sample(objects, changed):
+                item['update'] = _update(count + 1000 + random.randint(0, 100))
+                item['status'] = '1000'
+        stats = _measure(server, f'Mirror, Folgelauf ({changed} neu)', mirror.sync)
+        assert all(s.changed == changed and not s.full for s in stats.values()), stats
+
+        _measure(server, 'Mirror, Folgelauf (keine)', mirror.sync)
+        stats = _measure(server, 'Mirror, sync(full=True)', lambda: mirror.sync(full=True))
+        assert all(s.changed == 0 for s in stats.values()), stats
+
+        rows = _measure(server, 'Abfrage lokal', lambda: mirror.find(
+            'invoice', contact_id=7, status=200, order_by='-invoiceDate'))
+        print(f"\n  {len(rows)} offene Rechnungen fuer Kontakt 7")
+        mirror.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Lasttest: ein Client, viele Threads
+
+Startet einen lokalen Mock-Server und verwendet einen einzigen Client aus
+einem ThreadPoolExecutor. Geprueft wird:
+- Lazy-Loading: alle Threads erhalten dieselbe Controller-/Helper-Instanz
+- Jede Response gehoert zum eigenen Request (ID bzw. Body-Echo)
+- Keine Fehler, Verbindungen werden wiederverwendet (<= pool_maxsize)
+
+Aufruf:
+    python benchmarks/thread_stress.py [worker] [requests_pro_worker]
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sevdesk import Client
+from sevdesk.base.transport import Transport
+from mockserver import MockServer
+
+
+def _check_lazy_loading(url, workers):
+    """Alle Threads greifen gleichzeitig auf noch nicht geladene Attribute zu"""
+    client = Client('token', api_base=url)
+    barrier = threading.Barrier(workers)
+
+    def access(_):
+        barrier.wait()
+        return (id(client.invoice), id(client.undocumented.sevuser), id(client.invoiceHelper))
+
+    with ThreadPoolExecutor(workers) as pool:
+        results = set(pool.map(access, range(workers)))
+    return len(results) == 1
+
+
+def _worker(client, worker_id, count):
+    errors = []
+    for i in range(count):
+        object_id = worker_id * 100000 + i
+        if i % 3 == 2:
+            # POST: Body wird vom Server zurueckgegeben
+            marker = f'{worker_id}-{i}'
+            result = client.request('POST', '/Echo', {'body': {'marker': marker}})
+            if result['objects']['marker'] != marker:
+                errors.append(f'POST {marker}: {result}')
+        else:
+            invoices = client.invoice.getInvoiceById(invoiceId=object_id)
+            if len(invoices) != 1 or str(invoices[0].id_) != str(object_id):
+                errors.append(f'GET {object_id}: {[invoice.id_ for invoice in invoices]}')
+    return errors
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    with MockServer(latency=0.001) as server:
+        lazy_ok = _check_lazy_loading(server.url, workers)
+        server.counters['connections'] = 0
+
+        client = Client('token', api_base=server.url,
+                        transport=Transport(pool_maxsize=workers, pool_block=True))
+        start = time.perf_counter()
+        with ThreadPoolExecutor(workers) as pool:
+            futures = [pool.submit(_worker, client, w, count) for w in range(workers)]
+            errors = [error for future in futures for error in future.result()]
+        elapsed = time.perf_counter() - start
+
+        total = workers * count
+        print(f"{workers} Threads, {total} Requests in {elapsed:.2f} s ({total / elapsed:.0f} req/s)\n")
+        print(f"  Lazy-Loading eindeutig      {'ok' if lazy_ok else 'FEHLER'}")
+        print(f"  Falsche/fehlende Responses  {len(errors)}")
+        print(f"  TCP-Verbindungen            {server.counters['connections']} (pool_maxsize {workers})")
+        for error in errors[:10]:
+            print(f"    {error}")
+
+        if not lazy_ok or errors or server.counters['connections'] > workers:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,7 @@ Generiert Python Models und Controllers aus der OpenAPI-Spezifikation.
 Unterstuetzt Patches für Korrekturen an der offiziellen Spec.
 """
 
+import re
 import yaml
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
@@ -14,6 +15,8 @@ PATCHES_FILE = Path("generator/patches.yaml")
 MODELS_DIR = Path("sevdesk/models")
 CONVERTERS_DIR = Path("sevdesk/converters")
 CONTROLLERS_DIR = Path("sevdesk/controllers")
+UNDOCUMENTED_CONTROLLERS_DIR = Path("sevdesk/undocumented/controllers")
+REGISTRY_FILE = Path("sevdesk/registry.py")
 
 # Python reservierte Woerter
 PYTHON_KEYWORDS = {
@@ -96,7 +99,10 @@ def sanitize_description(desc: str) -> str:
 
 
 def sanitize_param_name(name: str) -> str:
-    """Macht aus 'customFieldSetting[id]' -> 'customFieldSetting_id'"""
+    """
+    Macht aus 'customFieldSetting[id]' -> 'customFieldSetting_id'
+    (Umkehrung beim Senden: sevdesk.base.basecontroller.api_param_name)
+    """
     sanitized = name.replace("[", "_").replace("]", "")
     return sanitize_field_name(sanitized)
 
@@ -397,6 +403,37 @@ def generate_controllers(openapi_spec: dict, env: Environment):
         print(f"  Controller: {ctrl_path}")
 
 
+def scan_controllers(controllers_dir: Path, module_path: str) -> list:
+    """
+    Ermittelt (Attributname, Modul, Klasse) aller Controller in einem Verzeichnis.
+
+    Die Klasse ist die erste im Modul definierte Klasse, deren Name auf
+    "Controller" endet (z.B. "contact_controller.py" -> "contact").
+    """
+    controllers = []
+    for controller_file in sorted(controllers_dir.glob("*_controller.py")):
+        match = re.search(r"^class (\w+Controller)\b", controller_file.read_text(), re.MULTILINE)
+        if not match:
+            print(f"  Warnung: Keine Controller-Klasse in {controller_file}")
+            continue
+        name = controller_file.stem.replace("_controller", "")
+        controllers.append((name, f"{module_path}.{controller_file.stem}", match.group(1)))
+    return controllers
+
+
+def generate_registry(env: Environment):
+    """Schreibt die statische Controller-Registry fuer das Lazy-Loading im Client"""
+    print("\nGeneriere Registry...")
+
+    registry_template = env.get_template("registry_template.jinja")
+    content = registry_template.render(
+        controllers=scan_controllers(CONTROLLERS_DIR, "sevdesk.controllers"),
+        undocumented=scan_controllers(UNDOCUMENTED_CONTROLLERS_DIR, "sevdesk.undocumented.controllers"),
+    )
+    REGISTRY_FILE.write_text(content)
+    print(f"  Registry: {REGISTRY_FILE}")
+
+
 def main():
     print("sevDesk API Code Generator")
     print("=" * 40)
@@ -420,6 +457,8 @@ def main():
     # Generierung
     generate_models(openapi_spec, env, patches)
     generate_controllers(openapi_spec, env)
+    # Nach den Controllern, damit neue Controller enthalten sind
+    generate_registry(env)
 
     print("\nFertig!")
 
@@ -1,3 +1,15 @@
 VERSION = "0.2.3"
 
-from sevdesk.client import Client
+# Client und AsyncClient werden erst beim ersten Zugriff importiert, damit
+# "import sevdesk" weder requests/httpx noch pydantic laedt
+__all__ = ['Client', 'AsyncClient', 'VERSION']
+
+
+def __getattr__(name):
+    if name == 'Client':
+        from sevdesk.client import Client
+        return Client
+    if name == 'AsyncClient':
+        from sevdesk.async_client import AsyncClient
+        return AsyncClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,182 @@
+"""
+AsyncClient - asyncio-Client fuer die sevDesk API
+
+Verwendet dieselben generierten Controller wie der synchrone Client,
+jeder Controller-Aufruf liefert hier aber ein Awaitable.
+
+Beispiel:
+    async with AsyncClient('api-token') as sevdesk:
+        invoices, contacts = await asyncio.gather(
+            sevdesk.invoice.getInvoices(status=200),
+            sevdesk.contact.getContacts(),
+        )
+
+Benoetigt das optionale Paket httpx (pip install sevdesk[async]).
+"""
+
+import asyncio
+import time
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+# Verbindungsfehler und Timeouts, die wiederholt werden koennen
+_TRANSPORT_ERRORS = (httpx.TransportError,) if httpx is not None else ()
+
+from sevdesk.base.baseclient import BaseClient
+from sevdesk.base.download import CHUNK_SIZE, DownloadTarget
+from sevdesk.base.exceptions import HTTPError
+from sevdesk.base.retry import RetryPolicy
+from sevdesk.base.singleflight import AsyncSingleFlight
+from sevdesk.base.transport import Transport
+
+
+class AsyncClient(BaseClient):
+    """Asynchroner Client auf Basis von httpx.AsyncClient"""
+
+    is_async = True
+
+    def __init__(self, api_token, api_base='https://my.sevdesk.de/api/v1', session=None,
+                 max_connections: int = 100, response_mode='validate', codec=None,
+                 transport: Transport = None, rate_limit=None, retry: RetryPolicy = None,
+                 coalesce: bool = True, cache=None, http_cache=None):
+        # Ohne transport: Pool-Groesse aus max_connections
+        self.transport = transport or Transport(pool_maxsize=max_connections)
+        if session is None:
+            if httpx is None:
+                raise ImportError(
+                    "AsyncClient benoetigt httpx. Installation: pip install sevdesk[async]"
+                )
+            session = self._create_session(self.transport)
+        self.session = session
+        # Timeouts gelten auch fuer eine uebergebene session
+        self._timeout = self._httpx_timeout(self.transport) if httpx is not None else None
+        # Gleichzeitige identische GETs teilen sich einen Request
+        self._single_flight = AsyncSingleFlight() if coalesce else None
+
+        super().__init__(api_token, api_base, response_mode, codec, rate_limit, retry, cache, http_cache)
+
+    @staticmethod
+    def _create_session(transport: Transport):
+        return httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=transport.pool_maxsize,
+                    max_keepalive_connections=transport.pool_maxsize
+                ),
+                socket_options=transport.socket_options()
+            ),
+            timeout=AsyncClient._httpx_timeout(transport)
+        )
+
+    @staticmethod
+    def _httpx_timeout(transport: Transport):
+        # httpx wartet bei vollem Pool immer auf eine freie Verbindung
+        return httpx.Timeout(
+            connect=transport.connect_timeout,
+            read=transport.read_timeout,
+            write=transport.read_timeout,
+            pool=None
+        )
+
+    async def request(self, method, path, params, endpoint=None):
+        request_url, request_params, request_body = self._build_request(path, params, endpoint)
+        cache_key, cached, generation = self._cache_lookup(
+            endpoint, method, params, request_url, request_params
+        )
+        if cached is not None:
+            return self._decode_response(*cached)
+
+        async def send():
+            http_cache_key, stored, headers = self._revalidation(method, request_url, request_params)
+            response = await self._send(method, request_url, request_params, request_body, headers)
+            result = self._result(http_cache_key, stored, response)
+            self._cache_store(cache_key, generation, result)
+            return result
+
+        key = self._flight_key(method, request_url, request_params) if self._single_flight else None
+        if key is not None:
+            result = await self._single_flight.do(key, send)
+        else:
+            try:
+                result = await send()
+            finally:
+                # Auch bei Fehlern, die Aenderung kann trotzdem ausgefuehrt worden sein
+                self._cache_invalidate(method, path, params)
+        return self._decode_response(*result[1:])
+
+    async def stream(self, method, path, params, endpoint=None, chunk_size: int = CHUNK_SIZE):
+        """Wie Client.stream(), als async Generator"""
+        request_url, request_params, request_body = self._build_request(path, params, endpoint)
+        response = await self._send(method, request_url, request_params, request_body, stream=True)
+        try:
+            # Ein Fehler-Body darf nicht in der Zieldatei landen
+            if response.status_code >= 400:
+                raise HTTPError(method, request_url, response.status_code, await response.aread())
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+        finally:
+            await response.aclose()
+
+    async def download(self, method, path, params, target, endpoint=None, chunk_size: int = CHUNK_SIZE) -> int:
+        """Wie Client.download()"""
+        sink = DownloadTarget(target)
+        try:
+            async for chunk in self.stream(method, path, params, endpoint, chunk_size):
+                sink.write(chunk)
+        except BaseException:
+            sink.abort()
+            raise
+        return sink.commit()
+
+    async def _send(self, method, url, params, body, headers=None, stream=False):
+        """Sendet einen Request und wiederholt ihn gemaess self.retry"""
+        retry = self.retry
+        retry.started()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire()
+            try:
+                request = self.session.build_request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    content=body,
+                    headers=self._headers(body, headers),
+                    timeout=self._timeout
+                )
+                response = await self.session.send(request, stream=stream)
+            except _TRANSPORT_ERRORS as e:
+                delay = retry.next_delay(method, url, attempt, started, exception=e)
+                if delay is None:
+                    raise
+            else:
+                if not retry.is_retryable_status(response.status_code):
+                    return response
+                delay = retry.next_delay(
+                    method, url, attempt, started,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get('Retry-After')
+                )
+                if stream:
+                    # Fehler-Body lesen, sonst wird die Verbindung verworfen statt wiederverwendet
+                    await response.aread()
+                    await response.aclose()
+                if delay is None:
+                    raise HTTPError(method, url, response.status_code, response.content, attempt)
+            await asyncio.sleep(delay)
+
+    async def aclose(self):
+        """Schliesst die HTTP-Verbindungen"""
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
@@ -0,0 +1,239 @@
+import re
+import importlib
+import threading
+from functools import lru_cache
+
+from sevdesk.base.basecontroller import RESPONSE_MODES
+from sevdesk.base.codec import default_codec
+from sevdesk.base.retry import RetryPolicy
+from sevdesk.registry import CONTROLLERS, UNDOCUMENTED_CONTROLLERS
+
+
+# Reentrant, da ein Controller/Helper beim Erzeugen weitere laden darf
+_lazy_lock = threading.RLock()
+
+
+def _load_lazy(target, registry, name, client):
+    """
+    Importiert und instanziiert den Eintrag 'name' einer Registry und
+    speichert ihn als Attribut an target (folgende Zugriffe gehen direkt
+    ueber __dict__).
+    """
+    entry = registry.get(name) if not name.startswith('_') else None
+    if entry is None:
+        raise AttributeError(f"'{type(target).__name__}' object has no attribute '{name}'")
+
+    with _lazy_lock:
+        instance = target.__dict__.get(name)
+        if instance is None:
+            module_name, class_name = entry
+            instance = getattr(importlib.import_module(module_name), class_name)(client)
+            setattr(target, name, instance)
+    return instance
+
+
+class LazyNamespace:
+    """Namespace fuer Controller, die erst beim ersten Zugriff geladen werden (client.undocumented)"""
+
+    def __init__(self, client, registry: dict):
+        self._client = client
+        self._registry = registry
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _load_lazy(self, self._registry, name, self._client)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._registry))
+
+
+@lru_cache(maxsize=None)
+def _url_params(path):
+    """Pfad-Platzhalter eines Templates, z.B. '/Invoice/{invoiceId}' -> ('invoiceId',)"""
+    return tuple(re.findall(r"{(\w+)}", path))
+
+
+# Content-Types, die als Binary-Daten (bytes) zurueckgegeben werden
+BINARY_CONTENT_TYPES = (
+    'application/pdf',
+    'application/octet-stream',
+    'image/',
+    'application/zip',
+    'application/xml'  # Für invoiceGetXml
+)
+
+
+class BaseClient:
+    """
+    Gemeinsame Basis fuer Client und AsyncClient.
+
+    Stellt die Controller bereit und baut Requests/Responses unabhaengig
+    vom verwendeten HTTP-Transport auf.
+
+    Controller (client.invoice, client.undocumented.letter, ...) werden
+    ueber die generierte Registry (sevdesk/registry.py) erst beim ersten
+    Zugriff importiert und instanziiert.
+    """
+
+    # True, wenn request() eine Coroutine zurueckgibt
+    is_async = False
+
+    # Attributname -> (Modul, Klasse) der lazy geladenen Attribute
+    _lazy_registry = CONTROLLERS
+
+    # Erlaubte Werte fuer response_mode
+    RESPONSE_MODES = RESPONSE_MODES
+
+    def __init__(self, api_token, api_base='https://my.sevdesk.de/api/v1', response_mode='validate',
+                 codec=None, rate_limit=None, retry: RetryPolicy = None, cache=None, http_cache=None):
+        if response_mode not in self.RESPONSE_MODES:
+            raise ValueError(f"Unbekannter response_mode '{response_mode}', erlaubt: {self.RESPONSE_MODES}")
+        self.api_token = api_token
+        self.api_base = api_base
+        # 'validate': Models mit pydantic-Validierung
+        # 'raw': dekodierte JSON-Dicts
+        # 'lazy': LazyModel, Felder werden beim ersten Zugriff validiert
+        # Kann pro Aufruf mit response_mode=... ueberschrieben werden
+        self.response_mode = response_mode
+        # JSON-Codec (orjson/msgspec wenn installiert, sonst json)
+        self.codec = codec or default_codec()
+        # Token Bucket vor jedem Request: RateLimiter oder Requests pro Sekunde
+        if isinstance(rate_limit, (int, float)):
+            from sevdesk.base.ratelimit import RateLimiter
+            rate_limit = RateLimiter(rate_limit)
+        self.rate_limiter = rate_limit
+        # Wiederholung bei 429/5xx und Verbindungsfehlern (RetryPolicy(max_retries=0) = aus)
+        self.retry = retry or RetryPolicy()
+        # Optionaler ResponseCache fuer GET-Endpoints (sevdesk.base.cache)
+        self.cache = cache
+        # Optionaler persistenter HTTPCache mit bedingten GETs (sevdesk.base.httpcache)
+        if isinstance(http_cache, str):
+            from sevdesk.base.httpcache import HTTPCache
+            http_cache = HTTPCache(http_cache)
+        self.http_cache = http_cache
+        # Zaehlt POST/PUT/DELETE; Teil des Single-Flight-Keys, damit ein GET
+        # nach einer eigenen Aenderung keinem vorher gestarteten GET beitritt
+        self._write_generation = 0
+        self._write_lock = threading.Lock()
+
+        # Controller werden erst beim ersten Zugriff importiert (siehe __getattr__)
+        self.undocumented = LazyNamespace(self, UNDOCUMENTED_CONTROLLERS)
+
+    def __getattr__(self, name):
+        # Wird nur aufgerufen, wenn das Attribut noch nicht existiert
+        return _load_lazy(self, self._lazy_registry, name, self)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._lazy_registry))
+
+    def _build_request(self, path, params, endpoint=None):
+        """Baut URL, Query-Parameter und Body fuer einen Request auf"""
+        if endpoint is not None:
+            url_params = endpoint.url_params
+        else:
+            url_params = _url_params(path)
+        request_path = path.format(**params)
+
+        request_params = {
+            k: v for k, v in params.items()
+            if k not in url_params and
+            k != 'body' and
+            v} # v not None
+        if endpoint is not None and endpoint.query_names:
+            # Parameter unter dem Namen der API senden ('contact_id' -> 'contact[id]')
+            query_names = endpoint.query_names
+            request_params = {query_names.get(k, k): v for k, v in request_params.items()}
+        request_url = f'{self.api_base}{request_path}'
+        request_body = params.get('body', None)
+        if request_body:
+            # Body direkt als JSON-Bytes serialisieren
+            if hasattr(request_body, 'model_dump_json'):
+                request_body = self.codec.dump_model(request_body)
+            else:
+                request_body = self.codec.dumps(request_body)
+        else:
+            request_body = None
+        return request_url, request_params, request_body
+
+    def _cache_lookup(self, endpoint, method, params, request_url, request_params):
+        """
+        Returns:
+            (Cache-Key oder None, (content_type, content) oder None, Generation)
+        """
+        if self.cache is None:
+            return None, None, None
+        key = self.cache.key(endpoint, method, params, request_url, request_params)
+        if key is None:
+            return None, None, None
+        return key, self.cache.get(key), self.cache.generation(key)
+
+    def _cache_store(self, key, generation, result):
+        status, content_type, content = result
+        if key is not None and status == 200:
+            self.cache.set(key, content_type, content, generation)
+
+    def _cache_invalidate(self, method, path, params):
+        """Entfernt nach POST/PUT/DELETE die betroffenen GET-Eintraege"""
+        if method.lower() == 'get':
+            return
+        with self._write_lock:
+            self._write_generation += 1
+        if self.cache is not None:
+            self.cache.invalidate_mutation(path, params)
+
+    def _revalidation(self, method, request_url, request_params):
+        """
+        Returns:
+            (HTTPCache-Key oder None, gespeicherte Response oder None, zusaetzliche Header)
+        """
+        if self.http_cache is None or method.lower() != 'get':
+            return None, None, None
+        key = self.http_cache.key(self.api_token, request_url, request_params)
+        stored = self.http_cache.get(key)
+        return key, stored, (stored.conditional_headers() if stored is not None else None)
+
+    def _result(self, http_cache_key, stored, response):
+        """(Status, Content-Type, Body) einer Response, bei 304 aus dem HTTPCache"""
+        if http_cache_key is not None:
+            return self.http_cache.update(http_cache_key, stored, response)
+        return response.status_code, response.headers.get('content-type', ''), response.content
+
+    def _flight_key(self, method, request_url, request_params):
+        """
+        Key fuer das Zusammenfassen identischer GET-Requests (None = nicht zusammenfassen).
+
+        Enthaelt die Zahl der bisherigen Aenderungen: ein GET nach einem
+        abgeschlossenen POST/PUT/DELETE startet einen eigenen Request und
+        sieht die Aenderung.
+        """
+        if method.lower() != 'get':
+            return None
+        return (self._write_generation, request_url,
+                tuple(sorted((k, str(v)) for k, v in request_params.items())))
+
+    def _headers(self, request_body=None, extra=None):
+        headers = {'Authorization': self.api_token}
+        if request_body is not None:
+            headers['Content-Type'] = 'application/json'
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def _decode_response(self, content_type, content):
+        """Dekodiert den Response-Body (Binary-Daten bleiben bytes)"""
+        # PDF oder andere Binary-Daten
+        if self._is_binary(content_type):
+            return content
+        if not content:
+            return None
+        return self.codec.loads(content)
+
+    @staticmethod
+    def _is_binary(content_type):
+        """Prueft ob ein Content-Type als Binary-Daten behandelt wird"""
+        content_type = content_type.lower()
+        return any(binary_type in content_type for binary_type in BINARY_CONTENT_TYPES)
+
+    def request(self, method, path, params, endpoint=None):
+        raise NotImplementedError
@@ -1,19 +1,168 @@
+import dis
 import inspect
-from typing import get_type_hints, get_origin, get_args
+import re
+from collections import deque
+from typing import Optional, get_type_hints, get_origin, get_args
+
+# pydantic (modelbuilder, lazymodel), asyncio und concurrent.futures werden
+# erst bei Bedarf importiert, damit "import sevdesk" schnell bleibt
+
+# Moegliche Werte fuer response_mode (pro Client oder pro Aufruf)
+RESPONSE_MODES = ('validate', 'raw', 'lazy')
+
+
+def _passthrough(self):
+    return (yield)
+
+
+def _instructions(func):
+    return [(i.opname, i.argval) for i in dis.get_instructions(func)]
+
+
+# Bytecode eines Endpoints ohne eigene Logik ("return (yield)")
+_PASSTHROUGH_INSTRUCTIONS = _instructions(_passthrough)
+
+
+def api_param_name(name: str) -> str:
+    """
+    Query-Parameter-Name der API zu einem Python-Parameternamen, Umkehrung
+    von sanitize_param_name im Generator:
+    'contact_id' -> 'contact[id]', 'type_' -> 'type'
+    """
+    if name.endswith('_'):
+        return name[:-1]
+    if '_' in name:
+        head, _, tail = name.partition('_')
+        return f"{head}[{tail.replace('_', '][')}]"
+    return name
+
+
+class Endpoint:
+    """
+    Vorberechnete Metadaten eines Controller-Endpoints.
+
+    Signatur, Return-Type, Pfad-Platzhalter und Query-Parameter werden
+    einmalig beim Dekorieren ermittelt, damit pro Aufruf nur noch die
+    Argumente gebunden werden muessen.
+    """
+
+    def __init__(self, func, method, path):
+        self.func = func
+        self.method = method
+        self.path = path
+        self.name = func.__qualname__
+
+        sig = inspect.signature(func)
+        parameters = list(sig.parameters.values())[1:]  # ohne self
+        self.signature = sig
+        self.param_names = tuple(p.name for p in parameters)
+        self._param_set = frozenset(self.param_names)
+        self.defaults = {
+            p.name: (None if p.default is inspect.Parameter.empty else p.default)
+            for p in parameters
+        }
+        self.required = tuple(
+            p.name for p in parameters if p.default is inspect.Parameter.empty
+        )
+
+        self.url_params = tuple(re.findall(r"{(\w+)}", path))
+        self.query_params = tuple(
+            name for name in self.param_names
+            if name not in self.url_params and name != 'body'
+        )
+        # Python-Name -> Name in der Query (nur wenn abweichend)
+        self.query_names = {
+            name: api_param_name(name) for name in self.query_params
+            if api_param_name(name) != name
+        }
+
+        # Return Type aus der Funktion auslesen
+        try:
+            self.return_type = get_type_hints(func).get('return', None)
+        except Exception:
+            self.return_type = None
+
+        # Nur Endpoints mit Code vor dem yield muessen als Generator laufen
+        self.passthrough = _instructions(func) == _PASSTHROUGH_INSTRUCTIONS
+
+    def bind(self, args, kwargs):
+        """Bindet positionelle und Keyword-Argumente an die Parameternamen"""
+        if len(args) > len(self.param_names):
+            raise TypeError(
+                f"{self.func.__name__}() takes {len(self.param_names) + 1} positional "
+                f"arguments but {len(args) + 1} were given"
+            )
+        params = dict(self.defaults)
+        params.update(zip(self.param_names, args))
+        positional = self.param_names[:len(args)] if args else ()
+        for key in kwargs:
+            if key not in self._param_set:
+                raise TypeError(f"{self.func.__name__}() got an unexpected keyword argument '{key}'")
+            if key in positional:
+                raise TypeError(f"{self.func.__name__}() got multiple values for argument '{key}'")
+        params.update(kwargs)
+
+        if len(args) < len(self.required):
+            missing = [
+                name for name in self.required[len(args):]
+                if name not in kwargs
+            ]
+            if missing:
+                raise TypeError(
+                    f"{self.func.__name__}() missing required argument(s): "
+                    + ", ".join(f"'{name}'" for name in missing)
+                )
+        return params
+
+    def prepare(self, controller, params):
+        """
+        Fuehrt den Endpoint-Code bis zum yield aus und uebernimmt
+        veraenderte Parameter. Gibt None zurueck, wenn kein Request
+        gesendet werden soll.
+        """
+        if self.passthrough:
+            return params
+
+        gen = self.func(controller, **params)
+        try:
+            # Pre-request: bis zum yield ausführen
+            next(gen)
+        except StopIteration:
+            return None
+        # veränderte parameter übernehmen (gi_frame HACK)
+        if gen.gi_frame:
+            f_locals = gen.gi_frame.f_locals
+            for arg in params:
+                params[arg] = f_locals[arg]
+        return params
+
 
 class BaseController:
     def __init__(self, client):
         self.client = client
-    
+
     @staticmethod
-    def parse_response(response, return_type):
-        """Wandelt die Response in das entsprechende Model um"""
+    def parse_response(response, return_type, mode: str = 'validate'):
+        """
+        Wandelt die Response in das entsprechende Model um
+
+        Args:
+            response: Dekodierte API-Response
+            return_type: Return-Type des Endpoints
+            mode: 'validate' (pydantic-Validierung), 'raw' (dekodierte Dicts)
+                  oder 'lazy' (LazyModel, Validierung beim ersten Feldzugriff)
+        """
+        if mode not in RESPONSE_MODES:
+            raise ValueError(f"Unbekannter response_mode '{mode}', erlaubt: {RESPONSE_MODES}")
+
         if return_type is None:
             return response
-        
+
+        from sevdesk.base import lazymodel, modelbuilder
+
         # Hole den ursprünglichen Typ (ohne list[] wrapper)
         origin = get_origin(return_type)
-        
+
         # Wenn es eine Liste ist
         if origin is list:
             args = get_args(return_type)
@@ -22,66 +171,284 @@ class BaseController:
                 # Response sollte eine Liste von Dicts sein
                 if isinstance(response, dict) and 'objects' in response:
                     # sevDesk API struktur: {"objects": [...]}
-                    return [model_class(**item) if isinstance(item, dict) else item 
-                            for item in response['objects']]
+                    items = response['objects']
                 elif isinstance(response, list):
-                    return [model_class(**item) if isinstance(item, dict) else item 
-                            for item in response]
-        
+                    items = response
+                else:
+                    return response
+
+                if mode == 'raw':
+                    return items
+                if mode == 'lazy':
+                    return lazymodel.lazy_list(model_class, items)
+                if isinstance(items, list) and all(isinstance(item, dict) for item in items):
+                    # Ganze Liste in einem Aufruf validieren
+                    return modelbuilder.validate_list(model_class, items)
+                return [model_class(**item) if isinstance(item, dict) else item
+                        for item in items]
+
         # Einzelnes Model
         elif hasattr(return_type, '__bases__'):  # Check if it's a class
             if isinstance(response, dict):
                 # sevDesk API struktur kann auch {"objects": {...}} sein
                 if 'objects' in response and isinstance(response['objects'], dict):
-                    return return_type(**response['objects'])
+                    data = response['objects']
                 else:
-                    return return_type(**response)
-        
+                    data = response
+                if mode == 'raw':
+                    return data
+                if mode == 'lazy':
+                    return lazymodel.lazy(return_type, data)
+                return return_type(**data)
+
         return response
-    
+
+    def _list_endpoint(self, operation):
+        """Ermittelt den Endpoint einer Listen-Operation (Name oder Methode)"""
+        if isinstance(operation, str):
+            operation = getattr(self, operation)
+        endpoint = getattr(operation, 'endpoint', None)
+        if endpoint is None:
+            raise TypeError(f"{operation!r} ist keine Controller-Methode")
+        if get_origin(endpoint.return_type) is not list:
+            raise TypeError(f"{endpoint.name} liefert keine Liste und kann nicht paginiert werden")
+        return endpoint
+
+    @staticmethod
+    def _page_request(params, offset, page_size, count_all=False):
+        """Parameter fuer den Request einer einzelnen Seite"""
+        page_params = dict(params, limit=page_size, offset=offset)
+        if count_all:
+            page_params['countAll'] = True
+        return page_params
+
+    @staticmethod
+    def _parse_page(endpoint, response, mode):
+        """Wandelt eine Seiten-Response um, liefert (models, total oder None)"""
+        total = None
+        if isinstance(response, dict) and response.get('total') is not None:
+            try:
+                total = int(response['total'])
+            except (TypeError, ValueError):
+                total = None
+        return BaseController.parse_response(response, endpoint.return_type, mode), total
+
+    def _fetch_page(self, endpoint, params, offset, page_size, mode, count_all=False):
+        page_params = self._page_request(params, offset, page_size, count_all)
+        response = self.client.request(endpoint.method, endpoint.path, page_params, endpoint=endpoint)
+        return self._parse_page(endpoint, response, mode)
+
+    async def _afetch_page(self, endpoint, params, offset, page_size, mode, count_all=False):
+        page_params = self._page_request(params, offset, page_size, count_all)
+        response = await self.client.request(endpoint.method, endpoint.path, page_params, endpoint=endpoint)
+        return self._parse_page(endpoint, response, mode)
+
+    def pages(self, operation, *args, page_size: int = 100, offset: int = 0,
+              concurrency: int = 1, max_buffered: Optional[int] = None,
+              response_mode: Optional[str] = None, **kwargs):
+        """
+        Ruft eine Listen-Operation seitenweise mit limit/offset ab.
+
+        Mit concurrency > 1 werden die folgenden Seiten parallel in einem
+        Thread-Pool vorgeladen. Unterstuetzt der Endpoint countAll (z.B.
+        getLetters), wird damit die Gesamtanzahl ermittelt und nicht ueber
+        das Ende hinaus geladen. Die Seiten werden immer in Reihenfolge
+        geliefert.
+
+        Args:
+            operation: Methode oder Methodenname, z.B. 'getInvoices'
+            *args, **kwargs: Parameter der Operation
+            page_size: Anzahl Objekte pro Request
+            offset: Start-Offset
+            concurrency: Anzahl parallel laufender Requests
+            max_buffered: Max. vorgeladene Seiten (default: concurrency).
+                          Weitere Seiten werden erst geladen, wenn der
+                          Aufrufer Seiten abgenommen hat.
+            response_mode: Ueberschreibt den response_mode des Clients
+
+        Yields:
+            Eine Liste von Models pro Seite
+        """
+        if self.client.is_async:
+            raise TypeError("Mit AsyncClient apages() verwenden")
+        endpoint = self._list_endpoint(operation)
+        mode = response_mode or self.client.response_mode
+        params = endpoint.prepare(self, endpoint.bind(args, kwargs))
+        if params is None:
+            return
+
+        count_all = concurrency > 1 and 'countAll' in endpoint.param_names
+        page, total = self._fetch_page(endpoint, params, offset, page_size, mode, count_all)
+        if not page:
+            return
+        yield page
+        # Letzte Seite oder limit wird vom Endpoint ignoriert
+        if len(page) != page_size:
+            return
+        offset += page_size
+
+        if concurrency <= 1:
+            while True:
+                page, _ = self._fetch_page(endpoint, params, offset, page_size, mode)
+                if not page:
+                    return
+                yield page
+                if len(page) != page_size:
+                    return
+                offset += page_size
+
+        window = max(max_buffered or concurrency, 1)
+        # total zaehlt alle Objekte ab Offset 0
+        end = total
+        from concurrent.futures import ThreadPoolExecutor
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            try:
+                while True:
+                    # Fenster auffuellen, solange der Puffer nicht voll ist
+                    while len(pending) < window and (end is None or offset < end):
+                        pending.append(pool.submit(
+                            self._fetch_page, endpoint, params, offset, page_size, mode
+                        ))
+                        offset += page_size
+                    if not pending:
+                        return
+                    page, _ = pending.popleft().result()
+                    if not page:
+                        return
+                    yield page
+                    if len(page) != page_size:
+                        return
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def paginate(self, operation, *args, page_size: int = 100, offset: int = 0,
+                 concurrency: int = 1, max_buffered: Optional[int] = None,
+                 response_mode: Optional[str] = None, **kwargs):
+        """
+        Iteriert ueber alle Objekte einer Listen-Operation.
+
+        Die Seiten werden erst bei Bedarf geladen, es liegen hoechstens
+        max_buffered Seiten im Speicher (siehe pages()).
+
+        Beispiel:
+            for invoice in sevdesk.invoice.paginate('getInvoices', status=200):
+                ...
+        """
+        for page in self.pages(operation, *args, page_size=page_size, offset=offset,
+                               concurrency=concurrency, max_buffered=max_buffered,
+                               response_mode=response_mode, **kwargs):
+            yield from page
+
+    async def apages(self, operation, *args, page_size: int = 100, offset: int = 0,
+                     concurrency: int = 1, max_buffered: Optional[int] = None,
+                     response_mode: Optional[str] = None, **kwargs):
+        """Wie pages(), fuer AsyncClient (parallel als asyncio-Tasks)"""
+        import asyncio
+
+        endpoint = self._list_endpoint(operation)
+        mode = response_mode or self.client.response_mode
+        params = endpoint.prepare(self, endpoint.bind(args, kwargs))
+        if params is None:
+            return
+
+        count_all = concurrency > 1 and 'countAll' in endpoint.param_names
+        page, total = await self._afetch_page(endpoint, params, offset, page_size, mode, count_all)
+        if not page:
+            return
+        yield page
+        if len(page) != page_size:
+            return
+        offset += page_size
+
+        window = max(max_buffered or concurrency, 1) if concurrency > 1 else 1
+        # total zaehlt alle Objekte ab Offset 0
+        end = total
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def fetch(page_offset):
+            async with semaphore:
+                return await self._afetch_page(endpoint, params, page_offset, page_size, mode)
+
+        pending = deque()
+        try:
+            while True:
+                while len(pending) < window and (end is None or offset < end):
+                    pending.append(asyncio.ensure_future(fetch(offset)))
+                    offset += page_size
+                if not pending:
+                    return
+                page, _ = await pending.popleft()
+                if not page:
+                    return
+                yield page
+                if len(page) != page_size:
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def apaginate(self, operation, *args, page_size: int = 100, offset: int = 0,
+                        concurrency: int = 1, max_buffered: Optional[int] = None,
+                        response_mode: Optional[str] = None, **kwargs):
+        """Wie paginate(), fuer AsyncClient"""
+        async for page in self.apages(operation, *args, page_size=page_size, offset=offset,
+                                      concurrency=concurrency, max_buffered=max_buffered,
+                                      response_mode=response_mode, **kwargs):
+            for item in page:
+                yield item
+
+    @staticmethod
+    async def _dispatch_async(client, endpoint, params, mode):
+        """Fuehrt einen Endpoint-Aufruf ueber einen AsyncClient aus"""
+        if params is None:
+            return None
+        response = await client.request(endpoint.method, endpoint.path, params, endpoint=endpoint)
+        return BaseController.parse_response(response, endpoint.return_type, mode)
+
+    @staticmethod
+    def _dispatch_stream(client, endpoint, params, stream_to):
+        """
+        stream=True: Generator (AsyncClient: async Generator) ueber den Body
+        stream_to: Download in Dateipfad/Datei-Objekt, liefert die Anzahl Bytes
+        """
+        if params is None:
+            raise ValueError(f"{endpoint.name}() sendet mit diesen Argumenten keinen Request")
+        if stream_to is not None:
+            return client.download(endpoint.method, endpoint.path, params, stream_to, endpoint=endpoint)
+        return client.stream(endpoint.method, endpoint.path, params, endpoint=endpoint)
+
     @staticmethod
     def request(method, path):
         def decorator(func):
-            def wrapper(self, *args, **kwargs):
-                # Args in kwargs umwandeln
-                sig = inspect.signature(func)
-                bound_args = sig.bind(self, *args, **kwargs)
-                bound_args.apply_defaults()
-                
-                # Entferne 'self' aus den arguments
-                all_kwargs = dict(bound_args.arguments)
-                all_kwargs.pop('self', None)
-                
-                gen = func(self, **all_kwargs)
-                
-                try:
-                    # Pre-request: bis zum yield ausführen
-                    next(gen)
-                    # veränderte parameter übernehmen
-                    for arg in all_kwargs.copy():
-                        # gi_frame HACK
-                        if gen.gi_frame:
-                            all_kwargs[arg] = gen.gi_frame.f_locals[arg]
-                    
-                    response = self.client.request(method, path, all_kwargs)
-                    
-                    # Return Type aus der Funktion auslesen
-                    try:
-                        type_hints = get_type_hints(func)
-                        return_type = type_hints.get('return', None)
-                    except Exception:
-                        return_type = None
-                    
-                    # Response in Model umwandeln
-                    parsed_response = BaseController.parse_response(response, return_type)
-                    
-                    # Gebe das Ergebnis direkt zurück
-                    return parsed_response
-                    
-                except StopIteration:
+            endpoint = Endpoint(func, method, path)
+
+            def wrapper(self, *args, response_mode=None, stream=False, stream_to=None, **kwargs):
+                params = endpoint.prepare(self, endpoint.bind(args, kwargs))
+                # Grosse Downloads (PDF, ZIP, XML) blockweise statt komplett im Speicher
+                if stream or stream_to is not None:
+                    return BaseController._dispatch_stream(self.client, endpoint, params, stream_to)
+                # response_mode pro Aufruf, sonst vom Client
+                mode = response_mode or self.client.response_mode
+
+                # AsyncClient: Awaitable zurueckgeben
+                if self.client.is_async:
+                    return BaseController._dispatch_async(self.client, endpoint, params, mode)
+
+                if params is None:
                     return None
-                    
+
+                response = self.client.request(method, path, params, endpoint=endpoint)
+
+                # Response in Model umwandeln
+                return BaseController.parse_response(response, endpoint.return_type, mode)
+
             wrapper.__name__ = func.__name__
+            wrapper.__qualname__ = func.__qualname__
+            wrapper.__doc__ = func.__doc__
+            wrapper.endpoint = endpoint
             return wrapper
         return decorator
 
@@ -99,4 +466,4 @@ class BaseController:
 
     @staticmethod
     def delete(path):
-        return BaseController.request('delete', path)
\ No newline at end of file
+        return BaseController.request('delete', path)
@@ -0,0 +1,286 @@
+"""
+ResponseCache - TTL/LRU-Cache fuer GET-Responses von Controller-Endpoints
+
+Gedacht fuer Referenzdaten, die sich selten aendern (Zahlungskonten, Tags,
+Vorlagen, ...), von den Helpern aber wiederholt abgefragt werden.
+
+- TTL pro Endpoint, Schluessel ist der Name der Controller-Methode
+  (z.B. 'CheckAccountController.getCheckAccounts')
+- Cache-Key aus Controller-Methode, URL und Query-Parametern
+- LRU-Verdraengung nach Anzahl Eintraegen und Bytes
+- Gespeichert wird der unveraenderte Response-Body; jeder Treffer wird
+  neu dekodiert, Aufrufer erhalten also nie dieselben Objekte
+- Statistik ueber Treffer, Fehlschlaege und Verdraengungen
+- Schreibende Requests (POST/PUT/DELETE) entfernen betroffene Eintraege,
+  abgeleitet aus dem Pfad-Template (siehe invalidate_mutation)
+
+Beispiel:
+    from sevdesk.base.cache import ResponseCache
+    client = Client('api-token', cache=ResponseCache())   # Referenzdaten, 10 Minuten
+    client = Client('api-token', cache=ResponseCache(ttls={'TagController.getTags': 60}))
+"""
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Optional
+
+# Endpoints mit selten geaenderten Referenzdaten -> TTL in Sekunden
+REFERENCE_DATA_TTLS = {
+    'CheckAccountController.getCheckAccounts': 600,
+    'TagController.getTags': 600,
+    'ContactFieldController.getContactFieldSettings': 600,
+    'LayoutController.getTemplates': 600,
+    'CommunicationWayController.getCommunicationWayKeys': 3600,
+    'BasicsController.bookkeepingSystemVersion': 3600,
+    'SevUserController.getSevUsers': 600,
+}
+
+
+# Ressource einer Mutation -> weitere Ressourcen, deren Daten sich dadurch aendern
+# (z.B. aendert eine Rechnungsposition die Summen der Rechnung)
+RELATED_RESOURCES = {
+    'Invoice': ('InvoicePos', 'Order', 'CheckAccountTransaction'),
+    'InvoicePos': ('Invoice',),
+    'Order': ('OrderPos',),
+    'OrderPos': ('Order',),
+    'CreditNote': ('CreditNotePos', 'Invoice', 'Voucher'),
+    'CreditNotePos': ('CreditNote',),
+    'Voucher': ('VoucherPos', 'CheckAccountTransaction'),
+    'VoucherPos': ('Voucher',),
+    'Contact': ('ContactAddress', 'CommunicationWay', 'ContactCustomField', 'AccountingContact'),
+    'ContactAddress': ('Contact',),
+    'CommunicationWay': ('Contact',),
+    'ContactCustomField': ('Contact',),
+    'ContactCustomFieldSetting': ('ContactCustomField',),
+    'AccountingContact': ('Contact',),
+    'CheckAccountTransaction': ('CheckAccount',),
+    'CheckAccount': ('CheckAccountTransaction',),
+}
+
+
+@lru_cache(maxsize=None)
+def _path_template(path: str):
+    """'/Invoice/{invoiceId}/getPdf' -> ('Invoice', 'invoiceId'); '/Invoice/5' -> ('Invoice', '#5')"""
+    segments = path.strip('/').split('/')
+    resource = segments[0]
+    if len(segments) < 2:
+        return resource, None
+    second = segments[1]
+    if second.startswith('{') and second.endswith('}'):
+        return resource, second[1:-1]
+    if second.isdigit():
+        # Bereits eingesetzte ID (client.request mit fertigem Pfad)
+        return resource, '#' + second
+    return resource, None
+
+
+def resource_of(path: str, params: dict):
+    """
+    Ressource und Objekt-ID eines Requests aus dem Pfad-Template.
+
+    Returns:
+        (Ressource, ID als str oder None fuer Collection-/Factory-Pfade)
+    """
+    resource, item = _path_template(path)
+    if item is None:
+        return resource, None
+    if item.startswith('#'):
+        return resource, item[1:]
+    value = params.get(item)
+    return resource, (str(value) if value is not None else None)
+
+
+class CacheStats:
+    """Momentaufnahme der Cache-Statistik"""
+
+    __slots__ = ('hits', 'misses', 'evictions', 'expirations', 'invalidations', 'entries', 'bytes')
+
+    def __init__(self, hits=0, misses=0, evictions=0, expirations=0, invalidations=0, entries=0, bytes=0):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.expirations = expirations
+        self.invalidations = invalidations
+        self.entries = entries
+        self.bytes = bytes
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self):
+        return (f"CacheStats(hits={self.hits}, misses={self.misses}, hit_rate={self.hit_rate:.1%}, "
+                f"evictions={self.evictions}, expirations={self.expirations}, "
+                f"invalidations={self.invalidations}, entries={self.entries}, bytes={self.bytes})")
+
+
+class CacheKey(tuple):
+    """(Endpoint-Name, URL, Query-Parameter); Ressource/ID fuer die Invalidierung"""
+
+    __slots__ = ()
+
+    def __new__(cls, endpoint_name, request_url, request_params, resource, item):
+        return super().__new__(cls, (endpoint_name, request_url, request_params, resource, item))
+
+    endpoint_name = property(lambda self: self[0])
+    resource = property(lambda self: self[3])
+    item = property(lambda self: self[4])
+
+
+class _Entry:
+    __slots__ = ('content_type', 'content', 'expires')
+
+    def __init__(self, content_type, content, expires):
+        self.content_type = content_type
+        self.content = content
+        self.expires = expires
+
+
+class ResponseCache:
+    """
+    Thread-sicherer In-Memory-Cache fuer GET-Responses.
+
+    Args:
+        ttls: Endpoint-Name -> TTL in Sekunden (Standard: REFERENCE_DATA_TTLS)
+        default_ttl: TTL fuer alle anderen GET-Endpoints (None = nicht cachen)
+        max_entries: Maximale Anzahl Eintraege
+        max_bytes: Maximale Summe der gespeicherten Response-Bodies
+        related: Ressource -> mitbetroffene Ressourcen (Standard: RELATED_RESOURCES)
+    """
+
+    def __init__(self, ttls: Optional[dict] = None, default_ttl: Optional[float] = None,
+                 max_entries: int = 1000, max_bytes: int = 32 * 1024 * 1024,
+                 related: Optional[dict] = None):
+        self.ttls = dict(REFERENCE_DATA_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.related = dict(RELATED_RESOURCES if related is None else related)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        # Wird bei jeder Invalidierung einer Ressource erhoeht; eine Response,
+        # die waehrenddessen unterwegs war, wird danach nicht mehr gespeichert
+        self._generations = defaultdict(int)
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def ttl_for(self, endpoint_name: str) -> Optional[float]:
+        """TTL eines Endpoints oder None, wenn er nicht gecacht wird"""
+        return self.ttls.get(endpoint_name, self.default_ttl)
+
+    def key(self, endpoint, method: str, params: dict, request_url: str, request_params: dict):
+        """Cache-Key eines Requests oder None, wenn er nicht gecacht wird"""
+        if endpoint is None or method.lower() != 'get' or not self.ttl_for(endpoint.name):
+            return None
+        resource, item = resource_of(endpoint.path, params)
+        return CacheKey(
+            endpoint.name, request_url,
+            tuple(sorted((k, str(v)) for k, v in request_params.items())),
+            resource, item
+        )
+
+    def generation(self, key: CacheKey) -> int:
+        """Stand der Ressource vor dem Request (fuer set())"""
+        return self._generations.get(key.resource, 0)
+
+    def get(self, key):
+        """(content_type, content) oder None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            if entry.expires <= time.monotonic():
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.content_type, entry.content
+
+    def set(self, key: CacheKey, content_type: str, content: bytes, generation: Optional[int] = None):
+        """
+        Speichert eine Response.
+
+        Args:
+            generation: Wert von generation() vor dem Request; wurde die
+                        Ressource seitdem invalidiert, wird nicht gespeichert
+        """
+        ttl = self.ttl_for(key.endpoint_name)
+        size = len(content)
+        if not ttl or size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generations.get(key.resource, 0):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(content_type, content, time.monotonic() + ttl)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._stats.evictions += 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.content)
+
+    def invalidate(self, endpoint_name: Optional[str] = None) -> int:
+        """Entfernt alle Eintraege (eines Endpoints), liefert die Anzahl"""
+        with self._lock:
+            keys = [key for key in self._entries if endpoint_name is None or key.endpoint_name == endpoint_name]
+            for key in keys:
+                self._generations[key.resource] += 1
+                self._remove(key)
+            self._stats.invalidations += len(keys)
+            return len(keys)
+
+    def invalidate_mutation(self, path: str, params: dict) -> int:
+        """
+        Entfernt die von einem schreibenden Request betroffenen Eintraege.
+
+        Aus dem Pfad-Template (z.B. '/Invoice/{invoiceId}/resetToDraft')
+        werden Ressource und ID abgeleitet:
+        - mit ID: Collection-Eintraege der Ressource (ohne ID, z.B. getInvoices)
+          und alle Eintraege mit dieser ID; andere IDs bleiben erhalten
+        - ohne ID (z.B. '/Invoice/Factory/saveInvoice'): alle Eintraege der Ressource
+        - verwandte Ressourcen (RELATED_RESOURCES): alle Eintraege
+
+        Returns:
+            Anzahl entfernter Eintraege
+        """
+        resource, item = resource_of(path, params)
+        related = set(self.related.get(resource, ()))
+
+        def affected(key):
+            if key.resource in related:
+                return True
+            if key.resource != resource:
+                return False
+            return item is None or key.item is None or key.item == item
+
+        with self._lock:
+            for name in related | {resource}:
+                self._generations[name] += 1
+            keys = [key for key in self._entries if affected(key)]
+            for key in keys:
+                self._remove(key)
+            self._stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self):
+        self.invalidate()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            stats = self._stats
+            return CacheStats(stats.hits, stats.misses, stats.evictions, stats.expirations,
+                              stats.invalidations, len(self._entries), self._bytes)
+
+    def __len__(self):
+        return len(self._entries)
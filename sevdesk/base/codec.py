@@ -0,0 +1,83 @@
+"""
+JSON-Codecs fuer Request-Bodies und Responses
+
+Der Client dekodiert Responses direkt aus den Bytes (response.content) und
+serialisiert pydantic-Bodies in einem Schritt mit model_dump_json().
+Ist orjson oder msgspec installiert, wird dieses automatisch verwendet,
+sonst das json-Modul der Standardbibliothek.
+
+Beispiel:
+    from sevdesk.base.codec import JsonCodec
+    client = Client('api-token', codec=JsonCodec())
+"""
+
+import json
+
+# orjson/msgspec werden erst beim Erzeugen eines Codecs importiert, damit
+# "import sevdesk.base.codec" nichts Zusaetzliches laedt
+
+
+class JsonCodec:
+    """Codec auf Basis des json-Moduls der Standardbibliothek"""
+
+    name = 'json'
+
+    def loads(self, data: bytes):
+        return json.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    def dump_model(self, model) -> bytes:
+        """Serialisiert ein pydantic-Model so wie es die API erwartet"""
+        return model.model_dump_json(by_alias=True, exclude_none=True).encode('utf-8')
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec auf Basis von orjson"""
+
+    name = 'orjson'
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError("OrjsonCodec benoetigt orjson (pip install orjson)") from None
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+
+    def loads(self, data: bytes):
+        return self._loads(data)
+
+    def dumps(self, obj) -> bytes:
+        return self._dumps(obj)
+
+
+class MsgspecCodec(JsonCodec):
+    """Codec auf Basis von msgspec"""
+
+    name = 'msgspec'
+
+    def __init__(self):
+        try:
+            import msgspec
+        except ImportError:
+            raise ImportError("MsgspecCodec benoetigt msgspec (pip install msgspec)") from None
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: bytes):
+        return self._decoder.decode(data)
+
+    def dumps(self, obj) -> bytes:
+        return self._encoder.encode(obj)
+
+
+def default_codec() -> JsonCodec:
+    """Schnellster verfuegbarer Codec: orjson, msgspec, sonst json"""
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return JsonCodec()
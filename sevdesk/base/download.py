@@ -0,0 +1,52 @@
+"""
+Ziele fuer gestreamte Downloads (stream_to=...)
+
+Ein Dateipfad wird zuerst als '<pfad>.part' geschrieben und erst nach
+vollstaendigem Download umbenannt; ein abgebrochener Download hinterlaesst
+also nie eine unvollstaendige Datei unter dem Zielnamen. Datei-Objekte
+(alles mit write()) werden unveraendert beschrieben.
+"""
+
+import os
+
+# Groesse der Bloecke, in denen Response-Bodies gelesen werden
+CHUNK_SIZE = 64 * 1024
+
+
+class DownloadTarget:
+    """
+    Args:
+        target: Dateipfad (str/PathLike) oder Datei-Objekt mit write()
+    """
+
+    def __init__(self, target):
+        self.bytes = 0
+        if hasattr(target, 'write'):
+            self.path = None
+            self._file = target
+            self._owned = False
+        else:
+            self.path = os.fspath(target)
+            self._partial = self.path + '.part'
+            self._file = open(self._partial, 'wb')
+            self._owned = True
+
+    def write(self, chunk: bytes):
+        self._file.write(chunk)
+        self.bytes += len(chunk)
+
+    def commit(self) -> int:
+        """Schliesst den Download ab, liefert die Anzahl geschriebener Bytes"""
+        if self._owned:
+            self._file.close()
+            os.replace(self._partial, self.path)
+        return self.bytes
+
+    def abort(self):
+        """Verwirft einen abgebrochenen Download (nur bei Dateipfaden)"""
+        if self._owned:
+            self._file.close()
+            try:
+                os.remove(self._partial)
+            except OSError:
+                pass
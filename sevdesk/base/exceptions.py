@@ -0,0 +1,38 @@
+"""
+Exceptions des sevDesk-Clients
+"""
+
+
+class SevdeskError(Exception):
+    """Basisklasse fuer Fehler des Clients"""
+
+
+class HTTPError(SevdeskError):
+    """
+    Die API hat mit einem Fehlerstatus geantwortet, der auch nach allen
+    Wiederholungen bestehen blieb (z.B. 429 oder 5xx). Bei gestreamten
+    Downloads wird jeder Fehlerstatus (>= 400) so gemeldet.
+    """
+
+    def __init__(self, method: str, url: str, status_code: int, body: bytes = b'', attempts: int = 1):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.body = body
+        self.attempts = attempts
+        super().__init__(f"{method} {url}: HTTP {status_code} (nach {attempts} Versuch(en))")
+
+
+class PositionError(SevdeskError, RuntimeError):
+    """
+    Positionen eines Dokuments (Rechnung, Auftrag) sind ungueltig; es
+    wurde nichts gespeichert. Die Positionen bleiben vorgemerkt und
+    koennen nach einer Korrektur erneut gespeichert werden.
+
+    failures: Liste von (Index, Positionsname, Exception)
+    """
+
+    def __init__(self, failures: list):
+        self.failures = failures
+        details = '; '.join(f"#{index} '{name}': {error}" for index, name, error in failures)
+        super().__init__(f"{len(failures)} Position(en) ungueltig: {details}")
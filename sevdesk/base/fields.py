@@ -0,0 +1,29 @@
+"""
+Feldzugriff fuer Models, LazyModels und dekodierte Dicts
+
+Helper arbeiten je nach response_mode mit Models (Feldnamen wie id_,
+type_) oder mit Dicts aus der API (Schluessel id, type). field() liest
+ein Feld unter dem Namen der API aus beiden.
+"""
+
+from typing import Optional
+
+
+def field(obj, name: str):
+    """Feld unter dem Namen der API ('id', 'update', ...) oder None"""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    value = getattr(obj, name, None)
+    if value is None:
+        # Generierte Models benennen Python-Schluesselwoerter und Builtins
+        # mit Unterstrich (id_, type_)
+        value = getattr(obj, name + '_', None)
+    return value
+
+
+def ref_id(ref) -> Optional[int]:
+    """ID eines Objekts oder einer verschachtelten Referenz ({'id': ..., 'objectName': ...})"""
+    value = field(ref, 'id')
+    return int(value) if value else None
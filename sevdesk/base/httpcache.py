@@ -0,0 +1,176 @@
+"""
+HTTPCache - persistenter HTTP-Cache mit bedingten Requests (SQLite)
+
+Speichert GET-Responses, die einen ETag- oder Last-Modified-Header haben,
+zusammen mit diesen Validatoren in einer SQLite-Datenbank. Beim naechsten
+Request auf dieselbe URL (auch in einem spaeteren Prozess) sendet der
+Client If-None-Match/If-Modified-Since; antwortet die API mit
+304 Not Modified, wird der gespeicherte Body verwendet und nicht erneut
+uebertragen.
+
+Im Gegensatz zum ResponseCache (sevdesk.base.cache) wird jeder Request an
+die API gesendet, die Daten sind also nie veraltet. Gespart wird nur die
+Uebertragung der Response-Bodies: der gespeicherte Body wird bei jedem
+Treffer erneut dekodiert (jeder Aufruf bekommt eigene Objekte), und der
+Round-Trip bleibt. Schneller wird ein Lauf damit nur, wenn die
+Uebertragung und nicht die Latenz dominiert (grosse Listen, langsame
+Verbindung).
+
+- Key aus API-Token (gehasht), URL und Query-Parametern; mehrere Accounts
+  koennen dieselbe Datenbank verwenden
+- Mehrere Threads und Prozesse koennen dieselbe Datenbank verwenden
+- prune() entfernt lange nicht verwendete Eintraege
+
+Beispiel:
+    from sevdesk.base.httpcache import HTTPCache
+    client = Client('api-token', http_cache=HTTPCache('/var/cache/sevdesk.db'))
+    client = Client('api-token', http_cache='/var/cache/sevdesk.db')
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+class HTTPCacheStats:
+    """Momentaufnahme der Cache-Statistik"""
+
+    __slots__ = ('revalidated', 'misses', 'stored', 'bytes_saved', 'entries')
+
+    def __init__(self, revalidated=0, misses=0, stored=0, bytes_saved=0, entries=0):
+        # 304-Responses, Body kam aus der Datenbank
+        self.revalidated = revalidated
+        # GETs ohne gespeicherten Eintrag oder mit geaenderten Daten
+        self.misses = misses
+        self.stored = stored
+        # Summe der nicht uebertragenen Bodies
+        self.bytes_saved = bytes_saved
+        self.entries = entries
+
+    def __repr__(self):
+        return (f"HTTPCacheStats(revalidated={self.revalidated}, misses={self.misses}, "
+                f"stored={self.stored}, bytes_saved={self.bytes_saved}, entries={self.entries})")
+
+
+class StoredResponse:
+    """Gespeicherte Response mit Validatoren"""
+
+    __slots__ = ('etag', 'last_modified', 'content_type', 'content')
+
+    def __init__(self, etag, last_modified, content_type, content):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_type = content_type
+        self.content = content
+
+    def conditional_headers(self) -> dict:
+        """Header fuer die Revalidierung"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    Args:
+        path: Pfad der SQLite-Datenbank
+        timeout: Wartezeit in Sekunden, wenn ein anderer Prozess schreibt
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        # WAL: Leser werden von einem schreibenden Prozess nicht blockiert
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, content_type TEXT, "
+            "content BLOB NOT NULL, used REAL NOT NULL)"
+        )
+        self._stats = HTTPCacheStats()
+
+    @staticmethod
+    def key(api_token: str, request_url: str, request_params: dict) -> str:
+        params = sorted((k, str(v)) for k, v in request_params.items())
+        return hashlib.sha256(repr((api_token, request_url, params)).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, content_type, content FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+        return StoredResponse(*row) if row else None
+
+    def update(self, key: str, stored: Optional[StoredResponse], response):
+        """
+        Verarbeitet die Response eines GET-Requests.
+
+        Args:
+            stored: Ergebnis von get(key), mit dessen Validatoren der Request gesendet wurde
+            response: requests.Response oder httpx.Response
+
+        Returns:
+            (Status, Content-Type, Body); bei 304 der gespeicherte Body mit Status 200,
+            der wie eine normale Response dekodiert wird
+        """
+        status = response.status_code
+        headers = response.headers
+        if status == 304 and stored is not None:
+            # Die API darf mit dem 304 neue Validatoren senden
+            etag = headers.get('etag') or stored.etag
+            last_modified = headers.get('last-modified') or stored.last_modified
+            with self._lock:
+                self._db.execute(
+                    "UPDATE http_cache SET etag = ?, last_modified = ?, used = ? WHERE key = ?",
+                    (etag, last_modified, time.time(), key)
+                )
+                self._stats.revalidated += 1
+                self._stats.bytes_saved += len(stored.content)
+            return 200, stored.content_type, stored.content
+
+        content_type = headers.get('content-type', '')
+        content = response.content
+        if status != 200:
+            return status, content_type, content
+
+        etag = headers.get('etag')
+        last_modified = headers.get('last-modified')
+        with self._lock:
+            self._stats.misses += 1
+            if etag or last_modified:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO http_cache "
+                    "(key, etag, last_modified, content_type, content, used) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, etag, last_modified, content_type, content, time.time())
+                )
+                self._stats.stored += 1
+            elif stored is not None:
+                # Keine Validatoren mehr, der alte Eintrag kann nie wieder verwendet werden
+                self._db.execute("DELETE FROM http_cache WHERE key = ?", (key,))
+        return status, content_type, content
+
+    def prune(self, max_age: float) -> int:
+        """Entfernt Eintraege, die seit max_age Sekunden nicht verwendet wurden"""
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM http_cache WHERE used < ?", (time.time() - max_age,))
+        return cursor.rowcount
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM http_cache")
+
+    @property
+    def stats(self) -> HTTPCacheStats:
+        with self._lock:
+            stats = self._stats
+            entries = self._db.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+            return HTTPCacheStats(stats.revalidated, stats.misses, stats.stored, stats.bytes_saved, entries)
+
+    def close(self):
+        self._db.close()
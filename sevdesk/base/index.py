@@ -0,0 +1,56 @@
+"""
+Index - Basis fuer In-Memory-Indizes der Helper
+
+Ein Index wird mit einem einzigen Bulk-Abruf aufgebaut und danach lokal
+abgefragt (Dictionary-Zugriff statt Request pro Suche). Er wird beim
+ersten Zugriff geladen und, wenn eine TTL gesetzt ist, nach deren Ablauf
+beim naechsten Zugriff neu geladen. refresh() laedt sofort neu,
+invalidate() beim naechsten Zugriff.
+
+Thread-sicher: waehrend ein Thread den Index laedt, warten die anderen
+auf das Ergebnis statt selbst zu laden.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class Index:
+    """
+    Args:
+        ttl: Sekunden, nach denen der Index neu geladen wird (None = nie automatisch)
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl
+        self._loaded_at = None
+        self._lock = threading.RLock()
+
+    def _load(self):
+        """Baut den Index neu auf (in Unterklassen implementieren)"""
+        raise NotImplementedError
+
+    @property
+    def stale(self) -> bool:
+        loaded_at = self._loaded_at
+        if loaded_at is None:
+            return True
+        return self.ttl is not None and time.monotonic() - loaded_at >= self.ttl
+
+    def ensure(self):
+        """Laedt den Index, falls noch nicht geladen oder abgelaufen"""
+        if self.stale:
+            with self._lock:
+                if self.stale:
+                    self.refresh()
+
+    def refresh(self):
+        """Laedt den Index sofort neu"""
+        with self._lock:
+            self._load()
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        """Der naechste Zugriff laedt den Index neu"""
+        self._loaded_at = None
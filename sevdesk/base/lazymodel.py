@@ -0,0 +1,96 @@
+"""
+LazyModel - Proxy fuer Response-Models mit Validierung beim ersten Zugriff
+
+Haelt das dekodierte JSON-Dict und validiert ein Feld erst, wenn es
+gelesen wird. Fuer Jobs, die aus grossen Listen nur wenige Felder
+benoetigen (response_mode='lazy').
+
+Beispiel:
+    invoices = sevdesk.invoice.getInvoices(response_mode='lazy')
+    for invoice in invoices:
+        print(invoice.id_, invoice.status, invoice.sumGross)
+"""
+
+from functools import lru_cache
+
+from pydantic import TypeAdapter
+
+
+class _LazyField:
+    __slots__ = ('keys', 'annotation', 'default', 'required', '_adapter')
+
+    def __init__(self, name, field):
+        # Zuerst Alias (wie von der API geliefert), dann Feldname
+        self.keys = (field.alias, name) if field.alias else (name,)
+        self.annotation = field.annotation
+        self.required = field.is_required()
+        self.default = None if self.required else field.get_default(call_default_factory=True)
+        self._adapter = None
+
+    def validate(self, value):
+        if self._adapter is None:
+            self._adapter = TypeAdapter(self.annotation)
+        return self._adapter.validate_python(value)
+
+
+@lru_cache(maxsize=None)
+def _lazy_fields(model_class) -> dict:
+    return {name: _LazyField(name, field) for name, field in model_class.model_fields.items()}
+
+
+class LazyModel:
+    """
+    Duenner Proxy um ein API-Dict.
+
+    Felder werden beim ersten Zugriff validiert und danach am Objekt
+    gespeichert. model_instance() liefert das vollstaendig validierte Model.
+    """
+
+    def __init__(self, model_class, data: dict):
+        object.__setattr__(self, '_model_class', model_class)
+        object.__setattr__(self, '_data', data)
+
+    def __getattr__(self, name):
+        # Wird nur aufgerufen, wenn das Feld noch nicht validiert wurde
+        if name.startswith('_'):
+            raise AttributeError(name)
+        field = _lazy_fields(self._model_class).get(name)
+        if field is None:
+            raise AttributeError(f"'{self._model_class.__name__}' hat kein Feld '{name}'")
+
+        data = self._data
+        for key in field.keys:
+            if key in data:
+                value = field.validate(data[key])
+                break
+        else:
+            if field.required:
+                raise AttributeError(f"Pflichtfeld '{name}' fehlt in der Response")
+            value = field.default
+
+        object.__setattr__(self, name, value)
+        return value
+
+    @property
+    def model_raw(self) -> dict:
+        """Das unveraenderte Dict aus der API-Response"""
+        return self._data
+
+    def model_instance(self):
+        """Validiert alle Felder und liefert das vollstaendige Model"""
+        return self._model_class(**self._data)
+
+    def __repr__(self):
+        return f"Lazy{self._model_class.__name__}({self._data!r})"
+
+
+def lazy_list(model_class, items: list) -> list:
+    if not isinstance(model_class, type) or not hasattr(model_class, 'model_fields'):
+        return items
+    return [LazyModel(model_class, item) if isinstance(item, dict) else item for item in items]
+
+
+def lazy(model_class, data: dict):
+    if not isinstance(model_class, type) or not hasattr(model_class, 'model_fields'):
+        return data
+    return LazyModel(model_class, data)
@@ -0,0 +1,21 @@
+"""
+Schnelle Erzeugung von Response-Models
+
+- validate_list(): validiert ein komplettes 'objects'-Array mit einem
+  gecachten TypeAdapter in einem Aufruf
+"""
+
+from functools import lru_cache
+
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model_class) -> TypeAdapter:
+    """Gecachter TypeAdapter fuer list[model_class]"""
+    return TypeAdapter(list[model_class])
+
+
+def validate_list(model_class, items: list) -> list:
+    """Validiert eine Liste von Dicts in einem Aufruf"""
+    return list_adapter(model_class).validate_python(items)
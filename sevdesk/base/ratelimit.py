@@ -0,0 +1,175 @@
+"""
+Client-seitiges Rate-Limiting (Token Bucket)
+
+Jeder Request verbraucht ein Token, pro Sekunde kommen 'rate' Tokens hinzu,
+hoechstens 'burst' Tokens koennen angespart werden. Statt nach einem
+HTTP 429 zu warten, wird vor jedem Request genau so lange gewartet, dass
+das Kontingent ausgeschoepft, aber nie ueberschritten wird.
+
+Der Zustand liegt in einem Backend:
+- MemoryBackend: ein Prozess, beliebig viele Threads (Standard)
+- FileBackend: mehrere Prozesse auf einem Rechner (Datei + fcntl.flock)
+- SQLiteBackend: mehrere Prozesse, mehrere Buckets in einer Datenbank
+
+Beispiel:
+    from sevdesk.base.ratelimit import RateLimiter, SQLiteBackend
+    limiter = RateLimiter(rate=10, burst=10, backend=SQLiteBackend('/tmp/sevdesk-rate.db'))
+    client = Client('api-token', rate_limit=limiter)
+"""
+
+import os
+import sqlite3
+import struct
+import threading
+import time
+from typing import Optional
+
+
+def _take(tokens, updated, now, rate, burst, count):
+    """
+    Token-Bucket-Rechnung mit Reservierung.
+
+    Der Bestand darf negativ werden: jeder Aufrufer reserviert sein Token
+    sofort und erhaelt die Wartezeit, nach der es verfuegbar ist.
+
+    Returns:
+        (neuer Bestand, Wartezeit in Sekunden)
+    """
+    tokens = min(burst, tokens + max(now - updated, 0.0) * rate) - count
+    return tokens, (-tokens / rate if tokens < 0 else 0.0)
+
+
+class MemoryBackend:
+    """Bucket im Speicher, geteilt von allen Threads eines Prozesses"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = None
+
+    def reserve(self, rate: float, burst: float, count: float = 1) -> float:
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._state or (burst, now)
+            tokens, wait = _take(tokens, updated, now, rate, burst, count)
+            self._state = (tokens, now)
+        return wait
+
+
+class FileBackend:
+    """
+    Bucket in einer Datei, geteilt von allen Prozessen auf diesem Rechner.
+
+    Die Datei wird per fcntl.flock gesperrt (nur POSIX). Da flock pro
+    Datei-Deskriptor gilt, serialisiert zusaetzlich ein Lock die Threads
+    des eigenen Prozesses.
+    """
+
+    _FORMAT = struct.Struct('dd')
+
+    def __init__(self, path: str):
+        import fcntl
+        self._fcntl = fcntl
+        self.path = path
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def reserve(self, rate: float, burst: float, count: float = 1) -> float:
+        with self._lock:
+            self._fcntl.flock(self._fd, self._fcntl.LOCK_EX)
+            try:
+                # Wanduhr, da die Zeit prozessuebergreifend vergleichbar sein muss
+                now = time.time()
+                data = os.pread(self._fd, self._FORMAT.size, 0)
+                if len(data) == self._FORMAT.size:
+                    tokens, updated = self._FORMAT.unpack(data)
+                else:
+                    tokens, updated = burst, now
+                tokens, wait = _take(tokens, updated, now, rate, burst, count)
+                os.pwrite(self._fd, self._FORMAT.pack(tokens, now), 0)
+            finally:
+                self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
+        return wait
+
+    def close(self):
+        os.close(self._fd)
+
+
+class SQLiteBackend:
+    """
+    Bucket in einer SQLite-Datenbank, geteilt von allen Prozessen.
+
+    Mit unterschiedlichen Keys (z.B. pro sevDesk-Account) koennen mehrere
+    Buckets in derselben Datenbank liegen.
+    """
+
+    def __init__(self, path: str, key: str = 'default', timeout: float = 30.0):
+        self.path = path
+        self.key = key
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def reserve(self, rate: float, burst: float, count: float = 1) -> float:
+        with self._lock:
+            # BEGIN IMMEDIATE sperrt die Datenbank fuer andere Schreiber
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._db.execute(
+                    "SELECT tokens, updated FROM rate_limit WHERE key = ?", (self.key,)
+                ).fetchone()
+                tokens, updated = row or (burst, now)
+                tokens, wait = _take(tokens, updated, now, rate, burst, count)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO rate_limit (key, tokens, updated) VALUES (?, ?, ?)",
+                    (self.key, tokens, now)
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return wait
+
+    def close(self):
+        self._db.close()
+
+
+class RateLimiter:
+    """
+    Token Bucket fuer Client.request.
+
+    Args:
+        rate: Erlaubte Requests pro Sekunde
+        burst: Maximal angesparte Requests (Standard: rate, mindestens 1)
+        backend: MemoryBackend (Standard), FileBackend oder SQLiteBackend
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, backend=None):
+        if rate <= 0:
+            raise ValueError("rate muss groesser als 0 sein")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(int(rate), 1))
+        self.backend = backend or MemoryBackend()
+
+    def reserve(self, count: float = 1) -> float:
+        """Reserviert Tokens und liefert die Wartezeit in Sekunden"""
+        return self.backend.reserve(self.rate, self.burst, count)
+
+    def acquire(self, count: float = 1):
+        """Blockiert, bis die Tokens verfuegbar sind"""
+        wait = self.reserve(count)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, count: float = 1):
+        """Wie acquire(), fuer asyncio"""
+        wait = self.reserve(count)
+        if wait > 0:
+            import asyncio
+            await asyncio.sleep(wait)
+
+    def __repr__(self):
+        return f"RateLimiter(rate={self.rate}, burst={self.burst}, backend={type(self.backend).__name__})"
@@ -0,0 +1,216 @@
+"""
+Wiederholung fehlgeschlagener Requests
+
+RetryPolicy entscheidet nach einem Fehlversuch, ob und nach welcher
+Wartezeit ein Request wiederholt wird:
+- Statuscodes 429 und 5xx (konfigurierbar) sowie Verbindungsfehler
+- Standardmaessig gelten nur GET, HEAD und OPTIONS als idempotent; viele
+  PUTs der API sind Aktionen (bookAmount, sendBy, enshrine, resetTo...),
+  die bei jeder Ausfuehrung etwas aendern. Andere Methoden werden nur bei
+  Status wiederholt, bei denen die API den Request sicher nicht
+  verarbeitet hat (429), nie nach 5xx, Timeout oder Verbindungsabbruch
+- Die Aktionen oben werden auch dann nicht nach 5xx/Verbindungsfehlern
+  wiederholt, wenn PUT per idempotent_methods freigegeben ist
+- Exponentielles Backoff mit Jitter, Retry-After wird beachtet
+- Obergrenzen pro Request (max_retries, max_elapsed) und optional ein
+  gemeinsames RetryBudget fuer alle Requests, damit bei einem laengeren
+  Ausfall keine Retry-Lawine entsteht
+- Hooks on_retry/on_giveup (z.B. fuer Metriken)
+
+Beispiel:
+    from sevdesk.base.retry import RetryPolicy, RetryBudget
+    policy = RetryPolicy(max_retries=5, budget=RetryBudget(ratio=0.2),
+                         on_retry=lambda event: metrics.incr('sevdesk.retry', tags=[event.reason]))
+    client = Client('api-token', retry=policy)
+"""
+
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+# Endpoints, die bei jeder Ausfuehrung etwas aendern (z.B. eine Zahlung buchen)
+NON_IDEMPOTENT_ACTIONS = re.compile(r'/(bookAmount|sendBy|enshrine|resetTo\w*)/?$', re.IGNORECASE)
+
+
+class RetryEvent:
+    """Informationen zu einem Fehlversuch (Argument fuer on_retry/on_giveup)"""
+
+    __slots__ = ('method', 'url', 'attempt', 'status_code', 'exception', 'delay', 'reason')
+
+    def __init__(self, method, url, attempt, status_code=None, exception=None, delay=None, reason=None):
+        self.method = method
+        self.url = url
+        # Nummer des fehlgeschlagenen Versuchs (1 = erster Versuch)
+        self.attempt = attempt
+        self.status_code = status_code
+        self.exception = exception
+        # Wartezeit bis zum naechsten Versuch (on_retry)
+        self.delay = delay
+        # on_retry: 'status' / 'exception'
+        # on_giveup: 'not_retryable', 'max_retries', 'max_elapsed', 'retry_after', 'budget'
+        self.reason = reason
+
+    def __repr__(self):
+        return (f"RetryEvent({self.method} {self.url}, attempt={self.attempt}, "
+                f"status_code={self.status_code}, delay={self.delay}, reason={self.reason!r})")
+
+
+class RetryBudget:
+    """
+    Gemeinsames Kontingent fuer Wiederholungen (thread-sicher).
+
+    Jeder Request zahlt 'ratio' ein, jede Wiederholung kostet 1. Auf Dauer
+    sind so hoechstens ratio * Requests Wiederholungen moeglich; zu Beginn
+    stehen min_retries zur Verfuegung, angespart werden hoechstens max_balance.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, max_balance: int = 100):
+        self.ratio = ratio
+        self.max_balance = max_balance
+        self._balance = float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._balance = min(self._balance + self.ratio, self.max_balance)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Retry-After als Sekunden oder HTTP-Datum -> Wartezeit in Sekunden"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Args:
+        max_retries: Maximale Wiederholungen pro Request (0 = keine)
+        backoff: Basis-Wartezeit in Sekunden, verdoppelt sich pro Versuch
+        max_backoff: Obergrenze fuer eine einzelne Wartezeit
+        jitter: Wartezeit zufaellig zwischen 0 und dem Backoff waehlen (Full Jitter)
+        max_elapsed: Maximale Gesamtdauer eines Requests inkl. Wartezeiten (None = unbegrenzt)
+        retry_statuses: Statuscodes, die wiederholt werden
+        always_retry_statuses: Statuscodes, die auch bei nicht idempotenten
+                               Requests wiederholt werden
+        idempotent_methods: Methoden, die auch nach 5xx und Verbindungsfehlern
+                            wiederholt werden (z.B. IDEMPOTENT_METHODS | {'DELETE'});
+                            NON_IDEMPOTENT_ACTIONS sind immer ausgenommen
+        max_retry_after: Laengere Retry-After-Angaben fuehren zum Abbruch
+        budget: Gemeinsames RetryBudget (optional, kann mehreren Clients gehoeren)
+        on_retry: Wird vor jeder Wiederholung mit einem RetryEvent aufgerufen
+        on_giveup: Wird aufgerufen, wenn ein wiederholbarer Fehler nicht mehr wiederholt wird
+    """
+
+    def __init__(self, max_retries: int = 3, backoff: float = 0.5, max_backoff: float = 30.0,
+                 jitter: bool = True, max_elapsed: Optional[float] = 120.0,
+                 retry_statuses=(429, 500, 502, 503, 504), always_retry_statuses=(429,),
+                 idempotent_methods=IDEMPOTENT_METHODS,
+                 max_retry_after: float = 300.0, budget: Optional[RetryBudget] = None,
+                 on_retry: Optional[Callable[[RetryEvent], None]] = None,
+                 on_giveup: Optional[Callable[[RetryEvent], None]] = None):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.max_elapsed = max_elapsed
+        self.retry_statuses = frozenset(retry_statuses)
+        self.always_retry_statuses = frozenset(always_retry_statuses)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.on_retry = on_retry
+        self.on_giveup = on_giveup
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def is_idempotent(self, method: str, url: str) -> bool:
+        # Controller uebergeben die Methode klein geschrieben ('get')
+        return (method.upper() in self.idempotent_methods
+                and NON_IDEMPOTENT_ACTIONS.search(url) is None)
+
+    def started(self):
+        """Wird einmal pro Request (nicht pro Versuch) aufgerufen"""
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def backoff_delay(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def next_delay(self, method: str, url: str, attempt: int, started: float,
+                   status_code: Optional[int] = None, exception: Optional[BaseException] = None,
+                   retry_after=None) -> Optional[float]:
+        """
+        Wartezeit bis zum naechsten Versuch oder None (nicht wiederholen).
+
+        Args:
+            attempt: Nummer des fehlgeschlagenen Versuchs (1 = erster)
+            started: time.monotonic() beim ersten Versuch
+            status_code: Status der Response (None bei exception)
+            exception: Verbindungsfehler/Timeout
+            retry_after: Wert des Retry-After-Headers
+        """
+        event = RetryEvent(method, url, attempt, status_code, exception)
+
+        idempotent = self.is_idempotent(method, url)
+        if exception is not None:
+            retryable = idempotent
+        else:
+            retryable = status_code in self.retry_statuses and (
+                idempotent or status_code in self.always_retry_statuses
+            )
+        if not retryable:
+            return self._giveup(event, 'not_retryable')
+        if attempt > self.max_retries:
+            return self._giveup(event, 'max_retries')
+
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.backoff_delay(attempt)
+        elif delay > self.max_retry_after:
+            return self._giveup(event, 'retry_after')
+
+        if self.max_elapsed is not None and time.monotonic() - started + delay > self.max_elapsed:
+            return self._giveup(event, 'max_elapsed')
+        if self.budget is not None and not self.budget.withdraw():
+            return self._giveup(event, 'budget')
+
+        event.delay = delay
+        event.reason = 'exception' if exception is not None else 'status'
+        if self.on_retry is not None:
+            self.on_retry(event)
+        return delay
+
+    def _giveup(self, event, reason):
+        event.reason = reason
+        if self.on_giveup is not None and reason != 'not_retryable':
+            self.on_giveup(event)
+        return None
+
+    def __repr__(self):
+        return (f"RetryPolicy(max_retries={self.max_retries}, backoff={self.backoff}, "
+                f"max_backoff={self.max_backoff}, retry_statuses={sorted(self.retry_statuses)})")
@@ -0,0 +1,83 @@
+"""
+Single-Flight - Zusammenfassen gleichzeitiger, identischer Requests
+
+Laeuft fuer einen Key bereits ein Request, warten weitere Aufrufer auf
+dessen Ergebnis, statt einen eigenen Request zu senden. Es wird nichts
+zwischengespeichert: sobald der Request beendet ist, loest der naechste
+Aufruf wieder einen neuen Request aus.
+
+Der Client fasst so identische GET-Requests (Methode, URL und
+Query-Parameter) zusammen, jedoch nicht ueber eine eigene Aenderung
+hinweg (siehe BaseClient._flight_key). Geteilt wird die HTTP-Response, jeder Aufrufer
+dekodiert und validiert sie selbst und erhaelt eigene Objekte.
+"""
+
+import threading
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Single-Flight fuer Threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        # Anzahl der Aufrufe, die ein laufendes Ergebnis mitbenutzt haben
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        """Fuehrt fn() aus oder wartet auf den laufenden Aufruf mit demselben Key"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Single-Flight fuer asyncio (innerhalb eines Event-Loops)"""
+
+    def __init__(self):
+        self._calls = {}
+        self.coalesced = 0
+
+    async def do(self, key, coro_fn):
+        """Wie SingleFlight.do(), coro_fn liefert eine Coroutine"""
+        import asyncio
+
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(coro_fn())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        # shield: ein abgebrochener Aufrufer bricht den gemeinsamen Request nicht ab
+        return await asyncio.shield(task)
@@ -0,0 +1,78 @@
+"""
+Transport - Konfiguration der HTTP-Verbindungen
+
+Pool-Groesse, Timeouts und TCP-Keep-Alive fuer Client und AsyncClient.
+Die Clients erzeugen daraus ihre Session (requests bzw. httpx).
+Bei vielen parallelen Threads sollte pool_maxsize mindestens der Anzahl
+der Worker entsprechen, sonst verwirft urllib3 Verbindungen
+("Connection pool is full") und es entstehen neue TLS-Handshakes.
+
+Beispiel:
+    from sevdesk.base.transport import Transport
+    client = Client('api-token', transport=Transport(pool_maxsize=32, read_timeout=30))
+"""
+
+import socket
+from typing import Optional
+
+# Standard-Socket-Optionen von urllib3 (HTTPConnection.default_socket_options)
+_DEFAULT_SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+
+class Transport:
+    """
+    Verbindungs-Einstellungen fuer den Client.
+
+    Args:
+        pool_connections: Anzahl gecachter Pools (ein Pool pro Host)
+        pool_maxsize: Maximale Anzahl offener Verbindungen pro Pool
+        pool_block: True = bei vollem Pool auf eine freie Verbindung warten,
+                    statt eine zusaetzliche (nicht wiederverwendete) zu oeffnen
+        connect_timeout: Timeout fuer den Verbindungsaufbau in Sekunden (None = unbegrenzt)
+        read_timeout: Timeout zwischen zwei empfangenen Bytes in Sekunden (None = unbegrenzt)
+        keepalive: TCP-Keep-Alive fuer gepoolte Verbindungen aktivieren
+        keepalive_idle: Sekunden Leerlauf bis zur ersten Keep-Alive-Probe
+        keepalive_interval: Sekunden zwischen zwei Probes
+        keepalive_count: Anzahl unbeantworteter Probes bis zum Verbindungsabbruch
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 connect_timeout: Optional[float] = 10.0, read_timeout: Optional[float] = 120.0,
+                 keepalive: bool = True, keepalive_idle: int = 60, keepalive_interval: int = 10,
+                 keepalive_count: int = 5):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.keepalive = keepalive
+        self.keepalive_idle = keepalive_idle
+        self.keepalive_interval = keepalive_interval
+        self.keepalive_count = keepalive_count
+
+    @property
+    def timeout(self):
+        """Timeout im Format von requests: (connect, read)"""
+        return (self.connect_timeout, self.read_timeout)
+
+    def socket_options(self) -> list:
+        """Socket-Optionen fuer neue Verbindungen (Standard von urllib3 + Keep-Alive)"""
+        options = list(_DEFAULT_SOCKET_OPTIONS)
+        if not self.keepalive:
+            return options
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # Die Feineinstellungen sind plattformabhaengig
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keepalive_idle))
+        elif hasattr(socket, 'TCP_KEEPALIVE'):  # macOS
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, self.keepalive_idle))
+        if hasattr(socket, 'TCP_KEEPINTVL'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.keepalive_interval))
+        if hasattr(socket, 'TCP_KEEPCNT'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.keepalive_count))
+        return options
+
+    def __repr__(self):
+        return (f"Transport(pool_connections={self.pool_connections}, pool_maxsize={self.pool_maxsize}, "
+                f"pool_block={self.pool_block}, timeout={self.timeout}, keepalive={self.keepalive})")
+
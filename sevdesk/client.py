@@ -1,123 +1,189 @@
+import time
+
 import requests
-import re
-import importlib
-from pathlib import Path
-
-class Dummy:
-    pass
-
-# Importiere Helper
-from sevdesk.helpers import (
-    ContactHelper, InvoiceHelper, LetterHelper, BankHelper,
-    VoucherHelper, OrderHelper, CreditNoteHelper, PartHelper
-)
-
-class Client:
-
-    def __init__(self, api_token, api_base='https://my.sevdesk.de/api/v1', session=None):
-        self.api_token = api_token
-        self.api_base = api_base
-        self.session = session
-        if not self.session:
-            self.session = requests.Session()
-
-        # Automatisch alle Controller laden
-        controllers_dir = Path(__file__).parent / "controllers"
-        self._load_controllers(controllers_dir, self, "sevdesk.controllers")
-        
-        self.undocumented = Dummy()
-        controllers_dir2 = Path(__file__).parent / "undocumented" / "controllers"
-        self._load_controllers(controllers_dir2, self.undocumented, "sevdesk.undocumented.controllers")
-        
-        # Helper laden
-        self.contactHelper = ContactHelper(self)
-        self.invoiceHelper = InvoiceHelper(self)
-        self.letterHelper = LetterHelper(self)
-        self.bankHelper = BankHelper(self)
-        self.voucherHelper = VoucherHelper(self)
-        self.orderHelper = OrderHelper(self)
-        self.creditNoteHelper = CreditNoteHelper(self)
-        self.partHelper = PartHelper(self)
-
-
-    def _load_controllers(self, controllers_dir, target, module_path):
-        """Lädt automatisch alle Controller aus dem controllers Verzeichnis"""
-        # controllers_dir = Path(__file__).parent / "controllers"
-        
-        if not controllers_dir.exists():
-            return
-        
-        for controller_file in controllers_dir.glob("*_controller.py"):
-            # z.B. "contact_controller.py" -> "contact"
-            controller_name = controller_file.stem.replace("_controller", "")
-            
-            try:
-                # Dynamisch importieren
-                module = importlib.import_module(f"{module_path}.{controller_file.stem}")
-                
-                # Finde die Controller-Klasse im Modul (endet mit "Controller")
-                # Wichtig: Nur Klassen die IN DIESEM Modul definiert sind, nicht importierte
-                controller_class = None
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (isinstance(attr, type) and
-                        attr_name.endswith("Controller") and
-                        attr_name != "BaseController" and
-                        attr.__module__ == module.__name__):  # Nur aus diesem Modul!
-                        controller_class = attr
-                        break
-                
-                if controller_class:
-                    # Als Attribut setzen: self.contact = ContactController(self)
-                    setattr(target, controller_name, controller_class(self))
-                else:
-                    print(f"Warning: No controller class found in {controller_file.stem}")
-                
-            except (ImportError, AttributeError) as e:
-                print(f"Warning: Could not load controller {controller_name}: {e}")
-
-    def request(self, method, path, params):
-        url_params = re.findall(r"{(\w+)}", path)
-        request_path = path.format(**params)
-        
-        request_params = {
-            k: v for k, v in params.items()
-            if k not in url_params and
-            k != 'body' and
-            v} # v not None
-        request_url = f'{self.api_base}{request_path}'
-        request_body = params.get('body', None)
-        if request_body:
-            request_body = request_body.model_dump(by_alias=True, exclude_none=True)
-
-        # print('request_params', request_params)
-        # print('request_url', request_url)
-        # print('request_body', request_body)
-
-        response = self.session.request(
-            method=method,
-            url=request_url,
-            params=request_params,
-            json=request_body,
-            headers={
-                'Authorization': self.api_token
-            }
+from requests.adapters import HTTPAdapter
+
+from sevdesk.base.baseclient import BaseClient
+from sevdesk.base.download import CHUNK_SIZE, DownloadTarget
+from sevdesk.base.exceptions import HTTPError
+from sevdesk.base.retry import RetryPolicy
+from sevdesk.base.singleflight import SingleFlight
+from sevdesk.base.transport import Transport
+from sevdesk.registry import CONTROLLERS
+
+# Helper werden wie die Controller erst beim ersten Zugriff geladen
+# Attributname -> (Modul, Klasse)
+HELPERS = {
+    'contactHelper': ('sevdesk.helpers.contact_helper', 'ContactHelper'),
+    'invoiceHelper': ('sevdesk.helpers.invoice_helper', 'InvoiceHelper'),
+    'letterHelper': ('sevdesk.helpers.letter_helper', 'LetterHelper'),
+    'bankHelper': ('sevdesk.helpers.bank_helper', 'BankHelper'),
+    'voucherHelper': ('sevdesk.helpers.voucher_helper', 'VoucherHelper'),
+    'orderHelper': ('sevdesk.helpers.order_helper', 'OrderHelper'),
+    'creditNoteHelper': ('sevdesk.helpers.creditnote_helper', 'CreditNoteHelper'),
+    'partHelper': ('sevdesk.helpers.part_helper', 'PartHelper'),
+    'documentHelper': ('sevdesk.helpers.document_helper', 'DocumentHelper'),
+    'sevUserHelper': ('sevdesk.helpers.sevuser_helper', 'SevUserHelper'),
+}
+
+
+class TransportAdapter(HTTPAdapter):
+    """HTTPAdapter mit Pool-Groesse und Socket-Optionen (Keep-Alive) aus einem Transport"""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['socket_options']
+
+    def __init__(self, transport: Transport):
+        self.socket_options = transport.socket_options()
+        super().__init__(
+            pool_connections=transport.pool_connections,
+            pool_maxsize=transport.pool_maxsize,
+            pool_block=transport.pool_block
+        )
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs['socket_options'] = self.socket_options
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+class Client(BaseClient):
+    """
+    Synchroner Client auf Basis von requests.
+
+    Thread-sicher: ein Client kann von beliebig vielen Threads gleichzeitig
+    verwendet werden. Alle Requests laufen ueber self.session (eine
+    uebergebene oder eine mit TransportAdapter erzeugte); Einstellungen an
+    client.session (Header, Proxies, Auth, Adapter) gelten also fuer alle
+    Threads. Geteilt wird nur der Request-Pfad: Connection-Pool (urllib3)
+    und Cookie-Jar sind thread-sicher, Session-Einstellungen sollten aber
+    nicht geaendert werden, waehrend andere Threads Requests senden.
+
+    Objekte wie InvoiceExt/OrderExt sind nicht thread-sicher und sollten
+    jeweils nur in einem Thread bearbeitet werden.
+    """
+
+    _lazy_registry = {**CONTROLLERS, **HELPERS}
+
+    def __init__(self, api_token, api_base='https://my.sevdesk.de/api/v1', session=None,
+                 response_mode='validate', codec=None, transport: Transport = None, rate_limit=None,
+                 retry: RetryPolicy = None, coalesce: bool = True, cache=None, http_cache=None):
+        # Pool, Timeouts und Keep-Alive; bei eigener session gelten nur die Timeouts
+        self.transport = transport or Transport()
+        if session:
+            self.session = session
+        else:
+            self.session = self._create_session(TransportAdapter(self.transport))
+        # Gleichzeitige identische GETs teilen sich einen Request
+        self._single_flight = SingleFlight() if coalesce else None
+
+        super().__init__(api_token, api_base, response_mode, codec, rate_limit, retry, cache, http_cache)
+
+    @staticmethod
+    def _create_session(adapter: HTTPAdapter) -> requests.Session:
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def request(self, method, path, params, endpoint=None):
+        request_url, request_params, request_body = self._build_request(path, params, endpoint)
+        cache_key, cached, generation = self._cache_lookup(
+            endpoint, method, params, request_url, request_params
         )
-        # print(response.status_code)
-        # print(response.text)
-        content_type = response.headers.get('content-type', '').lower()
-        
-        # PDF oder andere Binary-Daten
-        if 'application/pdf' in content_type:
-            return response.content
-        
-        # Andere Binary-Formate
-        elif any(binary_type in content_type for binary_type in [
-            'application/octet-stream',
-            'image/',
-            'application/zip',
-            'application/xml'  # Für invoiceGetXml
-        ]):
-            return response.content
+        if cached is not None:
+            return self._decode_response(*cached)
+
+        def send():
+            http_cache_key, stored, headers = self._revalidation(method, request_url, request_params)
+            response = self._send(method, request_url, request_params, request_body, headers)
+            result = self._result(http_cache_key, stored, response)
+            self._cache_store(cache_key, generation, result)
+            return result
+
+        key = self._flight_key(method, request_url, request_params) if self._single_flight else None
+        if key is not None:
+            result = self._single_flight.do(key, send)
         else:
-            return response.json()
\ No newline at end of file
+            try:
+                result = send()
+            finally:
+                # Auch bei Fehlern, die Aenderung kann trotzdem ausgefuehrt worden sein
+                self._cache_invalidate(method, path, params)
+        return self._decode_response(*result[1:])
+
+    def stream(self, method, path, params, endpoint=None, chunk_size: int = CHUNK_SIZE):
+        """
+        Generator ueber den Response-Body in Bloecken von chunk_size Bytes.
+
+        Der Request wird beim ersten Iterieren gesendet und geht an
+        ResponseCache, HTTPCache und Single-Flight vorbei. Ein Fehlerstatus
+        loest HTTPError aus.
+        """
+        request_url, request_params, request_body = self._build_request(path, params, endpoint)
+        response = self._send(method, request_url, request_params, request_body, stream=True)
+        try:
+            # Ein Fehler-Body darf nicht in der Zieldatei landen
+            if response.status_code >= 400:
+                raise HTTPError(method, request_url, response.status_code, response.content)
+            yield from response.iter_content(chunk_size)
+        finally:
+            response.close()
+
+    def download(self, method, path, params, target, endpoint=None, chunk_size: int = CHUNK_SIZE) -> int:
+        """
+        Schreibt den Response-Body blockweise in target (Dateipfad oder Datei-Objekt).
+
+        Returns:
+            Anzahl geschriebener Bytes
+        """
+        sink = DownloadTarget(target)
+        try:
+            for chunk in self.stream(method, path, params, endpoint, chunk_size):
+                sink.write(chunk)
+        except BaseException:
+            sink.abort()
+            raise
+        return sink.commit()
+
+    def _send(self, method, url, params, body, headers=None, stream=False) -> requests.Response:
+        """Sendet einen Request und wiederholt ihn gemaess self.retry"""
+        retry = self.retry
+        retry.started()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=body,
+                    headers=self._headers(body, headers),
+                    timeout=self.transport.timeout,
+                    stream=stream
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = retry.next_delay(method, url, attempt, started, exception=e)
+                if delay is None:
+                    raise
+            else:
+                if not retry.is_retryable_status(response.status_code):
+                    return response
+                delay = retry.next_delay(
+                    method, url, attempt, started,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get('Retry-After')
+                )
+                if stream:
+                    # Fehler-Body lesen, sonst wird die Verbindung verworfen statt wiederverwendet
+                    response.content
+                    response.close()
+                if delay is None:
+                    raise HTTPError(method, url, response.status_code, response.content, attempt)
+            time.sleep(delay)
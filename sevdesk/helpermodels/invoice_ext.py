@@ -3,7 +3,7 @@ InvoiceExt - Erweiterte Invoice-Klasse mit High-Level Funktionen
 
 Diese Klasse erweitert das Standard-Invoice-Modell mit praktischen Methoden:
 - addPosition() - Positionen hinzufügen
-- save() - Als Draft oder fertig speichern
+- save() - Als Draft oder fertig speichern (Rechnung und Positionen in einem Request)
 - getPDF() - PDF generieren
 - render() - Als PDF rendern
 """
@@ -87,7 +87,8 @@ class InvoiceExt(InvoiceBase):
 
     def save(self, status: str = "100") -> 'InvoiceExt':
         """
-        Speichert die Rechnung auf sevDesk.
+        Speichert die Rechnung samt Positionen in einem Request
+        (Factory/saveInvoice).
 
         Args:
             status: Status der Rechnung
@@ -96,6 +97,9 @@ class InvoiceExt(InvoiceBase):
 
         Returns:
             self mit gesetzter ID (für Method-Chaining)
+
+        Raises:
+            PositionError: ungueltige Positionen (es wurde nichts gespeichert)
         """
         if not self._client:
             raise RuntimeError("Client nicht gesetzt. Verwende InvoiceHelper.new() oder setzen Sie _set_client()")
@@ -103,61 +107,68 @@ class InvoiceExt(InvoiceBase):
         # Invoice-Model vorbereiten mit aktuellem Status
         self.status = status
 
-        # Über undocumented Controller speichern
-        result = self._client.undocumented.invoice.createInvoice(body=self)
-
-        # ID aus Response extrahieren
-        if hasattr(result, 'id_'):
-            self._saved_id = result.id_
-        elif hasattr(result, 'id'):
-            self._saved_id = result.id
-        elif isinstance(result, dict):
-            self._saved_id = result.get('id') or result.get('id_')
+        # Positionen vorab pruefen, damit alle Fehler auf einmal gemeldet werden
+        positions = self._position_payloads()
 
-        if not self._saved_id:
-            raise RuntimeError("Konnte Invoice-ID nicht aus Response extrahieren")
+        # Rechnung und Positionen in einem Request ueber Factory/saveInvoice
+        # (SaveInvoice-Model umgangen, invoice ist dort faelschlich als str typisiert)
+        request_body = {"invoice": self.model_dump(by_alias=True, exclude_none=True)}
+        if positions:
+            request_body["invoicePosSave"] = positions
+        result = self._client.request('POST', '/Invoice/Factory/saveInvoice', {'body': request_body})
 
-        # Positionen hinzufügen, falls vorhanden
-        if self._pending_positions:
-            self._save_positions()
+        # ID aus Response extrahieren
+        saved_id = None
+        if isinstance(result, dict):
+            objects = result.get('objects') or {}
+            invoice_obj = objects.get('invoice') if isinstance(objects, dict) else None
+            if invoice_obj:
+                saved_id = invoice_obj.get('id') or invoice_obj.get('id_')
+            else:
+                saved_id = result.get('id')
+
+        if not saved_id:
+            raise RuntimeError(f"Konnte Invoice-ID nicht aus Response extrahieren: {result}")
+        self._saved_id = int(saved_id)
 
+        self._pending_positions = []
         return self
 
-    def _save_positions(self):
-        """Intern: Speichert alle pending Positionen via InvoicePos Controller."""
+    def _position_payloads(self) -> List[dict]:
+        """
+        Intern: Wandelt die vorgemerkten Positionen in InvoicePos-Dicts fuer
+        invoicePosSave um. Ungueltige Positionen werden gesammelt und als
+        PositionError gemeldet.
+        """
+        from sevdesk.base.exceptions import PositionError
         from sevdesk.models.invoicepos import InvoicePos
-        from sevdesk.converters.invoice import Invoice
         from sevdesk.converters.unity import Unity
 
-        if not self._saved_id:
-            raise RuntimeError("Rechnung muss zuerst gespeichert werden")
-
-        for pos_data in self._pending_positions:
-            # InvoicePos-Objekt erstellen
+        positions = []
+        failures = []
+        for index, pos_data in enumerate(self._pending_positions):
             # Hinweis: price wird je nach showNet-Einstellung der Rechnung
-            # als Netto (showNet=True) oder Brutto (showNet=False) interpretiert
-            pos_kwargs = {
-                "objectName": "InvoicePos",
-                "invoice": Invoice(id_=self._saved_id, objectName="Invoice"),
-                "quantity": pos_data["quantity"],
-                "name": pos_data["name"],
-                "unity": Unity(id_=1, objectName="Unity"),  # 1 = Stueck
-                "taxRate": pos_data.get("taxRate", 19.0),
-                "text": pos_data.get("text"),
-                "price": pos_data.get("price"),
-                "mapAll": True
-            }
-
-            invoice_pos = InvoicePos(**pos_kwargs)
-
-            # Position über Controller speichern
+            # als Netto (showNet=True) oder Brutto (showNet=False) interpretiert.
+            # Die Zuordnung zur Rechnung uebernimmt die Factory.
             try:
-                self._client.undocumented.invoicepos.createInvoicePos(body=invoice_pos)
+                invoice_pos = InvoicePos(
+                    objectName="InvoicePos",
+                    quantity=pos_data["quantity"],
+                    name=pos_data["name"],
+                    unity=Unity(id_=1, objectName="Unity"),  # 1 = Stueck
+                    taxRate=pos_data.get("taxRate", 19.0),
+                    text=pos_data.get("text"),
+                    price=pos_data.get("price"),
+                    mapAll=True
+                )
             except Exception as e:
-                print(f"Warnung: Position '{pos_data['name']}' konnte nicht gespeichert werden: {e}")
+                failures.append((index, pos_data.get("name"), e))
+                continue
+            positions.append(invoice_pos.model_dump(by_alias=True, exclude_none=True))
 
-        # Pending Positionen leeren
-        self._pending_positions = []
+        if failures:
+            raise PositionError(failures)
+        return positions
 
     def render(self) -> str:
         """
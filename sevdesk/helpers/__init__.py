@@ -1,13 +1,30 @@
-from .contact_helper import ContactHelper
-from .invoice_helper import InvoiceHelper
-from .letter_helper import LetterHelper
-from .bank_helper import BankHelper
-from .voucher_helper import VoucherHelper
-from .order_helper import OrderHelper
-from .creditnote_helper import CreditNoteHelper
-from .part_helper import PartHelper
+# Helper werden erst beim ersten Zugriff importiert, damit
+# "from sevdesk.helpers.contact_helper import ..." nicht alle Helper laedt
+_HELPER_MODULES = {
+    'ContactHelper': 'contact_helper',
+    'InvoiceHelper': 'invoice_helper',
+    'LetterHelper': 'letter_helper',
+    'BankHelper': 'bank_helper',
+    'VoucherHelper': 'voucher_helper',
+    'OrderHelper': 'order_helper',
+    'CreditNoteHelper': 'creditnote_helper',
+    'PartHelper': 'part_helper',
+    'DocumentHelper': 'document_helper',
+    'SevUserHelper': 'sevuser_helper',
+}
 
 __all__ = [
     'ContactHelper', 'InvoiceHelper', 'LetterHelper', 'BankHelper',
-    'VoucherHelper', 'OrderHelper', 'CreditNoteHelper', 'PartHelper'
+    'VoucherHelper', 'OrderHelper', 'CreditNoteHelper', 'PartHelper',
+    'DocumentHelper', 'SevUserHelper'
 ]
+
+
+def __getattr__(name):
+    module_name = _HELPER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
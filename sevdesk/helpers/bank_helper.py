@@ -17,23 +17,124 @@ Beispiele:
 
     # Kontostand zu einem Datum
     balance = sevdesk.bankHelper.get_balance(account_id=12345, date='2025-12-01')
+
+    # Konto je Kontoauszugszeile aufloesen (aus dem Speicher, ohne Request)
+    account = sevdesk.bankHelper.get_account_by_iban('DE89 3704 0044 0532 0130 00')
+
+    # Nach Aenderungen an den Konten in sevDesk
+    sevdesk.bankHelper.refresh()
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Iterator
+from sevdesk.base.fields import field, ref_id
+from sevdesk.base.index import Index
 from sevdesk.models.checkaccountresponse import CheckAccountResponse
 from sevdesk.models.checkaccounttransactionresponse import CheckAccountTransactionResponse
 
 
+def _normalize_iban(iban: str) -> str:
+    return iban.replace(' ', '').upper()
+
+
+class AccountIndex(Index):
+    """
+    Alle Bankkonten (CheckAccount) mit Indizes nach ID, IBAN und Name.
+
+    Wird mit einem einzigen getCheckAccounts() aufgebaut; danach ist jede
+    Suche ein Dictionary-Zugriff. Bankkonten aendern sich selten, daher
+    wird ohne ttl nur per refresh()/invalidate() neu geladen.
+
+    Args:
+        client: sevDesk Client
+        ttl: Sekunden bis zum automatischen Neuladen (None = nur manuell)
+    """
+
+    def __init__(self, client, ttl: Optional[float] = None):
+        super().__init__(ttl)
+        self.client = client
+        self._accounts = []
+        self._by_id = {}
+        self._by_iban = {}
+        self._by_name = {}
+        self._default = None
+
+    def _load(self):
+        if self.client.cache is not None:
+            # Sonst beantwortet der ResponseCache (Referenzdaten, 10 Minuten)
+            # auch refresh() mit dem alten Stand
+            self.client.cache.invalidate('CheckAccountController.getCheckAccounts')
+        accounts = self.client.checkaccount.getCheckAccounts() or []
+        by_id, by_iban, by_name = {}, {}, {}
+        default = None
+        first_active = None
+        for account in accounts:
+            account_id = ref_id(account)
+            if account_id:
+                by_id[account_id] = account
+            iban = field(account, 'iban')
+            if iban:
+                by_iban.setdefault(_normalize_iban(iban), account)
+            name = field(account, 'name')
+            if name:
+                by_name.setdefault(name.lower(), account)
+            if str(field(account, 'status')) == '100':
+                if first_active is None:
+                    first_active = account
+                if default is None and str(field(account, 'defaultAccount')) == '1':
+                    default = account
+        self._accounts = list(accounts)
+        self._by_id = by_id
+        self._by_iban = by_iban
+        self._by_name = by_name
+        # Fallback: erstes aktives Konto
+        self._default = default if default is not None else first_active
+
+    def all(self) -> list:
+        self.ensure()
+        return list(self._accounts)
+
+    def by_id(self, account_id: int):
+        self.ensure()
+        return self._by_id.get(int(account_id))
+
+    def by_iban(self, iban: str):
+        self.ensure()
+        return self._by_iban.get(_normalize_iban(iban))
+
+    def by_name(self, name: str):
+        """Exakter Name (Gross-/Kleinschreibung egal), sonst Teilstring"""
+        self.ensure()
+        name_lower = name.lower()
+        account = self._by_name.get(name_lower)
+        if account is not None:
+            return account
+        for account in self._accounts:
+            account_name = field(account, 'name')
+            if account_name and name_lower in account_name.lower():
+                return account
+        return None
+
+    def default(self):
+        self.ensure()
+        return self._default
+
+
 class BankHelper:
     """Helper-Klasse für Bank-Operationen auf hohem Level"""
 
     def __init__(self, client):
         self.client = client
+        # Wird beim ersten Zugriff auf ein Konto geladen, danach nur per refresh()
+        self.accounts = AccountIndex(client)
+
+    def refresh(self):
+        """Laedt die Bankkonten sofort neu (z.B. nach Aenderungen in sevDesk)"""
+        self.accounts.refresh()
 
     def get_accounts(self, active_only: bool = True) -> List[CheckAccountResponse]:
         """
-        Ruft alle Bankkonten ab.
+        Ruft alle Bankkonten ab (aus self.accounts, siehe refresh()).
 
         Args:
             active_only: Nur aktive Konten (Status 100) zurückgeben
@@ -42,18 +143,17 @@ class BankHelper:
             Liste von CheckAccountResponse-Objekten
         """
         try:
-            accounts = self.client.checkaccount.getCheckAccounts()
-            if not accounts:
-                return []
+            accounts = self.accounts.all()
             if active_only:
-                accounts = [a for a in accounts if str(a.status) == '100']
+                accounts = [a for a in accounts if str(field(a, 'status')) == '100']
             return accounts
         except Exception:
             return []
 
     def get_account_by_id(self, account_id: int) -> Optional[CheckAccountResponse]:
         """
-        Ruft ein Bankkonto per ID ab.
+        Ruft ein Bankkonto per ID ab. Konten, die noch nicht in
+        self.accounts stehen (z.B. neu angelegt), werden einzeln abgefragt.
 
         Args:
             account_id: ID des Bankkontos
@@ -61,6 +161,12 @@ class BankHelper:
         Returns:
             CheckAccountResponse oder None
         """
+        try:
+            account = self.accounts.by_id(account_id)
+            if account is not None:
+                return account
+        except Exception:
+            pass
         try:
             result = self.client.checkaccount.getCheckAccountById(account_id)
             if isinstance(result, list) and len(result) > 0:
@@ -74,17 +180,16 @@ class BankHelper:
         Sucht ein Bankkonto nach Name.
 
         Args:
-            name: Name des Bankkontos (exakte oder teilweise Uebereinstimmung)
+            name: Name des Bankkontos (exakte oder teilweise Uebereinstimmung,
+                  exakte Treffer haben Vorrang)
 
         Returns:
             CheckAccountResponse oder None
         """
-        accounts = self.get_accounts(active_only=False)
-        name_lower = name.lower()
-        for account in accounts:
-            if account.name and name_lower in account.name.lower():
-                return account
-        return None
+        try:
+            return self.accounts.by_name(name)
+        except Exception:
+            return None
 
     def get_account_by_iban(self, iban: str) -> Optional[CheckAccountResponse]:
         """
@@ -96,28 +201,22 @@ class BankHelper:
         Returns:
             CheckAccountResponse oder None
         """
-        accounts = self.get_accounts(active_only=False)
-        iban_clean = iban.replace(' ', '').upper()
-        for account in accounts:
-            if account.iban and account.iban.replace(' ', '').upper() == iban_clean:
-                return account
-        return None
+        try:
+            return self.accounts.by_iban(iban)
+        except Exception:
+            return None
 
     def get_default_account(self) -> Optional[CheckAccountResponse]:
         """
         Ruft das Standard-Bankkonto ab.
 
         Returns:
-            CheckAccountResponse oder None
+            CheckAccountResponse oder None (Fallback: erstes aktives Konto)
         """
-        accounts = self.get_accounts(active_only=True)
-        for account in accounts:
-            if str(account.defaultAccount) == '1':
-                return account
-        # Fallback: erstes aktives Konto
-        if accounts:
-            return accounts[0]
-        return None
+        try:
+            return self.accounts.default()
+        except Exception:
+            return None
 
     def get_transactions(
         self,
@@ -162,6 +261,44 @@ class BankHelper:
         except Exception:
             return []
 
+    def iter_transactions(
+        self,
+        account_id: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        only_credit: Optional[bool] = None,
+        only_debit: Optional[bool] = None,
+        is_booked: Optional[bool] = None,
+        payee_payer_name: Optional[str] = None,
+        purpose: Optional[str] = None,
+        page_size: int = 500,
+        concurrency: int = 1
+    ) -> Iterator[CheckAccountTransactionResponse]:
+        """
+        Iteriert seitenweise ueber Transaktionen (limit/offset).
+
+        Parameter wie get_transactions(), zusaetzlich:
+            page_size: Anzahl Transaktionen pro Request
+            concurrency: Anzahl parallel vorgeladener Seiten
+
+        Returns:
+            Generator von CheckAccountTransactionResponse-Objekten
+        """
+        return self.client.checkaccounttransaction.paginate(
+            'getTransactions',
+            checkAccount_id=account_id,
+            checkAccount_objectName="CheckAccount" if account_id else None,
+            startDate=start_date,
+            endDate=end_date,
+            onlyCredit=only_credit,
+            onlyDebit=only_debit,
+            isBooked=is_booked,
+            payeePayerName=payee_payer_name,
+            paymtPurpose=purpose,
+            page_size=page_size,
+            concurrency=concurrency
+        )
+
     def get_transaction_by_id(self, transaction_id: int) -> Optional[CheckAccountTransactionResponse]:
         """
         Ruft eine Transaktion per ID ab.
@@ -3,71 +3,278 @@ ContactHelper - High-Level Kontakt-Verwaltung
 
 Beispiele:
     contact = sevdesk.contactHelper.find_by_mail('max@example.com')
+    contacts = sevdesk.contactHelper.find_by_mails(['max@example.com', 'eva@example.com'])
     contact = sevdesk.contactHelper.find_by_customfield('revitoid', '1234567890')
     contact = sevdesk.contactHelper.create(name='Test Firma', email='test@example.com')
 """
 
+from typing import Dict, Iterable, List, Optional
+
+from sevdesk.base.fields import ref_id
+from sevdesk.base.index import Index
+
+# Ab so vielen noch nicht abgerufenen Kontakten laedt find_by_mails() alle
+# Kontakte seitenweise statt jeden einzeln per ID abzurufen
+BULK_LOOKUP_THRESHOLD = 20
+
+
+def _normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+class EmailIndex(Index):
+    """
+    E-Mail-Adresse (klein geschrieben) -> Kontakt-IDs.
+
+    Wird mit einem Bulk-Abruf aller E-Mail-Kommunikationswege aufgebaut;
+    update_contact() aktualisiert einzelne Kontakte (in der Regel ein Request).
+
+    Haelt ausserdem die bereits abgerufenen Kontakte (contact()/remember()),
+    damit eine wiederholte Suche keinen Request kostet. Sie werden mit dem
+    Index verworfen (refresh(), invalidate(), TTL) bzw. mit update_contact()
+    fuer den einzelnen Kontakt.
+
+    Args:
+        client: sevDesk Client
+        ttl: Sekunden bis zum automatischen Neuladen (None = nur manuell)
+        page_size: Kommunikationswege pro Request beim Laden
+    """
+
+    def __init__(self, client, ttl: Optional[float] = None, page_size: int = 1000):
+        super().__init__(ttl)
+        self.client = client
+        self.page_size = page_size
+        self._contacts = {}
+        self._emails_by_contact = {}
+        # Kontakt-ID -> abgerufener Kontakt
+        self._resolved = {}
+
+    def _load(self):
+        contacts = {}
+        emails_by_contact = {}
+        ways = self.client.communicationway.paginate(
+            'getCommunicationWays', type_='EMAIL', page_size=self.page_size, response_mode='raw'
+        )
+        for way in ways:
+            contact_id = ref_id(way.get('contact'))
+            # type wird zusaetzlich lokal geprueft
+            if way.get('type') == 'EMAIL' and way.get('value') and contact_id:
+                self._add(contacts, emails_by_contact, way['value'], contact_id)
+        # Erst nach dem vollstaendigen Laden austauschen, Leser sehen nie einen halben Index
+        self._contacts = contacts
+        self._emails_by_contact = emails_by_contact
+        self._resolved = {}
+
+    @staticmethod
+    def _add(contacts, emails_by_contact, email, contact_id):
+        email = _normalize_email(email)
+        ids = contacts.setdefault(email, [])
+        if contact_id not in ids:
+            ids.append(contact_id)
+        emails_by_contact.setdefault(contact_id, set()).add(email)
+
+    def contact_ids(self, email: str) -> List[int]:
+        """IDs aller Kontakte mit dieser E-Mail-Adresse"""
+        self.ensure()
+        return list(self._contacts.get(_normalize_email(email), ()))
+
+    def contact(self, contact_id: int):
+        """Bereits abgerufener Kontakt oder None"""
+        return self._resolved.get(int(contact_id))
+
+    def remember(self, contact_id: int, contact):
+        """Speichert einen abgerufenen Kontakt (nur solange der Index geladen ist)"""
+        with self._lock:
+            if self._loaded_at is not None and contact is not None:
+                self._resolved[int(contact_id)] = contact
+
+    def has_contact(self, contact_id: int) -> bool:
+        """True, wenn der Kontakt mindestens eine E-Mail-Adresse im Index hat"""
+        return int(contact_id) in self._emails_by_contact
+
+    def add(self, email: str, contact_id: int):
+        """Traegt eine neu angelegte E-Mail-Adresse ein (ohne Request)"""
+        with self._lock:
+            if self._loaded_at is not None:
+                self._add(self._contacts, self._emails_by_contact, email, int(contact_id))
+
+    def update_contact(self, contact_id: int):
+        """Laedt die E-Mail-Adressen eines Kontakts neu"""
+        contact_id = int(contact_id)
+        ways = list(self.client.communicationway.paginate(
+            'getCommunicationWays', contact_id=str(contact_id), contact_objectName="Contact",
+            type_='EMAIL', page_size=self.page_size, response_mode='raw'
+        ))
+        with self._lock:
+            if self._loaded_at is None:
+                # Wird beim ersten Zugriff ohnehin komplett geladen
+                return
+            self._resolved.pop(contact_id, None)
+            for email in self._emails_by_contact.pop(contact_id, ()):
+                ids = self._contacts.get(email)
+                if ids and contact_id in ids:
+                    ids.remove(contact_id)
+                    if not ids:
+                        del self._contacts[email]
+            for way in ways:
+                if (way.get('type') == 'EMAIL' and way.get('value')
+                        and ref_id(way.get('contact')) == contact_id):
+                    self._add(self._contacts, self._emails_by_contact, way['value'], contact_id)
+
+    def __len__(self):
+        return len(self._contacts)
+
+
+class AddressIndex(Index):
+    """
+    Kontakt-ID -> Adressen (ContactAddressResponse bzw. Dict im raw-Modus).
+
+    Wird mit einem seitenweisen Abruf aller Adressen aufgebaut und nach
+    ttl Sekunden beim naechsten Zugriff neu geladen.
+
+    Args:
+        client: sevDesk Client
+        ttl: Sekunden bis zum automatischen Neuladen (None = nur manuell)
+        page_size: Adressen pro Request beim Laden
+    """
+
+    def __init__(self, client, ttl: Optional[float] = 300.0, page_size: int = 1000):
+        super().__init__(ttl)
+        self.client = client
+        self.page_size = page_size
+        self._addresses = {}
+
+    def _load(self):
+        # getContactAddresses kennt keinen Filter nach Kontakt, daher einmal alle laden
+        addresses = {}
+        for address in self.client.contactaddress.paginate('getContactAddresses', page_size=self.page_size):
+            self._add(addresses, address)
+        self._addresses = addresses
+
+    @staticmethod
+    def _add(addresses, address):
+        contact = address.get('contact') if isinstance(address, dict) else getattr(address, 'contact', None)
+        contact_id = ref_id(contact)
+        if contact_id:
+            addresses.setdefault(contact_id, []).append(address)
+
+    def get(self, contact_id: int) -> list:
+        """Adressen eines Kontakts"""
+        self.ensure()
+        return list(self._addresses.get(int(contact_id), ()))
+
+    def add(self, address):
+        """Traegt eine neu angelegte Adresse ein (ohne Request)"""
+        with self._lock:
+            if self._loaded_at is not None:
+                self._add(self._addresses, address)
+
 
 class ContactHelper:
     """Helper-Klasse für Kontakt-Operationen auf hohem Level"""
     
     def __init__(self, client):
         self.client = client
+        # Wird beim ersten find_by_mail()/find_by_mails() geladen
+        self.email_index = EmailIndex(client)
+        # Wird beim ersten get_addresses()/has_address() geladen, TTL 5 Minuten
+        self.address_index = AddressIndex(client)
     
     def find_by_mail(self, email: str):
         """
         Sucht einen Kontakt nach E-Mail-Adresse.
+
+        Verwendet self.email_index: beim ersten Aufruf werden alle
+        E-Mail-Adressen mit einem Bulk-Abruf geladen, danach kostet die
+        erste Suche nach einem Kontakt dessen Abruf, jede weitere keinen
+        Request. Aenderungen in sevDesk sind erst nach
+        email_index.refresh() bzw. email_index.update_contact() sichtbar.
         
         Args:
-            email: E-Mail-Adresse des Kontakts
+            email: E-Mail-Adresse des Kontakts (Gross-/Kleinschreibung egal)
             
         Returns:
             ContactResponse oder None wenn nicht gefunden
         """
-        contacts = self.client.contact.getContacts()
-        
-        for contact_obj in contacts:
-            contact_id = getattr(contact_obj, 'id_', getattr(contact_obj, 'id', None))
-            
-            if not contact_id:
-                continue
-            
-            # Kommunikationswege abrufen
-            try:
-                comm_response = self.client.communicationway.getCommunicationWays(
-                    contact_id=str(contact_id),
-                    contact_objectName="Contact"
-                )
-                
-                # Kommunikationswege durchsuchen
-                if isinstance(comm_response, list):
-                    comm_list = comm_response
-                else:
-                    comm_list = []
-                
-                # Set für Duplikat-Vermeidung
-                found_emails = set()
-                
-                for comm_way in comm_list:
-                    if isinstance(comm_way, dict):
-                        comm_type = comm_way.get('type')
-                        comm_value = comm_way.get('value')
-                    else:
-                        comm_type = getattr(comm_way, 'type_', None)
-                        comm_value = getattr(comm_way, 'value', None)
-                    
-                    if comm_type == "EMAIL" and comm_value:
-                        comm_value_lower = comm_value.lower()
-                        if comm_value_lower not in found_emails:
-                            found_emails.add(comm_value_lower)
-                            
-                            if comm_value_lower == email.lower():
-                                return contact_obj
-            except Exception:
+        contact_ids = self.email_index.contact_ids(email)
+        if not contact_ids:
+            return None
+        return self._resolve(contact_ids[0])
+
+    def _resolve(self, contact_id: int):
+        """Kontakt aus self.email_index oder per getContactById (und dort gespeichert)"""
+        contact = self.email_index.contact(contact_id)
+        if contact is None:
+            contact = self.get_by_id(contact_id)
+            self.email_index.remember(contact_id, contact)
+        return contact
+
+    def find_by_mails(self, emails: Iterable[str]) -> Dict[str, object]:
+        """
+        Sucht mehrere Kontakte nach E-Mail-Adresse (z.B. fuer Importe).
+
+        Bereits abgerufene Kontakte kommen aus self.email_index, die
+        uebrigen werden einzeln per ID abgerufen, ab BULK_LOOKUP_THRESHOLD
+        fehlenden stattdessen seitenweise alle Kontakte (dabei werden alle
+        geladenen Kontakte mit E-Mail-Adresse gespeichert).
+
+        Args:
+            emails: E-Mail-Adressen
+
+        Returns:
+            Dict E-Mail (wie uebergeben) -> ContactResponse oder None
+        """
+        matches = {}
+        for email in emails:
+            contact_ids = self.email_index.contact_ids(email)
+            matches[email] = contact_ids[0] if contact_ids else None
+
+        contacts = {}
+        missing = set()
+        for contact_id in matches.values():
+            if contact_id is None or contact_id in contacts:
                 continue
-        
-        return None
+            contact = self.email_index.contact(contact_id)
+            if contact is None:
+                missing.add(contact_id)
+            else:
+                contacts[contact_id] = contact
+
+        if len(missing) < BULK_LOOKUP_THRESHOLD:
+            for contact_id in missing:
+                contacts[contact_id] = self._resolve(contact_id)
+        else:
+            # depth='1': Organisationen und Personen
+            for contact in self.client.contact.paginate('getContacts', depth='1', page_size=1000):
+                contact_id = ref_id(contact)
+                if contact_id is not None and self.email_index.has_contact(contact_id):
+                    self.email_index.remember(contact_id, contact)
+                if contact_id in missing:
+                    contacts[contact_id] = contact
+                    missing.discard(contact_id)
+                    if not missing:
+                        break
+        return {email: contacts.get(contact_id) for email, contact_id in matches.items()}
     
+    def iter(self, customerNumber: str = None, depth: str = None, page_size: int = 100):
+        """
+        Iteriert seitenweise ueber alle Kontakte (limit/offset).
+
+        Args:
+            customerNumber: Optional: Filter nach Kundennummer
+            depth: Optional: '1' fuer Organisationen und Personen
+            page_size: Anzahl Kontakte pro Request
+
+        Returns:
+            Generator von ContactResponse-Objekten
+        """
+        return self.client.contact.paginate(
+            'getContacts',
+            customerNumber=customerNumber,
+            depth=depth,
+            page_size=page_size
+        )
+
     def find_by_customfield(self, field: str, value: str):
         """
         Sucht einen Kontakt nach Custom Field.
@@ -140,6 +347,7 @@ class ContactHelper:
                     main=True
                 )
                 self.client.communicationway.createCommunicationWay(body=comm_way)
+                self.email_index.add(email, new_contact_id)
             except Exception:
                 pass  # Email-Fehler sollten nicht den Kontakt ungültig machen
         
@@ -203,6 +411,8 @@ class ContactHelper:
             )
 
             result = self.client.contactaddress.createContactAddress(body=address)
+            if result is not None:
+                self.address_index.add(result)
             return result
         except Exception as e:
             print(f"ContactHelper.add_address error: {e}")
@@ -212,6 +422,9 @@ class ContactHelper:
         """
         Ruft alle Adressen eines Kontakts ab.
 
+        Verwendet self.address_index (ein Bulk-Abruf aller Adressen, danach
+        5 Minuten gueltig); address_index.refresh() laedt sofort neu.
+
         Args:
             contact_id: ID des Kontakts
 
@@ -219,23 +432,23 @@ class ContactHelper:
             Liste von ContactAddressResponse
         """
         try:
-            # Alle Adressen abrufen und nach Kontakt filtern
-            addresses = self.client.contactaddress.getContactAddresses()
-            if not addresses:
-                return []
-
-            contact_addresses = []
-            for addr in addresses:
-                if hasattr(addr, 'contact') and addr.contact:
-                    addr_contact_id = getattr(addr.contact, 'id_', getattr(addr.contact, 'id', None))
-                    if addr_contact_id and int(addr_contact_id) == contact_id:
-                        contact_addresses.append(addr)
-
-            return contact_addresses
+            return self.address_index.get(contact_id)
         except Exception as e:
             print(f"ContactHelper.get_addresses error: {e}")
             return []
 
+    def get_addresses_for(self, contact_ids: Iterable[int]) -> Dict[int, list]:
+        """
+        Ruft die Adressen mehrerer Kontakte ab (ein Bulk-Abruf fuer alle).
+
+        Args:
+            contact_ids: IDs der Kontakte
+
+        Returns:
+            Dict Kontakt-ID -> Liste von ContactAddressResponse (leer wenn keine)
+        """
+        return {int(contact_id): self.address_index.get(contact_id) for contact_id in contact_ids}
+
     def has_address(self, contact_id: int) -> bool:
         """
         Prueft ob ein Kontakt mindestens eine Adresse hat.
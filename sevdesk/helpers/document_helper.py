@@ -0,0 +1,253 @@
+"""
+DocumentHelper - Massen-Download von PDFs (Rechnungen, Gutschriften, Auftraege, Briefe)
+
+Fuer Archivierung und Exporte: laedt die PDFs vieler Dokumente parallel
+in ein Verzeichnis. Bereits vorhandene Dokumente (gleiche ID und gleicher
+'update'-Zeitstempel) werden uebersprungen. Jeder abgeschlossene Download
+wird sofort im Manifest (manifest.jsonl) vermerkt, ein abgebrochener Lauf
+kann also einfach erneut gestartet werden.
+
+Beispiele:
+    # Alle bezahlten Rechnungen archivieren (Listen-Objekte enthalten 'update',
+    # es ist kein zusaetzlicher Request pro Dokument noetig)
+    invoices = sevdesk.invoice.paginate('getInvoices', status=1000, response_mode='raw')
+    result = sevdesk.documentHelper.download_pdfs('invoice', invoices, 'archiv/rechnungen')
+    print(result)   # DownloadResult(downloaded=..., skipped=..., failed=...)
+
+    # Nur IDs: 'update' wird pro Dokument abgefragt
+    sevdesk.documentHelper.download_pdfs('creditnote', [101, 102, 103], 'archiv/gutschriften')
+"""
+
+import base64
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sevdesk.base.fields import field
+
+# Dokumenttyp -> (Controller, PDF-Methode, Methode fuer Einzelabruf, Name des ID-Parameters)
+DOCUMENT_TYPES = {
+    'invoice': ('invoice', 'invoiceGetPdf', 'getInvoiceById', 'invoiceId'),
+    'creditnote': ('creditnote', 'creditNoteGetPdf', 'getcreditNoteById', 'creditNoteId'),
+    'order': ('order', 'orderGetPdf', 'getOrderById', 'orderId'),
+    'letter': ('undocumented.letter', 'letterGetPdf', 'getLetterById', 'letterId'),
+}
+
+MANIFEST_NAME = 'manifest.jsonl'
+
+
+class DownloadResult:
+    """Ergebnis eines Massen-Downloads"""
+
+    def __init__(self):
+        self.downloaded = []
+        self.skipped = []
+        # ID -> Exception
+        self.failed = {}
+        self.bytes = 0
+
+    def __repr__(self):
+        return (f"DownloadResult(downloaded={len(self.downloaded)}, skipped={len(self.skipped)}, "
+                f"failed={len(self.failed)}, bytes={self.bytes})")
+
+
+class Manifest:
+    """
+    Manifest der heruntergeladenen Dokumente (JSON Lines, nur Anhaengen).
+
+    Pro abgeschlossenem Download eine Zeile; beim Laden gilt der letzte
+    Eintrag eines Dokuments. Ein Abbruch mitten im Lauf verliert also
+    hoechstens die gerade laufenden Downloads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Unvollstaendige letzte Zeile nach einem Abbruch
+                        continue
+                    self.entries[(entry['type'], str(entry['id']))] = entry
+
+    def get(self, document_type: str, document_id) -> Optional[dict]:
+        return self.entries.get((document_type, str(document_id)))
+
+    def add(self, entry: dict):
+        with self._lock:
+            self.entries[(entry['type'], str(entry['id']))] = entry
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+
+
+def _normalize_update(value) -> Optional[str]:
+    """
+    'update'-Zeitstempel als ISO 8601 (datetime.isoformat()), damit Dicts
+    ('2024-01-01T10:00:00+01:00'), Models (datetime) und aeltere
+    Manifest-Eintraege ('2024-01-01 10:00:00+01:00') gleich verglichen werden
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    text = str(value).strip()
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(text).isoformat()
+    except ValueError:
+        return text
+
+
+def _document_id(document):
+    """ID eines Dokuments (Model, Dict oder bereits die ID)"""
+    if isinstance(document, (int, str)):
+        return document or None
+    return field(document, 'id')
+
+
+class DocumentHelper:
+    """Helper-Klasse fuer Massen-Downloads von Dokument-PDFs"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def download_pdfs(self, document_type: str, documents: Iterable, target_dir: str,
+                      concurrency: int = 4, prevent_send_by: bool = True,
+                      manifest: str = MANIFEST_NAME) -> DownloadResult:
+        """
+        Laedt die PDFs mehrerer Dokumente parallel in ein Verzeichnis.
+
+        Args:
+            document_type: 'invoice', 'creditnote', 'order' oder 'letter'
+            documents: IDs oder Objekte mit 'id' und 'update' (Models oder
+                       Dicts, z.B. aus paginate(..., response_mode='raw')).
+                       Wird erst bei Bedarf durchlaufen, Generatoren sind moeglich.
+            target_dir: Zielverzeichnis (wird angelegt)
+            concurrency: Anzahl gleichzeitiger Downloads
+            prevent_send_by: Dokumente beim Abruf nicht als versendet markieren
+            manifest: Dateiname des Manifests im Zielverzeichnis
+
+        Returns:
+            DownloadResult; Fehler einzelner Dokumente stehen in result.failed
+
+        Raises:
+            ValueError: bei einem Dokument ohne ID (bereits gestartete
+                        Downloads werden noch abgeschlossen)
+        """
+        if document_type not in DOCUMENT_TYPES:
+            raise ValueError(f"Unbekannter Dokumenttyp '{document_type}', erlaubt: {list(DOCUMENT_TYPES)}")
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        os.makedirs(target_dir, exist_ok=True)
+        state = Manifest(os.path.join(target_dir, manifest))
+        result = DownloadResult()
+        lock = threading.Lock()
+
+        def run(document):
+            document_id = _document_id(document)
+            try:
+                outcome = self._download_one(
+                    document_type, document, target_dir, state, prevent_send_by
+                )
+            except Exception as e:
+                with lock:
+                    result.failed[document_id] = e
+                return
+            with lock:
+                if outcome is None:
+                    result.skipped.append(document_id)
+                else:
+                    result.downloaded.append(document_id)
+                    result.bytes += outcome
+
+        # Hoechstens 2 * concurrency Dokumente gleichzeitig in Arbeit,
+        # auch wenn documents ein sehr langer Generator ist
+        window = max(concurrency, 1) * 2
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+            pending = set()
+            for document in documents:
+                if _document_id(document) is None:
+                    raise ValueError(f"Dokument ohne ID: {document!r}")
+                if len(pending) >= window:
+                    _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending.add(pool.submit(run, document))
+            wait(pending)
+        return result
+
+    def _download_one(self, document_type, document, target_dir, state, prevent_send_by):
+        """Laedt ein Dokument, liefert die Anzahl Bytes oder None (uebersprungen)"""
+        controller_name, pdf_method, get_method, id_param = DOCUMENT_TYPES[document_type]
+        controller = self.client
+        for name in controller_name.split('.'):
+            controller = getattr(controller, name)
+
+        document_id = _document_id(document)
+        if isinstance(document, (int, str)):
+            update = self._fetch_update(controller, get_method, id_param, document_id)
+        else:
+            update = field(document, 'update')
+        update = _normalize_update(update)
+
+        filename = f'{document_type}_{document_id}.pdf'
+        path = os.path.join(target_dir, filename)
+        entry = state.get(document_type, document_id)
+        if (entry is not None and _normalize_update(entry.get('update')) == update
+                and os.path.exists(path) and os.path.getsize(path) == entry.get('bytes')):
+            return None
+
+        partial = path + '.part'
+        try:
+            with open(partial, 'wb') as f:
+                getattr(controller, pdf_method)(
+                    document_id, download=True, preventSendBy=prevent_send_by or None, stream_to=f
+                )
+            self._unwrap_json(partial)
+            size = os.path.getsize(partial)
+            os.replace(partial, path)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+
+        state.add({'type': document_type, 'id': str(document_id), 'update': update,
+                   'file': filename, 'bytes': size})
+        return size
+
+    @staticmethod
+    def _fetch_update(controller, get_method, id_param, document_id):
+        """'update'-Zeitstempel eines Dokuments, wenn nur die ID bekannt ist"""
+        result = getattr(controller, get_method)(**{id_param: document_id}, response_mode='raw')
+        if isinstance(result, list):
+            result = result[0] if result else None
+        if not result:
+            raise LookupError(f"Dokument {document_id} nicht gefunden")
+        return field(result, 'update')
+
+    def _unwrap_json(self, path):
+        """
+        Die API liefert PDFs je nach Endpoint auch als JSON mit Base64-Inhalt
+        ({"objects": {"content": ..., "base64encoded": true}}); dann wird
+        die Datei durch den dekodierten Inhalt ersetzt.
+        """
+        with open(path, 'rb') as f:
+            if f.read(1) != b'{':
+                return
+            f.seek(0)
+            data = self.client.codec.loads(f.read())
+        objects = data.get('objects', data) if isinstance(data, dict) else None
+        if not isinstance(objects, dict) or 'content' not in objects:
+            raise ValueError("Unerwartete Antwort, weder PDF noch JSON mit 'content'")
+        content = objects['content']
+        if objects.get('base64encoded', True):
+            content = base64.b64decode(content)
+        elif isinstance(content, str):
+            content = content.encode('latin-1')
+        with open(path, 'wb') as f:
+            f.write(content)
@@ -14,6 +14,7 @@ Beispiele:
 """
 
 from datetime import datetime
+from itertools import islice
 from typing import Optional
 from sevdesk.helpermodels.invoice_ext import InvoiceExt
 from sevdesk.converters.contact import Contact
@@ -27,25 +28,10 @@ class InvoiceHelper:
 
     def __init__(self, client):
         self.client = client
-        self._cached_sev_user_id = None
 
     def _get_default_contact_person_id(self) -> int:
-        """Holt den ersten verfuegbaren SevUser als ContactPerson-ID"""
-        if self._cached_sev_user_id:
-            return self._cached_sev_user_id
-        try:
-            users = self.client.undocumented.sevuser.getSevUsers(limit=1)
-            if users and len(users) > 0:
-                user = users[0]
-                user_id = user.get('id') or user.get('id_')
-                if user_id:
-                    self._cached_sev_user_id = int(user_id)
-                    return self._cached_sev_user_id
-        except Exception:
-            pass
-        raise RuntimeError(
-            "Kein SevUser gefunden. Bitte contactPerson_id explizit angeben."
-        )
+        """Erster SevUser als ContactPerson-ID (einmal pro Client geladen)"""
+        return self.client.sevUserHelper.default_user_id()
 
     def new(self,
             contact,
@@ -170,6 +156,28 @@ class InvoiceHelper:
         except Exception:
             return None
     
+    def iter(self, contact_id: Optional[int] = None, status: Optional[str] = None, page_size: int = 100,
+             concurrency: int = 1):
+        """
+        Iteriert seitenweise ueber Rechnungen (limit/offset).
+
+        Args:
+            contact_id: Optional: nur für einen Kontakt
+            status: Optional: filtere nach Status
+            page_size: Anzahl Rechnungen pro Request
+            concurrency: Anzahl parallel vorgeladener Seiten
+
+        Returns:
+            Generator von InvoiceResponse-Objekten
+        """
+        return self.client.invoice.paginate(
+            'getInvoices',
+            contact_id=contact_id,
+            status=float(status) if status else None,
+            page_size=page_size,
+            concurrency=concurrency
+        )
+
     def list(self, contact_id: Optional[int] = None, status: Optional[str] = None, limit: int = 100):
         """
         Listet Rechnungen auf.
@@ -177,17 +185,13 @@ class InvoiceHelper:
         Args:
             contact_id: Optional: nur für einen Kontakt
             status: Optional: filtere nach Status
-            limit: Max. Anzahl (wird durch API begrenzt)
+            limit: Max. Anzahl (wird als limit an die API uebergeben)
 
         Returns:
             Liste von InvoiceResponse-Objekten
         """
         try:
-            invoices = self.client.invoice.getInvoices(
-                contact_id=contact_id,
-                status=float(status) if status else None
-            )
-            return invoices[:limit] if invoices else []
+            return list(islice(self.iter(contact_id, status, page_size=limit), limit))
         except Exception:
             return []
 
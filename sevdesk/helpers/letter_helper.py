@@ -64,19 +64,8 @@ class LetterExt:
             self._contactPerson = None
 
     def _get_default_contact_person(self) -> ContactPerson:
-        """Holt den ersten verfuegbaren SevUser als ContactPerson"""
-        try:
-            users = self._client.undocumented.sevuser.getSevUsers(limit=1)
-            if users and len(users) > 0:
-                user = users[0]
-                user_id = user.get('id') or user.get('id_')
-                if user_id:
-                    return ContactPerson(id_=int(user_id), objectName="SevUser")
-        except Exception:
-            pass
-        raise RuntimeError(
-            "Kein SevUser gefunden. Bitte contactPerson_id explizit angeben."
-        )
+        """Erster SevUser als ContactPerson (einmal pro Client geladen)"""
+        return self._client.sevUserHelper.default_contact_person()
 
     def save(self) -> 'LetterExt':
         """
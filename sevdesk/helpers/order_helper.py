@@ -28,6 +28,8 @@ from datetime import datetime
 from typing import Optional, List
 from sevdesk.models.orderresponse import OrderResponse
 from sevdesk.models.order import Order
+from sevdesk.models.orderpos import OrderPos
+from sevdesk.base.exceptions import PositionError
 # Note: SaveOrder model bypassed due to incorrect type (order: str instead of Order)
 from sevdesk.converters.contact import Contact
 from sevdesk.converters.contactperson import ContactPerson
@@ -101,17 +103,8 @@ class OrderExt:
             self._contactPerson = None
 
     def _get_default_contact_person(self) -> ContactPerson:
-        """Holt den ersten verfuegbaren SevUser"""
-        try:
-            users = self._client.undocumented.sevuser.getSevUsers(limit=1)
-            if users and len(users) > 0:
-                user = users[0]
-                user_id = user.get('id') or user.get('id_')
-                if user_id:
-                    return ContactPerson(id_=int(user_id), objectName="SevUser")
-        except Exception:
-            pass
-        raise RuntimeError("Kein SevUser gefunden. Bitte contactPerson_id angeben.")
+        """Erster SevUser als ContactPerson (einmal pro Client geladen)"""
+        return self._client.sevUserHelper.default_contact_person()
 
     def addPosition(self, name: str, quantity: float, price: float = None,
                     priceGross: float = None, taxRate: float = 19.0,
@@ -145,10 +138,14 @@ class OrderExt:
 
     def save(self) -> 'OrderExt':
         """
-        Speichert das Angebot/den Auftrag.
+        Speichert das Angebot/den Auftrag samt Positionen in einem Request
+        (Factory/saveOrder).
 
         Returns:
             self mit gesetzter ID
+
+        Raises:
+            PositionError: ungueltige Positionen (es wurde nichts gespeichert)
         """
         if not self._client:
             raise RuntimeError("Client nicht gesetzt")
@@ -183,7 +180,8 @@ class OrderExt:
         order_pos_save = None
         if self._pending_positions:
             order_pos_save = []
-            for pos in self._pending_positions:
+            failures = []
+            for index, pos in enumerate(self._pending_positions):
                 pos_dict = {
                     "objectName": "OrderPos",
                     "mapAll": "true",
@@ -199,7 +197,15 @@ class OrderExt:
                     pos_dict["price"] = pos['price']
                 if pos.get('text'):
                     pos_dict["text"] = pos['text']
+                # Vorab pruefen, damit alle ungueltigen Positionen auf einmal gemeldet werden
+                try:
+                    OrderPos(**pos_dict)
+                except Exception as e:
+                    failures.append((index, pos.get('name'), e))
+                    continue
                 order_pos_save.append(pos_dict)
+            if failures:
+                raise PositionError(failures)
 
         # Direkt an Factory/saveOrder senden (bypass broken SaveOrder Pydantic model)
         order_dict = order.model_dump(by_alias=True, exclude_none=True)
@@ -207,13 +213,8 @@ class OrderExt:
         if order_pos_save:
             request_body["orderPosSave"] = order_pos_save
 
-        response = self._client.session.request(
-            method='POST',
-            url=f'{self._client.api_base}/Order/Factory/saveOrder',
-            json=request_body,
-            headers={'Authorization': self._client.api_token}
-        )
-        result = response.json()
+        # Ueber client.request, damit Transport-Einstellungen (Timeouts) gelten
+        result = self._client.request('POST', '/Order/Factory/saveOrder', {'body': request_body})
 
         # ID extrahieren
         if isinstance(result, dict):
@@ -264,21 +265,10 @@ class OrderHelper:
 
     def __init__(self, client):
         self.client = client
-        self._cached_sev_user_id = None
 
     def _get_default_contact_person_id(self) -> int:
-        if self._cached_sev_user_id:
-            return self._cached_sev_user_id
-        try:
-            users = self.client.undocumented.sevuser.getSevUsers(limit=1)
-            if users and len(users) > 0:
-                user_id = users[0].get('id') or users[0].get('id_')
-                if user_id:
-                    self._cached_sev_user_id = int(user_id)
-                    return self._cached_sev_user_id
-        except Exception:
-            pass
-        raise RuntimeError("Kein SevUser gefunden")
+        """Erster SevUser als ContactPerson-ID (einmal pro Client geladen)"""
+        return self.client.sevUserHelper.default_user_id()
 
     def new(self, contact, orderNumber: str, orderType: str = 'AN',
             orderDate: str = None, status: str = '100', header: str = None,
@@ -0,0 +1,83 @@
+"""
+SevUserHelper - Zwischengespeicherte SevUser des Accounts
+
+Rechnungen, Auftraege und Briefe brauchen einen Ansprechpartner
+(contactPerson = SevUser). Ohne explizite Angabe verwenden die Helper den
+ersten SevUser des Accounts. Die SevUser werden dafuer einmal pro Client
+geladen und von allen Helpern gemeinsam verwendet, statt bei jedem
+erstellten Dokument erneut abgefragt zu werden.
+
+Beispiele:
+    user_id = sevdesk.sevUserHelper.default_user_id()
+    users = sevdesk.sevUserHelper.list()
+
+    # Nach Aenderungen an den Benutzern in sevDesk
+    sevdesk.sevUserHelper.invalidate()
+"""
+
+from typing import Optional
+
+from sevdesk.base.index import Index
+
+
+class SevUserHelper(Index):
+    """
+    Helper-Klasse fuer SevUser, gilt fuer den ganzen Client.
+
+    Args:
+        client: sevDesk Client
+        ttl: Sekunden bis zum automatischen Neuladen (None = nur per refresh()/invalidate())
+    """
+
+    def __init__(self, client, ttl: Optional[float] = None):
+        super().__init__(ttl)
+        self.client = client
+        self._users = []
+        self._by_id = {}
+
+    def _load(self):
+        if self.client.cache is not None:
+            # Sonst beantwortet der ResponseCache (Referenzdaten, 10 Minuten)
+            # auch refresh()/invalidate() mit dem alten Stand
+            self.client.cache.invalidate('SevUserController.getSevUsers')
+        users = self.client.undocumented.sevuser.getSevUsers(response_mode='raw') or []
+        by_id = {}
+        for user in users:
+            user_id = user.get('id') or user.get('id_')
+            if user_id:
+                by_id[int(user_id)] = user
+        self._users = list(users)
+        self._by_id = by_id
+
+    def list(self) -> list:
+        """Alle SevUser (dekodierte Dicts)"""
+        self.ensure()
+        return list(self._users)
+
+    def get(self, user_id: int) -> Optional[dict]:
+        """SevUser per ID oder None"""
+        self.ensure()
+        return self._by_id.get(int(user_id))
+
+    def default_user_id(self) -> int:
+        """
+        ID des ersten SevUsers (Standard-Ansprechpartner fuer Dokumente).
+
+        Raises:
+            RuntimeError: wenn kein SevUser gefunden wurde
+        """
+        error = None
+        try:
+            self.ensure()
+        except Exception as e:
+            error = e
+        if error is not None or not self._by_id:
+            raise RuntimeError(
+                "Kein SevUser gefunden. Bitte contactPerson_id explizit angeben."
+            ) from error
+        return next(iter(self._by_id))
+
+    def default_contact_person(self):
+        """Erster SevUser als ContactPerson-Converter"""
+        from sevdesk.converters.contactperson import ContactPerson
+        return ContactPerson(id_=self.default_user_id(), objectName="SevUser")
@@ -79,6 +79,41 @@ class VoucherHelper:
         Returns:
             Liste von VoucherResponse-Objekten
         """
+        try:
+            vouchers = self.client.voucher.getVouchers(
+                **self._list_params(supplier_id, status, credit_debit, start_date, end_date, description)
+            )
+            return vouchers if vouchers else []
+        except Exception:
+            return []
+
+    def iter(
+        self,
+        supplier_id: Optional[int] = None,
+        status: Optional[str] = None,
+        credit_debit: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        description: Optional[str] = None,
+        page_size: int = 100
+    ):
+        """
+        Iteriert seitenweise ueber Belege (limit/offset).
+
+        Parameter wie list(), zusaetzlich:
+            page_size: Anzahl Belege pro Request
+
+        Returns:
+            Generator von VoucherResponse-Objekten
+        """
+        return self.client.voucher.paginate(
+            'getVouchers',
+            page_size=page_size,
+            **self._list_params(supplier_id, status, credit_debit, start_date, end_date, description)
+        )
+
+    def _list_params(self, supplier_id, status, credit_debit, start_date, end_date, description) -> dict:
+        """Baut die Filter-Parameter fuer getVouchers auf"""
         # Status-Mapping
         status_map = {
             'draft': 50.0,
@@ -100,19 +135,15 @@ class VoucherHelper:
         start_ts = self._date_to_timestamp(start_date) if start_date else None
         end_ts = self._date_to_timestamp(end_date) if end_date else None
 
-        try:
-            vouchers = self.client.voucher.getVouchers(
-                contact_id=supplier_id,
-                contact_objectName="Contact" if supplier_id else None,
-                status=status_value,
-                creditDebit=credit_debit,
-                startDate=start_ts,
-                endDate=end_ts,
-                descriptionLike=description
-            )
-            return vouchers if vouchers else []
-        except Exception:
-            return []
+        return {
+            'contact_id': supplier_id,
+            'contact_objectName': "Contact" if supplier_id else None,
+            'status': status_value,
+            'creditDebit': credit_debit,
+            'startDate': start_ts,
+            'endDate': end_ts,
+            'descriptionLike': description,
+        }
 
     def find_by_id(self, voucher_id: int) -> Optional[VoucherResponse]:
         """
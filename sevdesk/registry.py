@@ -0,0 +1,44 @@
+"""
+Controller-Registry
+
+Automatisch generiert von generator/__main__.py - nicht manuell bearbeiten.
+
+Ordnet jedem Attributnamen am Client (z.B. client.invoice) Modul und Klasse
+des Controllers zu. Der Client importiert einen Controller erst beim
+ersten Zugriff.
+"""
+
+# Attributname -> (Modul, Klasse)
+CONTROLLERS = {
+    'accountingcontact': ('sevdesk.controllers.accountingcontact_controller', 'AccountingContactController'),
+    'basics': ('sevdesk.controllers.basics_controller', 'BasicsController'),
+    'checkaccount': ('sevdesk.controllers.checkaccount_controller', 'CheckAccountController'),
+    'checkaccounttransaction': ('sevdesk.controllers.checkaccounttransaction_controller', 'CheckAccountTransactionController'),
+    'communicationway': ('sevdesk.controllers.communicationway_controller', 'CommunicationWayController'),
+    'contact': ('sevdesk.controllers.contact_controller', 'ContactController'),
+    'contactaddress': ('sevdesk.controllers.contactaddress_controller', 'ContactAddressController'),
+    'contactfield': ('sevdesk.controllers.contactfield_controller', 'ContactFieldController'),
+    'creditnote': ('sevdesk.controllers.creditnote_controller', 'CreditNoteController'),
+    'creditnotepos': ('sevdesk.controllers.creditnotepos_controller', 'CreditNotePosController'),
+    'export': ('sevdesk.controllers.export_controller', 'ExportController'),
+    'invoice': ('sevdesk.controllers.invoice_controller', 'InvoiceController'),
+    'invoicepos': ('sevdesk.controllers.invoicepos_controller', 'InvoicePosController'),
+    'layout': ('sevdesk.controllers.layout_controller', 'LayoutController'),
+    'order': ('sevdesk.controllers.order_controller', 'OrderController'),
+    'orderpos': ('sevdesk.controllers.orderpos_controller', 'OrderPosController'),
+    'part': ('sevdesk.controllers.part_controller', 'PartController'),
+    'report': ('sevdesk.controllers.report_controller', 'ReportController'),
+    'tag': ('sevdesk.controllers.tag_controller', 'TagController'),
+    'voucher': ('sevdesk.controllers.voucher_controller', 'VoucherController'),
+    'voucherpos': ('sevdesk.controllers.voucherpos_controller', 'VoucherPosController'),
+}
+
+# Attributname unter client.undocumented -> (Modul, Klasse)
+UNDOCUMENTED_CONTROLLERS = {
+    'invoice': ('sevdesk.undocumented.controllers.invoice_controller', 'InvoiceController'),
+    'invoicepos': ('sevdesk.undocumented.controllers.invoicepos_controller', 'InvoicePosController'),
+    'letter': ('sevdesk.undocumented.controllers.letter_controller', 'LetterController'),
+    'order': ('sevdesk.undocumented.controllers.order_controller', 'OrderController'),
+    'orderpos': ('sevdesk.undocumented.controllers.orderpos_controller', 'OrderPosController'),
+    'sevuser': ('sevdesk.undocumented.controllers.sevuser_controller', 'SevUserController'),
+}
\ No newline at end of file
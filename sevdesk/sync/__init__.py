@@ -0,0 +1,23 @@
+"""
+sevdesk.sync - lokale SQLite-Kopie der wichtigsten sevDesk-Objekte
+
+Fuer Auswertungen und Abgleiche, die dieselben Daten wiederholt lesen:
+sync() haelt die Kopie inkrementell aktuell, Abfragen laufen lokal.
+
+Beispiel:
+    from sevdesk.sync import Mirror
+
+    mirror = Mirror(client, 'sevdesk-mirror.db')
+    mirror.sync()                  # erster Lauf: alles, danach nur Aenderungen
+    mirror.sync(full=True)         # z.B. naechtlich: auch Loeschungen uebernehmen
+
+    offen = mirror.find('invoice', status=200, order_by='-invoiceDate')
+    kunde = mirror.get('contact', 4711)
+    umsatz = mirror.query('SELECT contact_id, SUM(sumGross) AS total FROM invoice '
+                          'WHERE status = 1000 GROUP BY contact_id')
+"""
+
+from sevdesk.sync.entities import ENTITIES, Entity
+from sevdesk.sync.mirror import Mirror, SyncStats
+
+__all__ = ['Mirror', 'SyncStats', 'Entity', 'ENTITIES']
@@ -0,0 +1,104 @@
+"""
+Gespiegelte Entitaeten
+
+Pro Entitaet: Controller und Listen-Operation, feste Parameter und die
+Felder, die zusaetzlich zum vollstaendigen JSON als eigene (indizierte)
+Spalten gespeichert werden. Spaltennamen entsprechen den Feldnamen der
+API; Referenzen werden wie bei den Controller-Parametern als
+'<feld>_id' gespeichert (z.B. contact -> contact_id).
+
+Spaltentypen:
+    'text'  unveraendert
+    'int'   Ganzzahl (z.B. status)
+    'num'   Dezimalzahl (Betraege)
+    'date'  'YYYY-MM-DD' (Datum im Zeitstempel der API)
+    'ref'   ID des referenzierten Objekts
+"""
+
+from typing import Optional
+
+_SQL_TYPES = {'text': 'TEXT', 'int': 'INTEGER', 'num': 'REAL', 'date': 'TEXT', 'ref': 'INTEGER'}
+
+
+class Entity:
+    """
+    Args:
+        name: Name der Entitaet und der Tabelle
+        controller: Attribut des Clients, z.B. 'invoice'
+        operation: Listen-Operation, z.B. 'getInvoices'
+        fields: (Feld, Spaltentyp) der zusaetzlich gespeicherten Felder
+        params: Feste Parameter der Listen-Operation
+    """
+
+    def __init__(self, name: str, controller: str, operation: str, fields: tuple,
+                 params: Optional[dict] = None):
+        self.name = name
+        self.controller = controller
+        self.operation = operation
+        self.params = params or {}
+        # Spalte -> (Feld, Spaltentyp)
+        self.columns = {
+            (field + '_id' if kind == 'ref' else field): (field, kind)
+            for field, kind in fields
+        }
+
+    def schema(self) -> str:
+        columns = ''.join(
+            f', "{column}" {_SQL_TYPES[kind]}' for column, (_, kind) in self.columns.items()
+        )
+        return (f'CREATE TABLE IF NOT EXISTS "{self.name}" ('
+                f'id INTEGER PRIMARY KEY, updated REAL{columns}, data TEXT NOT NULL)')
+
+    def indexes(self) -> list:
+        return [
+            f'CREATE INDEX IF NOT EXISTS "{self.name}_{column}" ON "{self.name}" ("{column}")'
+            for column in self.columns
+        ]
+
+    def values(self, item: dict) -> list:
+        """Spaltenwerte eines dekodierten Objekts (Reihenfolge wie columns)"""
+        return [_convert(item.get(field), kind) for field, kind in self.columns.values()]
+
+    def __repr__(self):
+        return f"Entity({self.name!r}, {self.controller}.{self.operation})"
+
+
+def _convert(value, kind):
+    if value is None or value == '':
+        return None
+    try:
+        if kind == 'ref':
+            value = value.get('id') if isinstance(value, dict) else value
+            return int(value) if value is not None else None
+        if kind == 'int':
+            return int(value)
+        if kind == 'num':
+            return float(value)
+        if kind == 'date':
+            return str(value)[:10]
+    except (TypeError, ValueError):
+        return None
+    return str(value)
+
+
+ENTITIES = {
+    'invoice': Entity('invoice', 'invoice', 'getInvoices', (
+        ('contact', 'ref'), ('invoiceNumber', 'text'), ('invoiceDate', 'date'),
+        ('status', 'int'), ('sumNet', 'num'), ('sumGross', 'num'), ('payDate', 'date'),
+    )),
+    'voucher': Entity('voucher', 'voucher', 'getVouchers', (
+        ('supplier', 'ref'), ('voucherDate', 'date'), ('status', 'int'), ('creditDebit', 'text'),
+        ('sumNet', 'num'), ('sumGross', 'num'), ('payDate', 'date'),
+    )),
+    # depth=1: auch Personen, nicht nur Organisationen
+    'contact': Entity('contact', 'contact', 'getContacts', (
+        ('name', 'text'), ('customerNumber', 'text'), ('parent', 'ref'), ('category', 'ref'),
+    ), params={'depth': '1'}),
+    'part': Entity('part', 'part', 'getParts', (
+        ('partNumber', 'text'), ('name', 'text'), ('price', 'num'), ('stock', 'num'), ('status', 'int'),
+    )),
+    'transaction': Entity('transaction', 'checkaccounttransaction', 'getTransactions', (
+        ('checkAccount', 'ref'), ('valueDate', 'date'), ('amount', 'num'), ('status', 'int'),
+        ('payeePayerName', 'text'),
+    )),
+}
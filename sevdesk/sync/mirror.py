@@ -0,0 +1,399 @@
+"""
+Mirror - lokale SQLite-Kopie von Rechnungen, Belegen, Kontakten, Artikeln
+und Transaktionen
+
+sync() laedt beim ersten Lauf alle Objekte, danach nur noch die seit dem
+letzten Lauf geaenderten: die Listen werden nach 'update' absteigend
+abgefragt und das Laden endet, sobald eine Seite aeltere Objekte als der
+gespeicherte Stand enthaelt. Ignoriert die API die Sortierung (die
+Zeitstempel sind nicht absteigend), wird die Liste vollstaendig geladen.
+
+Bevor ein Lauf beim gespeicherten Stand abbricht, prueft ein zusaetzlicher
+Request (aufsteigend sortiert, ein Objekt), ob die Sortierung wirklich
+angewendet wird; sonst wird ebenfalls vollstaendig geladen.
+
+Geloeschte Objekte erkennt nur ein vollstaendiger Lauf (sync(full=True),
+automatisch nach full_every Sekunden, oder der Fallback oben); ein
+inkrementeller Lauf sieht nur Aenderungen.
+
+Abfragen (get, find, count, query) lesen ausschliesslich lokal, ueber eine
+eigene nur lesende Verbindung. Jede Tabelle enthaelt id, updated (Unix-Zeit
+von 'update'), einige Felder als eigene Spalten (siehe sevdesk.sync.entities)
+und das vollstaendige Objekt als JSON in 'data' (in SQL per
+json_extract(data, '$.feld') abfragbar).
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+from urllib.parse import quote
+
+from sevdesk.sync.entities import ENTITIES, Entity
+
+# Parameter, mit denen die Listen nach 'update' absteigend geliefert werden
+ORDER_BY_UPDATE = {'orderBy[0][field]': 'update', 'orderBy[0][arrangement]': 'desc'}
+
+
+def _timestamp(value) -> Optional[float]:
+    """'update' der API (ISO 8601) als Unix-Zeit"""
+    if not value:
+        return None
+    text = str(value).replace(' ', 'T', 1)
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        return None
+
+
+class SyncStats:
+    """Ergebnis des Abgleichs einer Entitaet"""
+
+    __slots__ = ('entity', 'full', 'fetched', 'changed', 'deleted', 'seconds')
+
+    def __init__(self, entity, full=False, fetched=0, changed=0, deleted=0, seconds=0.0):
+        self.entity = entity
+        # Liste vollstaendig geladen (nur dann werden Loeschungen erkannt)
+        self.full = full
+        self.fetched = fetched
+        # Neue oder geaenderte Objekte
+        self.changed = changed
+        self.deleted = deleted
+        self.seconds = seconds
+
+    def __repr__(self):
+        return (f"SyncStats({self.entity!r}, full={self.full}, fetched={self.fetched}, "
+                f"changed={self.changed}, deleted={self.deleted}, seconds={self.seconds:.2f})")
+
+
+class Mirror:
+    """
+    Args:
+        client: sevDesk Client (synchron)
+        path: Pfad der SQLite-Datenbank
+        entities: Gespiegelte Entitaeten (default: alle aus ENTITIES)
+        timeout: Wartezeit in Sekunden, wenn ein anderer Prozess schreibt
+        full_every: Sekunden, nach denen sync() eine Entitaet vollstaendig
+                    abgleicht (inkl. Loeschungen); None = nur mit full=True
+    """
+
+    def __init__(self, client, path: str, entities: Optional[list] = None, timeout: float = 30.0,
+                 full_every: Optional[float] = 24 * 3600.0):
+        if client.is_async:
+            raise TypeError("Mirror benoetigt einen synchronen Client")
+        self.client = client
+        self.path = path
+        self.entities = {name: self._entity(name) for name in (entities or ENTITIES)}
+        self.full_every = full_every
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        # WAL: Abfragen werden von einem laufenden sync() nicht blockiert
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            "entity TEXT PRIMARY KEY, watermark REAL, last_sync REAL, last_full_sync REAL)"
+        )
+        for entity in self.entities.values():
+            self._db.execute(entity.schema())
+            for statement in entity.indexes():
+                self._db.execute(statement)
+        # Abfragen ueber eine eigene Verbindung, die nicht schreiben kann
+        self._read_lock = threading.Lock()
+        self._reader = sqlite3.connect(
+            'file:' + quote(os.path.abspath(path)) + '?mode=ro',
+            uri=True, timeout=timeout, check_same_thread=False
+        )
+
+    @staticmethod
+    def _entity(name) -> Entity:
+        if name not in ENTITIES:
+            raise ValueError(f"Unbekannte Entitaet '{name}', erlaubt: {list(ENTITIES)}")
+        return ENTITIES[name]
+
+    def _table(self, name) -> Entity:
+        if name not in self.entities:
+            raise ValueError(f"Entitaet '{name}' wird nicht gespiegelt, erlaubt: {list(self.entities)}")
+        return self.entities[name]
+
+    # --- Abgleich ---
+
+    def sync(self, entities: Optional[list] = None, full: bool = False,
+             page_size: int = 500, concurrency: int = 1) -> dict:
+        """
+        Gleicht die lokale Kopie mit sevDesk ab.
+
+        Args:
+            entities: Nur diese Entitaeten (default: alle gespiegelten)
+            full: Alle Objekte laden und geloeschte Objekte entfernen
+                  (ohnehin, wenn der letzte vollstaendige Lauf aelter als
+                  full_every ist)
+            page_size: Objekte pro Request
+            concurrency: Parallele Requests beim vollstaendigen Laden
+
+        Returns:
+            Dict Entitaet -> SyncStats
+        """
+        return {
+            name: self._sync_entity(self._table(name), full, page_size, concurrency)
+            for name in (entities or self.entities)
+        }
+
+    def _sync_entity(self, entity: Entity, full, page_size, concurrency) -> SyncStats:
+        start = time.perf_counter()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT watermark, last_full_sync FROM sync_state WHERE entity = ?", (entity.name,)
+            ).fetchone()
+            known = dict(self._db.execute(f'SELECT id, updated FROM "{entity.name}"'))
+        watermark, last_full_sync = row if row else (None, None)
+        stats = SyncStats(entity.name)
+        seen = set()
+        newest = watermark
+        if self.full_every is not None and (
+                last_full_sync is None or time.time() - last_full_sync >= self.full_every):
+            full = True
+
+        if full or watermark is None:
+            pages = self._all_pages(entity, page_size, concurrency)
+            stats.full = True
+        else:
+            pages = self._changed_pages(entity, page_size, watermark, stats)
+
+        for page in pages:
+            stats.fetched += len(page)
+            page_newest = self._store(entity, page, known, seen, stats)
+            if page_newest is not None and (newest is None or page_newest > newest):
+                newest = page_newest
+
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                if stats.full:
+                    deleted = [(object_id,) for object_id in known if object_id not in seen]
+                    self._db.executemany(f'DELETE FROM "{entity.name}" WHERE id = ?', deleted)
+                    stats.deleted = len(deleted)
+                self._db.execute(
+                    "INSERT INTO sync_state (entity, watermark, last_sync, last_full_sync) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT(entity) DO UPDATE SET "
+                    "watermark = excluded.watermark, last_sync = excluded.last_sync, "
+                    "last_full_sync = COALESCE(excluded.last_full_sync, last_full_sync)",
+                    (entity.name, newest, now, now if stats.full else None)
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def _controller(self, entity: Entity):
+        return getattr(self.client, entity.controller)
+
+    def _all_pages(self, entity: Entity, page_size, concurrency):
+        return self._controller(entity).pages(
+            entity.operation, page_size=page_size, concurrency=concurrency,
+            response_mode='raw', **entity.params
+        )
+
+    def _changed_pages(self, entity: Entity, page_size, watermark, stats):
+        """
+        Seiten nach 'update' absteigend, bis eine Seite Objekte enthaelt,
+        die nicht neuer als watermark sind. Objekte mit genau diesem
+        Zeitstempel werden erneut geladen, da in derselben Sekunde
+        geaenderte Objekte sonst fehlen koennten.
+        """
+        controller = self._controller(entity)
+        endpoint = controller._list_endpoint(entity.operation)
+        params = endpoint.prepare(controller, endpoint.bind((), dict(entity.params)))
+        if params is None:
+            return
+        params.update(ORDER_BY_UPDATE)
+
+        offset = 0
+        previous = None
+        ordered = True
+        first = None
+        while True:
+            page, _ = controller._fetch_page(endpoint, params, offset, page_size, 'raw')
+            if not page:
+                break
+            if first is None:
+                first = page[0]
+            yield page
+            oldest = None
+            for item in page:
+                updated = _timestamp(item.get('update'))
+                if updated is None:
+                    continue
+                if previous is not None and updated > previous:
+                    ordered = False
+                previous = oldest = updated
+            if len(page) != page_size:
+                break
+            if ordered and oldest is not None and oldest < watermark:
+                if self._ordering_applied(controller, endpoint, params, first, oldest):
+                    return
+                # Sortierung wird ignoriert: bis zum Ende laden
+                ordered = False
+            offset += page_size
+        # Bis zum Ende geladen: Loeschungen koennen erkannt werden
+        stats.full = True
+
+    @staticmethod
+    def _ordering_applied(controller, endpoint, params, first, oldest) -> bool:
+        """
+        Prueft mit einem Request (aufsteigend, ein Objekt), ob die API nach
+        'update' sortiert: das aelteste Objekt darf weder das erste der
+        absteigenden Liste noch neuer als die bisher gesehenen sein. Ohne
+        diese Pruefung koennte eine zufaellig absteigende Reihenfolge (z.B.
+        nach Erstellung) den Abbruch ausloesen und aeltere, kuerzlich
+        geaenderte Objekte fehlen.
+        """
+        probe_params = dict(params)
+        probe_params['orderBy[0][arrangement]'] = 'asc'
+        probe, _ = controller._fetch_page(endpoint, probe_params, 0, 1, 'raw')
+        if not probe:
+            return False
+        updated = _timestamp(probe[0].get('update'))
+        return (updated is not None and updated <= oldest
+                and str(probe[0].get('id')) != str(first.get('id')))
+
+    def _store(self, entity: Entity, page, known, seen, stats) -> Optional[float]:
+        """Schreibt neue und geaenderte Objekte einer Seite, liefert das neueste 'update'"""
+        dumps = self.client.codec.dumps
+        placeholders = ', '.join('?' * (len(entity.columns) + 3))
+        columns = ''.join(f', "{column}"' for column in entity.columns)
+        rows = []
+        newest = None
+        for item in page:
+            try:
+                object_id = int(item['id'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            updated = _timestamp(item.get('update'))
+            seen.add(object_id)
+            if updated is not None and (newest is None or updated > newest):
+                newest = updated
+            if updated is not None and known.get(object_id) == updated:
+                continue
+            known[object_id] = updated
+            rows.append([object_id, updated] + entity.values(item) + [dumps(item).decode('utf-8')])
+        if rows:
+            with self._lock:
+                self._db.execute("BEGIN")
+                try:
+                    self._db.executemany(
+                        f'INSERT OR REPLACE INTO "{entity.name}" (id, updated{columns}, data) '
+                        f'VALUES ({placeholders})',
+                        rows
+                    )
+                    self._db.execute("COMMIT")
+                except BaseException:
+                    self._db.execute("ROLLBACK")
+                    raise
+            stats.changed += len(rows)
+        return newest
+
+    # --- Abfragen ---
+
+    def _column(self, entity: Entity, column: str) -> str:
+        if column not in entity.columns and column not in ('id', 'updated'):
+            raise ValueError(
+                f"Unbekannte Spalte '{column}' fuer {entity.name}, erlaubt: "
+                f"{['id', 'updated'] + list(entity.columns)}"
+            )
+        return f'"{column}"'
+
+    def get(self, entity: str, object_id: int) -> Optional[dict]:
+        """Objekt per ID (dekodiertes Dict wie bei response_mode='raw') oder None"""
+        table = self._table(entity)
+        with self._read_lock:
+            row = self._reader.execute(
+                f'SELECT data FROM "{table.name}" WHERE id = ?', (int(object_id),)
+            ).fetchone()
+        return self.client.codec.loads(row[0]) if row else None
+
+    def _where(self, table: Entity, where, params, filters):
+        clauses = []
+        values = []
+        for column, value in filters.items():
+            if value is None:
+                clauses.append(f'{self._column(table, column)} IS NULL')
+            else:
+                clauses.append(f'{self._column(table, column)} = ?')
+                values.append(value)
+        if where:
+            clauses.append(f'({where})')
+            values.extend(params)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', values
+
+    def find(self, entity: str, where: Optional[str] = None, params: tuple = (),
+             order_by: Optional[str] = None, limit: Optional[int] = None, **filters) -> list:
+        """
+        Sucht Objekte in der lokalen Kopie.
+
+        Args:
+            entity: z.B. 'invoice'
+            where: Zusaetzliche SQL-Bedingung, z.B. 'invoiceDate >= ?'
+            params: Parameter fuer where
+            order_by: Spalte, mit '-' absteigend, z.B. '-invoiceDate'
+            limit: Maximale Anzahl
+            **filters: Gleichheit auf Spalten, z.B. contact_id=7, status=1000
+
+        Returns:
+            Liste dekodierter Dicts
+        """
+        table = self._table(entity)
+        sql, values = self._where(table, where, params, filters)
+        sql = f'SELECT data FROM "{table.name}"' + sql
+        if order_by:
+            descending = order_by.startswith('-')
+            sql += f' ORDER BY {self._column(table, order_by.lstrip("-"))}' + (' DESC' if descending else '')
+        if limit is not None:
+            sql += ' LIMIT ?'
+            values.append(int(limit))
+        with self._read_lock:
+            rows = self._reader.execute(sql, values).fetchall()
+        loads = self.client.codec.loads
+        return [loads(row[0]) for row in rows]
+
+    def count(self, entity: str, where: Optional[str] = None, params: tuple = (), **filters) -> int:
+        """Anzahl Objekte, Bedingungen wie bei find()"""
+        table = self._table(entity)
+        sql, values = self._where(table, where, params, filters)
+        with self._read_lock:
+            return self._reader.execute(f'SELECT COUNT(*) FROM "{table.name}"' + sql, values).fetchone()[0]
+
+    def query(self, sql: str, params: tuple = ()) -> list:
+        """
+        Beliebige lesende SQL-Abfrage, liefert eine Liste von Dicts.
+        Schreibende Anweisungen schlagen fehl (sqlite3.OperationalError),
+        die Verbindung ist nur lesend geoeffnet.
+
+        Beispiel:
+            mirror.query('SELECT contact_id, SUM(sumGross) AS total FROM invoice '
+                         'WHERE status = ? GROUP BY contact_id', (1000,))
+        """
+        with self._read_lock:
+            cursor = self._reader.execute(sql, params)
+            names = [column[0] for column in cursor.description or ()]
+            rows = cursor.fetchall()
+        return [dict(zip(names, row)) for row in rows]
+
+    def last_sync(self, entity: str) -> Optional[float]:
+        """Zeitpunkt (Unix-Zeit) des letzten Abgleichs oder None"""
+        self._table(entity)
+        with self._read_lock:
+            row = self._reader.execute(
+                "SELECT last_sync FROM sync_state WHERE entity = ?", (entity,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        self._reader.close()
+        self._db.close()